@@ -0,0 +1,57 @@
+"""
+캐시 값 codec별 인코딩/디코딩 시간과 key당 크기 비교
+
+- json: JsonWeatherCodec (이전 저장 방식과 동일한 json + dacite)
+- binary: BinaryWeatherCodec
+
+python -m benchmarks.cache_codec [--repeat 100000]
+"""
+import argparse
+import time
+
+from domain.weather.data.model import Weather, WeatherNotFound
+from infrastructure.redis.codec import JsonWeatherCodec, BinaryWeatherCodec
+
+VALUES = {
+    "weather": Weather(
+        city="Seoul",
+        conditions=[Weather.Condition(condition="Clouds", description="overcast clouds")],
+        stale_at=1700000600.0,
+        expires_at=1700003600.0,
+    ),
+    "weather x3": Weather(
+        city="San Francisco",
+        conditions=[
+            Weather.Condition(condition="Rain", description="light rain"),
+            Weather.Condition(condition="Mist", description="mist"),
+            Weather.Condition(condition="Thunderstorm", description="thunderstorm with light rain"),
+        ],
+        stale_at=1700000600.0,
+        expires_at=1700003600.0,
+    ),
+    "not found": WeatherNotFound(city="Atlantis", expires_at=1700000060.0),
+}
+
+
+def _per_op_us(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1_000_000
+
+
+def main(repeat: int) -> None:
+    print(f"{'value':>10} {'codec':>7} {'bytes':>6} {'encode(us)':>11} {'decode(us)':>11}")
+    for name, value in VALUES.items():
+        for codec_name, codec in [("json", JsonWeatherCodec()), ("binary", BinaryWeatherCodec())]:
+            data = codec.encode(value)
+            encode = _per_op_us(lambda: codec.encode(value), repeat)
+            decode = _per_op_us(lambda: codec.decode(data), repeat)
+            print(f"{name:>10} {codec_name:>7} {len(data):>6} {encode:>11.2f} {decode:>11.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=100_000)
+    args = parser.parse_args()
+    main(args.repeat)
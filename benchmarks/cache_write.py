@@ -0,0 +1,61 @@
+"""
+배치 조회 결과 저장 방식별 Redis 왕복 횟수, 지연시간 비교
+
+- sequential: 도시마다 save_weather_city
+- concurrent: 도시마다 save_weather_city를 동시에 실행 (이전 배치 조회 방식)
+- pipeline: save_weather_cities 한 번
+
+python -m benchmarks.cache_write [--redis-url redis://localhost:6379] [--rtt-ms 0.5]
+"""
+import argparse
+import asyncio
+
+from benchmarks.support import redis_client, count_round_trips, measure
+from domain.weather.data.model import Weather
+from infrastructure.redis.weather_cache_repository import RedisWeatherCacheRepository
+
+BATCH_SIZES = [1, 10, 50, 100, 500]
+
+
+def _weathers(size: int) -> list[Weather]:
+    return [
+        Weather(city=f"City{i}", conditions=[Weather.Condition(condition="Clear", description="clear sky")])
+        for i in range(size)
+    ]
+
+
+async def main(redis_url: str | None, rtt: float, repeat: int) -> None:
+    redis = redis_client(redis_url)
+    repository = RedisWeatherCacheRepository(redis)
+
+    async def sequential(weathers: list[Weather]) -> None:
+        for weather in weathers:
+            await repository.save_weather_city(weather, 600)
+
+    async def concurrent(weathers: list[Weather]) -> None:
+        await asyncio.gather(*[repository.save_weather_city(weather, 600) for weather in weathers])
+
+    async def pipeline(weathers: list[Weather]) -> None:
+        await repository.save_weather_cities(weathers, 600)
+
+    print(f"{'batch':>6} {'mode':>10} {'round trips':>12} {'mean(ms)':>10} {'p99(ms)':>10}")
+    for size in BATCH_SIZES:
+        weathers = _weathers(size)
+        for name, fn in [("sequential", sequential), ("concurrent", concurrent), ("pipeline", pipeline)]:
+            with count_round_trips(rtt) as round_trips:
+                latency = await measure(lambda: fn(weathers), repeat)
+            print(
+                f"{size:>6} {name:>10} {round_trips.count // repeat:>12} "
+                f"{latency.mean_ms:>10.2f} {latency.percentile_ms(99):>10.2f}"
+            )
+
+    await redis.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--redis-url", default=None, help="미지정 시 fakeredis 사용")
+    parser.add_argument("--rtt-ms", type=float, default=0.5, help="왕복마다 추가할 지연 (fakeredis 사용 시)")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.redis_url, args.rtt_ms / 1000 if not args.redis_url else 0, args.repeat))
@@ -0,0 +1,69 @@
+"""
+도시 ID 색인 생성/열기 시간, 조회 시간, 파일 크기
+
+- --city-list가 없으면 city.list.json과 비슷한 크기(약 20만 개)의 임의 도시 목록 사용
+- 조회: 색인에 있는 이름(hit), 없는 이름(miss)
+
+python -m benchmarks.city_index [--city-list city.list.json.gz] [--repeat 100000]
+"""
+import argparse
+import random
+import string
+import tempfile
+import time
+from pathlib import Path
+
+from infrastructure.openweather.city_index import CityIndex, load_city_list
+
+COUNTRIES = ["KR", "US", "GB", "DE", "FR", "JP", "CN", "BR", "IN", "CA"]
+
+
+def _synthetic_cities(count: int) -> list[dict]:
+    rng = random.Random(0)
+    return [
+        {
+            "id": i + 1,
+            "name": "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 14))).title(),
+            "state": "",
+            "country": rng.choice(COUNTRIES),
+        }
+        for i in range(count)
+    ]
+
+
+def _per_op_us(fn, names: list[str], repeat: int) -> float:
+    start = time.perf_counter()
+    for i in range(repeat):
+        fn(names[i % len(names)])
+    return (time.perf_counter() - start) / repeat * 1_000_000
+
+
+def main(city_list: str | None, repeat: int) -> None:
+    cities = load_city_list(city_list) if city_list else _synthetic_cities(200_000)
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "city_index.bin"
+
+        start = time.perf_counter()
+        keys = CityIndex.build(cities, path)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        index = CityIndex(path)
+        open_ms = (time.perf_counter() - start) * 1000
+
+        rng = random.Random(1)
+        hits = [city["name"] for city in rng.sample(cities, min(1000, len(cities)))]
+        misses = [f"{name}zz" for name in hits]
+        print(f"cities: {len(cities)}, keys: {keys}, size: {path.stat().st_size / 1024 / 1024:.1f}MB")
+        print(f"build: {build:.2f}s, open: {open_ms:.3f}ms")
+        print(f"lookup hit: {_per_op_us(index.lookup, hits, repeat):.2f}us")
+        print(f"lookup miss: {_per_op_us(index.lookup, misses, repeat):.2f}us")
+        index.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--city-list", default=None, help="city.list.json 또는 city.list.json.gz")
+    parser.add_argument("--repeat", type=int, default=100_000)
+    args = parser.parse_args()
+    main(args.city_list, args.repeat)
@@ -0,0 +1,90 @@
+"""
+좌표 조회의 격자 크기(WEATHER__COORD_CELL_SIZE)별 cache hit 비율, 위치 오차 비교
+
+- 사용자 좌표: 도시 중심(Zipf 분포로 선택)에서 정규분포로 흩어진 좌표
+- GET /weather/by-coord 로 요청하고 OpenWeather(FakeOpenWeather) 요청 수로 hit 비율 계산
+- 위치 오차: 사용자 좌표와 실제 조회한 격자 중심 좌표 사이의 거리
+
+python -m benchmarks.coord_cells [--requests 3000] [--spread 0.1] [--cell-sizes 0,0.01,0.05,0.1,0.25]
+"""
+import argparse
+import asyncio
+import logging
+import math
+import random
+import statistics
+
+from benchmarks.load_test import CityMix
+from benchmarks.support import FakeOpenWeather, app_client, load
+from client_api.settings import settings
+from domain.weather.data.query import WeatherByCoordQuery
+
+CENTERS = [
+    (37.5665, 126.978), (35.6895, 139.6917), (51.5085, -0.1257), (40.7143, -74.006), (48.8534, 2.3488),
+    (52.5244, 13.4105), (39.9075, 116.3972), (-23.5475, -46.6361), (19.0144, 72.8479), (43.7001, -79.4163),
+]
+
+
+def _distance_km(a: WeatherByCoordQuery, b: WeatherByCoordQuery) -> float:
+    """
+    haversine
+    """
+    lat1, lon1, lat2, lon2 = map(math.radians, (a.lat, a.lon, b.lat, b.lon))
+    h = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * 6371 * math.asin(math.sqrt(h))
+
+
+def _coords(count: int, spread: float, seed: int) -> list[WeatherByCoordQuery]:
+    mix = CityMix(len(CENTERS), 1.1, seed)
+    rng = random.Random(seed)
+    coords = []
+    for name in mix.sample(count):
+        lat, lon = CENTERS[mix.names.index(name)]
+        coords.append(WeatherByCoordQuery(
+            lat=max(-90.0, min(90.0, rng.gauss(lat, spread))),
+            lon=max(-180.0, min(180.0, rng.gauss(lon, spread))),
+        ))
+    return coords
+
+
+async def main(requests: int, concurrency: int, spread: float, cell_sizes: list[float], latency: float) -> None:
+    coords = _coords(requests, spread, seed=0)
+    print(f"{'cell(deg)':>9} {'cells':>6} {'upstream':>8} {'hit':>6} {'err mean(km)':>12} {'err max(km)':>11} {'rps':>7}")
+    for cell_size in cell_sizes:
+        settings.weather.coord_cell_size = cell_size
+        errors = [_distance_km(it, it.quantize(cell_size)) for it in coords]
+        upstream = FakeOpenWeather(latency_ms=latency)
+        async with app_client(None, upstream.transport()) as client:
+            remaining = iter(coords)
+
+            async def request():
+                coord = next(remaining)
+                response = await client.get("/weather/by-coord", params={"lat": coord.lat, "lon": coord.lon})
+                response.raise_for_status()
+
+            rps, _ = await load(request, requests, concurrency)
+
+        cells = len({it.quantize(cell_size).cell_key for it in coords})
+        print(
+            f"{cell_size:>9} {cells:>6} {upstream.stats.requests:>8} "
+            f"{1 - upstream.stats.requests / requests:>6.1%} "
+            f"{statistics.fmean(errors):>12.2f} {max(errors):>11.2f} {rps:>7.0f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--spread", type=float, default=0.1, help="도시 중심에서 흩어진 정도 (표준편차, degrees)")
+    parser.add_argument("--cell-sizes", default="0,0.01,0.02,0.05,0.1,0.25")
+    parser.add_argument("--latency-ms", type=float, default=50, help="OpenWeather 응답 지연")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    asyncio.run(main(
+        args.requests,
+        args.concurrency,
+        args.spread,
+        [float(it) for it in args.cell_sizes.split(",")],
+        args.latency_ms,
+    ))
@@ -0,0 +1,234 @@
+"""
+외부 서비스 없이 client_api 부하 테스트
+
+- OpenWeather: FakeOpenWeather (응답 지연 분포, 500/404 비율 설정)
+- Redis: --redis-url 미지정 시 fakeredis
+- 도시 이름은 Zipf 분포(인기 도시에 요청이 몰림)로 선택, --batch-ratio 비율만큼 POST /weather/batch, 나머지는 GET /weather/{city}
+- --spelling-variants 비율만큼 같은 도시를 다른 표기로 요청 (ex. "City1,KR", "city1")
+- 결과(처리량, p50/p95/p99, upstream 요청 수, cache hit 비율)를 json으로 출력
+- --baseline: 이전 결과와 비교, 처리량 감소 또는 p99 증가가 --max-regression을 넘으면 exit code 1
+
+python -m benchmarks.load_test [--requests 5000] [--concurrency 50] [--latency-ms 80] [--error-rate 0.01] \\
+    [--output report.json] [--baseline baseline.json]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import random
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, asdict
+from itertools import accumulate
+
+from prometheus_client import REGISTRY
+
+from benchmarks.support import FakeOpenWeather, Latency, app_client
+from client_api.settings import settings
+
+CACHE_TIERS = ["l1", "l1_rendered", "redis", "redis_rendered"]
+
+
+@dataclass
+class Workload:
+    requests: int = 5000
+    concurrency: int = 50
+    cities: int = 1000  # 도시 종류 수
+    zipf_s: float = 1.1  # 클수록 인기 도시에 집중
+    batch_ratio: float = 0.1
+    batch_size: int = 20
+    spelling_variants: float = 0  # 다른 표기로 요청하는 비율
+    seed: int = 0
+
+
+class CityMix:
+    """
+    순위 k인 도시를 1 / k^s 에 비례하는 확률로 선택
+    """
+
+    VARIANTS = ["{},KR", "{},kr", "{}"]  # 소문자로 변환해서 사용하는 표기 포함
+
+    def __init__(self, cities: int, s: float, seed: int, spelling_variants: float = 0):
+        self.names = [f"City{i}" for i in range(cities)]
+        self._cum_weights = list(accumulate(1 / (rank ** s) for rank in range(1, cities + 1)))
+        self._random = random.Random(seed)
+        self.spelling_variants = spelling_variants
+
+    def sample(self, k: int = 1) -> list[str]:
+        names = self._random.choices(self.names, cum_weights=self._cum_weights, k=k)
+        return [self._spell(name) for name in names]
+
+    def _spell(self, name: str) -> str:
+        if self._random.random() >= self.spelling_variants:
+            return name
+        variant = self._random.choice(self.VARIANTS).format(name)
+        return variant.lower() if self._random.random() < 0.5 else variant
+
+
+def _cache_counts() -> dict[str, dict[str, float]]:
+    return {
+        tier: {
+            result: REGISTRY.get_sample_value("weather_cache_requests_total", {"tier": tier, "result": result}) or 0
+            for result in ["hit", "miss"]
+        }
+        for tier in CACHE_TIERS
+    }
+
+
+def _latency_report(samples: list[float]) -> dict[str, float]:
+    if not samples:
+        return {}
+    latency = Latency(samples)
+    return {
+        "mean_ms": round(latency.mean_ms, 3),
+        "p50_ms": round(latency.percentile_ms(50), 3),
+        "p95_ms": round(latency.percentile_ms(95), 3),
+        "p99_ms": round(latency.percentile_ms(99), 3),
+        "max_ms": round(max(samples) * 1000, 3),
+    }
+
+
+async def run(workload: Workload, upstream: FakeOpenWeather, redis_url: str | None) -> dict:
+    mix = CityMix(workload.cities, workload.zipf_s, workload.seed, workload.spelling_variants)
+    plan = random.Random(workload.seed + 1)
+    samples: dict[str, list[float]] = {"single": [], "batch": []}
+    statuses: Counter[str] = Counter()
+    city_lookups = 0
+    remaining = iter(range(workload.requests))
+
+    async with app_client(redis_url, upstream.transport()) as client:
+        async def worker():
+            nonlocal city_lookups
+            for _ in remaining:
+                if plan.random() < workload.batch_ratio:
+                    route, cities = "batch", mix.sample(workload.batch_size)
+                    request = client.post("/weather/batch", json={"cities": cities})
+                else:
+                    route, cities = "single", mix.sample()
+                    request = client.get(f"/weather/{cities[0]}")
+                city_lookups += len(cities)
+                start = time.perf_counter()
+                response = await request
+                samples[route].append(time.perf_counter() - start)
+                statuses[f"{route} {response.status_code}"] += 1
+
+        before = _cache_counts()
+        start = time.perf_counter()
+        await asyncio.gather(*[worker() for _ in range(workload.concurrency)])
+        elapsed = time.perf_counter() - start
+        after = _cache_counts()
+
+    tiers = {}
+    for tier in CACHE_TIERS:
+        hit = after[tier]["hit"] - before[tier]["hit"]
+        miss = after[tier]["miss"] - before[tier]["miss"]
+        tiers[tier] = {"hit": int(hit), "miss": int(miss), "hit_ratio": round(hit / (hit + miss), 4) if hit + miss else None}
+
+    return {
+        "workload": asdict(workload),
+        "upstream_config": {
+            "latency_ms": upstream.latency_ms,
+            "latency_sigma": upstream.latency_sigma,
+            "error_rate": upstream.error_rate,
+            "not_found_rate": upstream.not_found_rate,
+        },
+        "settings": {
+            "local_cache": settings.local_cache.enabled,
+            "prerender": settings.weather.prerender,
+            "redis": "redis" if redis_url else "fakeredis",
+        },
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput_rps": round(workload.requests / elapsed, 1),
+        "latency": {route: _latency_report(it) for route, it in samples.items()},
+        "latency_all": _latency_report(samples["single"] + samples["batch"]),
+        "statuses": dict(sorted(statuses.items())),
+        "upstream": asdict(upstream.stats),
+        "cache": {
+            # 요청된 도시 중 upstream 조회 없이 응답한 비율
+            "hit_ratio": round(1 - upstream.stats.cities / city_lookups, 4) if city_lookups else None,
+            "city_lookups": city_lookups,
+            "tiers": tiers,
+        },
+    }
+
+
+def compare(report: dict, baseline: dict, max_regression: float) -> list[str]:
+    """
+    반환값: 허용 범위를 넘은 항목
+    """
+    regressions = []
+    rps, base_rps = report["throughput_rps"], baseline["throughput_rps"]
+    print(f"{'throughput_rps':<20} {base_rps:>10} -> {rps:>10} ({(rps / base_rps - 1) * 100:+.1f}%)", file=sys.stderr)
+    if rps < base_rps * (1 - max_regression):
+        regressions.append("throughput_rps")
+
+    for route, latency in report["latency"].items():
+        base = baseline["latency"].get(route, {})
+        for key in ["p50_ms", "p95_ms", "p99_ms"]:
+            if key not in latency or not base.get(key):
+                continue
+            change = latency[key] / base[key] - 1
+            print(f"{route + ' ' + key:<20} {base[key]:>10} -> {latency[key]:>10} ({change * 100:+.1f}%)", file=sys.stderr)
+            if key == "p99_ms" and change > max_regression:
+                regressions.append(f"{route} {key}")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--redis-url", default=None, help="미지정 시 fakeredis 사용")
+    parser.add_argument("--requests", type=int, default=Workload.requests)
+    parser.add_argument("--concurrency", type=int, default=Workload.concurrency)
+    parser.add_argument("--cities", type=int, default=Workload.cities)
+    parser.add_argument("--zipf-s", type=float, default=Workload.zipf_s)
+    parser.add_argument("--batch-ratio", type=float, default=Workload.batch_ratio)
+    parser.add_argument("--batch-size", type=int, default=Workload.batch_size)
+    parser.add_argument("--spelling-variants", type=float, default=Workload.spelling_variants)
+    parser.add_argument("--seed", type=int, default=Workload.seed)
+    parser.add_argument("--latency-ms", type=float, default=80, help="OpenWeather 응답 지연 중앙값")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="log-normal sigma, 0이면 고정 지연")
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--not-found-rate", type=float, default=0.02)
+    parser.add_argument("--local-cache", action=argparse.BooleanOptionalAction, default=settings.local_cache.enabled)
+    parser.add_argument("--prerender", action=argparse.BooleanOptionalAction, default=settings.weather.prerender)
+    parser.add_argument("--output", default=None, help="결과 json 파일 (미지정 시 stdout)")
+    parser.add_argument("--baseline", default=None, help="비교할 이전 결과 json 파일")
+    parser.add_argument("--max-regression", type=float, default=0.1)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    settings.local_cache.enabled = args.local_cache
+    settings.weather.prerender = args.prerender
+    workload = Workload(
+        requests=args.requests,
+        concurrency=args.concurrency,
+        cities=args.cities,
+        zipf_s=args.zipf_s,
+        batch_ratio=args.batch_ratio,
+        batch_size=args.batch_size,
+        spelling_variants=args.spelling_variants,
+        seed=args.seed,
+    )
+    upstream = FakeOpenWeather(
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        not_found_rate=args.not_found_rate,
+        seed=args.seed,
+    )
+    report = asyncio.run(run(workload, upstream, args.redis_url))
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.max_regression)
+        if regressions:
+            print(f"regression: {', '.join(regressions)}", file=sys.stderr)
+            sys.exit(1)
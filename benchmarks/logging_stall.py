@@ -0,0 +1,114 @@
+"""
+로그 출력이 event loop를 막는 시간: 기존 설정(loop에서 바로 stdout/파일 쓰기) vs QueueLogHandler
+
+- 요청을 흉내 내는 coroutine들이 로그를 남기는 동안, 1ms마다 깨어나는 coroutine이 늦게 깨어난 시간(loop lag) 측정
+- stdout 대신 임시 파일 사용, --sink-delay로 느린 stdout(pipe가 가득 찬 경우 등) 흉내
+
+python -m benchmarks.logging_stall [--records 20000] [--sink-delay 0.0002]
+"""
+import argparse
+import asyncio
+import logging
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from client_api.settings import LogFormat
+from client_api.shared.config.log_config import JsonFormatter, create_queue_handler
+
+
+class SlowStream:
+    """
+    write마다 delay만큼 block 되는 stream
+    """
+
+    def __init__(self, path: Path, delay: float):
+        self._file = open(path, "a", encoding="utf-8")
+        self._delay = delay
+
+    def write(self, data: str) -> int:
+        if self._delay:
+            time.sleep(self._delay)
+        return self._file.write(data)
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _legacy_handlers(directory: Path, delay: float) -> list[logging.Handler]:
+    console = logging.StreamHandler(SlowStream(directory / "stdout.log", delay))
+    console.setFormatter(logging.Formatter("%(levelname)s\t%(asctime)s\t%(name)-25s\t%(message)s"))
+    file = logging.FileHandler(directory / "legacy.log")
+    file.setFormatter(logging.Formatter("%(levelname)s\t%(asctime)s\t%(name)s\t%(message)s"))
+    return [console, file]
+
+
+def _queue_handlers(directory: Path, delay: float) -> list[logging.Handler]:
+    handler = create_queue_handler(LogFormat.JSON, str(directory / "app.log"), 10 * 1024 * 1024, 1)
+    console = handler.listener.handlers[0]
+    console.setStream(SlowStream(directory / "stdout.log", delay))
+    console.setFormatter(JsonFormatter())
+    return [handler]
+
+
+async def _measure(logger: logging.Logger, records: int, concurrency: int) -> list[float]:
+    lags: list[float] = []
+    done = asyncio.Event()
+
+    async def monitor():
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append(time.perf_counter() - start - 0.001)
+
+    async def worker(count: int):
+        for i in range(count):
+            logger.info("GET /weather/%s 200", i)
+            if i % 10 == 0:
+                await asyncio.sleep(0)
+
+    task = asyncio.create_task(monitor())
+    await asyncio.gather(*(worker(records // concurrency) for _ in range(concurrency)))
+    done.set()
+    await task
+    return lags
+
+
+def _run(name: str, handlers: list[logging.Handler], records: int, concurrency: int) -> None:
+    logger = logging.getLogger(f"benchmarks.logging_stall.{name}")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    for handler in handlers:
+        logger.addHandler(handler)
+
+    start = time.perf_counter()
+    lags = asyncio.run(_measure(logger, records, concurrency))
+    elapsed = time.perf_counter() - start
+    for handler in handlers:
+        handler.close()
+
+    lags_ms = sorted(lag * 1000 for lag in lags)
+    p99 = lags_ms[int(len(lags_ms) * 0.99) - 1] if len(lags_ms) > 1 else lags_ms[0]
+    print(
+        f"{name:<7} records: {records}, loop: {elapsed:.2f}s, "
+        f"lag mean: {statistics.mean(lags_ms):.2f}ms, p99: {p99:.2f}ms, max: {lags_ms[-1]:.2f}ms"
+    )
+
+
+def main(records: int, concurrency: int, sink_delay: float) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        _run("legacy", _legacy_handlers(Path(directory), sink_delay), records, concurrency)
+        _run("queue", _queue_handlers(Path(directory), sink_delay), records, concurrency)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--sink-delay", type=float, default=0.0, help="stdout write 1회당 block 시간(초)")
+    args = parser.parse_args()
+    main(args.records, args.concurrency, args.sink_delay)
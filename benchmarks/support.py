@@ -0,0 +1,247 @@
+"""
+벤치마크 공통 유틸
+
+외부 서비스 없이 실행할 수 있도록 기본적으로 fakeredis를 사용하고,
+네트워크 왕복 시간은 --rtt-ms로 흉내냄
+"""
+import asyncio
+import random
+import statistics
+import time
+import zlib
+from contextlib import contextmanager, asynccontextmanager
+from dataclasses import dataclass
+from typing import Iterator, AsyncIterator
+
+import httpx
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+
+
+def redis_client(url: str | None) -> Redis:
+    if url:
+        return Redis.from_url(url, decode_responses=False)
+
+    from fakeredis import FakeAsyncRedis
+    return FakeAsyncRedis(decode_responses=False, max_connections=1000)
+
+
+@dataclass
+class RoundTrips:
+    count: int = 0
+
+
+@contextmanager
+def count_round_trips(rtt: float = 0) -> Iterator[RoundTrips]:
+    """
+    Redis 왕복 횟수 측정. 단일 명령과 pipeline 실행을 각각 1회로 계산
+    rtt: 왕복마다 추가할 지연 (seconds)
+    """
+    round_trips = RoundTrips()
+    execute_command = Redis.execute_command
+    execute_pipeline = Pipeline.execute
+
+    async def _execute_command(self, *args, **kwargs):
+        round_trips.count += 1
+        if rtt:
+            await asyncio.sleep(rtt)
+        return await execute_command(self, *args, **kwargs)
+
+    async def _execute_pipeline(self, *args, **kwargs):
+        round_trips.count += 1
+        if rtt:
+            await asyncio.sleep(rtt)
+        return await execute_pipeline(self, *args, **kwargs)
+
+    Redis.execute_command = _execute_command
+    Pipeline.execute = _execute_pipeline
+    try:
+        yield round_trips
+    finally:
+        Redis.execute_command = execute_command
+        Pipeline.execute = execute_pipeline
+
+
+@dataclass
+class Latency:
+    samples: list[float]
+
+    @property
+    def mean_ms(self) -> float:
+        return statistics.fmean(self.samples) * 1000
+
+    def percentile_ms(self, p: float) -> float:
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(len(ordered) * p / 100))
+        return ordered[index] * 1000
+
+
+async def measure(fn, repeat: int) -> Latency:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - start)
+    return Latency(samples)
+
+
+# MARK: - client api
+def openweather_city_id(city: str) -> int:
+    """
+    도시 이름별로 고정된 가짜 OpenWeather city id
+    """
+    return zlib.crc32(city.casefold().encode()) % 10_000_000 + 1
+
+
+def openweather_payload(city: str, city_id: int | None = None) -> dict:
+    return {
+        "coord": {"lon": 126.97, "lat": 37.56},
+        "weather": [{"id": 800, "main": "Clear", "description": "clear sky", "icon": "01d"}],
+        "base": "stations",
+        "main": {"temp": 280.0, "feels_like": 278.0, "pressure": 1020, "humidity": 50, "temp_min": 279.0, "temp_max": 281.0},
+        "visibility": 10000,
+        "wind": {"speed": 1.5, "deg": 180},
+        "clouds": {"all": 0},
+        "dt": 1700000000,
+        "sys": {"country": "KR", "sunrise": 1699999000, "sunset": 1700030000},
+        "timezone": 32400,
+        "id": city_id or openweather_city_id(city),
+        "name": city,
+        "cod": 200,
+    }
+
+
+def openweather_transport(latency: float = 0) -> httpx.AsyncBaseTransport:
+    """
+    OpenWeather 대신 응답하는 transport
+    latency: 요청마다 추가할 지연 (seconds)
+    """
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if latency:
+            await asyncio.sleep(latency)
+        return httpx.Response(200, json=openweather_payload(request.url.params.get("q", "")))
+
+    return httpx.MockTransport(handler)
+
+
+@dataclass
+class UpstreamStats:
+    requests: int = 0  # OpenWeather 요청 수 (retry 포함)
+    cities: int = 0  # 요청된 도시 수 (retry 포함, group 요청은 도시 수만큼)
+    errors: int = 0  # 500 응답
+    not_found: int = 0  # 404 응답
+
+
+class FakeOpenWeather:
+    """
+    OpenWeather 대신 응답하는 transport (/data/2.5/weather 도시 이름/ID/좌표, /data/2.5/group)
+    - latency_ms: 응답 지연 중앙값, latency_sigma: log-normal 분포의 sigma (0이면 고정 지연)
+    - error_rate: 요청마다 이 비율로 500 응답
+    - not_found_rate: 도시 이름 hash 기준으로 이 비율의 도시는 항상 404 (없는 도시)
+    - 도시 이름 조회는 OpenWeather처럼 표기와 관계없이 같은 도시 이름, city id로 응답 (ex. " city1,KR" -> "City1")
+    """
+
+    def __init__(
+            self,
+            latency_ms: float = 0,
+            latency_sigma: float = 0,
+            error_rate: float = 0,
+            not_found_rate: float = 0,
+            seed: int = 0,
+    ):
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.not_found_rate = not_found_rate
+        self.stats = UpstreamStats()
+        self._random = random.Random(seed)
+
+    def is_not_found(self, city: str) -> bool:
+        return zlib.crc32(city.casefold().encode()) % 10_000 < self.not_found_rate * 10_000
+
+    @staticmethod
+    def canonical_name(city: str) -> str:
+        name = city.split(",")[0].strip()
+        return name[:1].upper() + name[1:].lower()
+
+    def latency(self) -> float:
+        if not self.latency_ms:
+            return 0
+        return self.latency_ms / 1000 * self._random.lognormvariate(0, self.latency_sigma)
+
+    def transport(self) -> httpx.AsyncBaseTransport:
+        return httpx.MockTransport(self._handle)
+
+    async def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.stats.requests += 1
+        if latency := self.latency():
+            await asyncio.sleep(latency)
+        if self._random.random() < self.error_rate:
+            self.stats.errors += 1
+            return httpx.Response(500, json={"cod": 500, "message": "internal error"})
+
+        if request.url.path.endswith("/group"):
+            ids = request.url.params["id"].split(",")
+            self.stats.cities += len(ids)
+            cities = []
+            for city_id in ids:
+                if self.is_not_found(city_id):
+                    self.stats.not_found += 1
+                    continue
+                cities.append(openweather_payload(city_id, int(city_id)))
+            return httpx.Response(200, json={"cnt": len(cities), "list": cities})
+
+        self.stats.cities += 1
+        if "lat" in request.url.params:
+            # 좌표 조회: 항상 가장 가까운 관측 지점이 있음
+            return httpx.Response(200, json=openweather_payload(f"{request.url.params['lat']},{request.url.params['lon']}"))
+
+        city = self.canonical_name(request.url.params.get("q") or request.url.params.get("id", ""))
+        if self.is_not_found(city):
+            self.stats.not_found += 1
+            return httpx.Response(404, json={"cod": "404", "message": "city not found"})
+        return httpx.Response(200, json=openweather_payload(city))
+
+
+@asynccontextmanager
+async def app_client(redis_url: str | None, transport: httpx.AsyncBaseTransport) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    client_api를 프로세스 내에서 실행 (네트워크, uvicorn 제외)
+    """
+    from client_api.main import app
+    from infrastructure.openweather.client import OpenWeatherClient
+    from infrastructure.redis.redis_manager import redis_manager
+
+    async def connect(*_, **__) -> None:
+        redis_manager.client = redis_client(redis_url)
+
+    redis_manager.connect = connect
+    try:
+        async with app.router.lifespan_context(app):
+            await app.state.openweather_client.close()
+            app.state.openweather_client = OpenWeatherClient(api_key="", host="http://openweather", transport=transport)
+            app.state.openweather_provider.client = app.state.openweather_client
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://client-api") as client:
+                yield client
+    finally:
+        del redis_manager.connect
+
+
+async def load(fn, requests: int, concurrency: int) -> tuple[float, Latency]:
+    """
+    concurrency개의 worker가 fn을 총 requests번 실행
+    반환값: (requests/sec, 요청별 지연시간)
+    """
+    samples = []
+    remaining = iter(range(requests))
+
+    async def worker():
+        for _ in remaining:
+            start = time.perf_counter()
+            await fn()
+            samples.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    return requests / (time.perf_counter() - start), Latency(samples)
@@ -0,0 +1,69 @@
+"""
+OpenWeather 응답 파싱 시간 비교 (응답 body bytes -> 도메인 모델)
+
+- strict: json.loads -> WeatherResponse.model_validate (전체 필드 검증) -> to_domain
+  (OPENWEATHERMAP__STRICT_VALIDATION=true)
+- lean: 필요한 필드만 TypeAdapter로 bytes에서 바로 파싱 (parse_weather, parse_group_weather)
+
+응답은 benchmarks/data/openweather/ 에 저장된 응답 사용 (실제 응답을 저장해서 --weather, --group으로 지정 가능)
+
+python -m benchmarks.upstream_parse [--repeat 20000]
+"""
+import argparse
+import json
+import time
+from pathlib import Path
+
+from infrastructure.openweather.model import (
+    WeatherResponse,
+    GroupWeatherResponse,
+    parse_weather,
+    parse_group_weather,
+)
+
+DATA = Path(__file__).parent / "data" / "openweather"
+
+
+def _per_op_us(fn, content: bytes, repeat: int) -> float:
+    fn(content)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(content)
+    return (time.perf_counter() - start) / repeat * 1_000_000
+
+
+def _compact(path: Path) -> bytes:
+    """
+    저장된 응답(들여쓰기 포함)을 실제 응답처럼 공백 없는 json으로
+    """
+    return json.dumps(json.loads(path.read_bytes()), separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def main(weather_path: Path, group_path: Path, repeat: int) -> None:
+    cases = {
+        "weather": (
+            _compact(weather_path),
+            lambda content: WeatherResponse.model_validate(json.loads(content)).to_domain(),
+            parse_weather,
+        ),
+        "group": (
+            _compact(group_path),
+            lambda content: {it.id: it.to_domain() for it in GroupWeatherResponse.model_validate(json.loads(content)).list},
+            parse_group_weather,
+        ),
+    }
+    print(f"{'payload':>8} {'bytes':>6} {'strict(us)':>10} {'lean(us)':>9} {'speedup':>8}")
+    for name, (content, strict, lean) in cases.items():
+        assert strict(content) == lean(content)
+        strict_us = _per_op_us(strict, content, repeat)
+        lean_us = _per_op_us(lean, content, repeat)
+        print(f"{name:>8} {len(content):>6} {strict_us:>10.2f} {lean_us:>9.2f} {strict_us / lean_us:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--weather", type=Path, default=DATA / "weather.json", help="/data/2.5/weather 응답")
+    parser.add_argument("--group", type=Path, default=DATA / "group.json", help="/data/2.5/group 응답")
+    parser.add_argument("--repeat", type=int, default=20_000)
+    args = parser.parse_args()
+    main(args.weather, args.group, args.repeat)
@@ -0,0 +1,53 @@
+"""
+캐시 hit 응답의 처리량(requests/sec), p99 비교
+
+- prerender off: 캐시 값 디코딩 -> Weather -> response model 직렬화
+- prerender on: 캐시에 함께 저장된 응답 조각을 그대로 응답 (WEATHER__PRERENDER=true)
+
+각각 L1(프로세스 내 캐시) 사용 여부별로 측정
+
+python -m benchmarks.weather_response [--redis-url redis://localhost:6379] [--requests 5000] [--concurrency 50]
+"""
+import argparse
+import asyncio
+import logging
+
+from benchmarks.support import app_client, openweather_transport, load
+from client_api.settings import settings
+
+BATCH_CITIES = [f"City{i}" for i in range(50)]
+
+
+async def main(redis_url: str | None, requests: int, concurrency: int) -> None:
+    print(f"{'route':>8} {'l1':>5} {'prerender':>9} {'rps':>9} {'mean(ms)':>9} {'p99(ms)':>9}")
+    for route in ["single", "batch"]:
+        for local_cache in [False, True]:
+            for prerender in [False, True]:
+                settings.local_cache.enabled = local_cache
+                settings.weather.prerender = prerender
+                async with app_client(redis_url, openweather_transport()) as client:
+                    if route == "single":
+                        async def request():
+                            response = await client.get("/weather/Seoul")
+                            response.raise_for_status()
+                    else:
+                        async def request():
+                            response = await client.post("/weather/batch", json={"cities": BATCH_CITIES})
+                            response.raise_for_status()
+
+                    await request()  # 캐시 저장
+                    rps, latency = await load(request, requests, concurrency)
+                print(
+                    f"{route:>8} {str(local_cache):>5} {str(prerender):>9} "
+                    f"{rps:>9.0f} {latency.mean_ms:>9.2f} {latency.percentile_ms(99):>9.2f}"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--redis-url", default=None, help="미지정 시 fakeredis 사용")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+    asyncio.run(main(args.redis_url, args.requests, args.concurrency))
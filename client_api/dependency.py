@@ -1,13 +1,23 @@
 from typing import Annotated
 
 from fastapi import Depends, Request
+from starlette.datastructures import State
 from redis.asyncio import Redis
 
+from client_api.settings import settings
+from domain.shared.background_refresher import BackgroundRefresher
+from domain.shared.micro_batcher import MicroBatcher
+from domain.shared.single_flight import SingleFlight
+from domain.weather.data.model import Weather
+from domain.weather.data.query import WeatherByCityQuery
+from domain.weather.popularity import WeatherPopularity
 from domain.weather.provider import WeatherProvider
 from domain.weather.service import WeatherService
 from domain.weather.repository import WeatherCacheRepository
+from infrastructure.memory.weather_cache_repository import TieredWeatherCacheRepository
 from infrastructure.openweather.client import OpenWeatherClient
 from infrastructure.openweather.provider import OpenWeatherProvider
+from infrastructure.redis.codec import create_weather_codec
 from infrastructure.redis.redis_manager import redis_manager
 from infrastructure.redis.weather_cache_repository import RedisWeatherCacheRepository
 
@@ -19,18 +29,16 @@ def get_openweather_client(request: Request) -> OpenWeatherClient:
     return request.app.state.openweather_client
 
 
-def get_open_weather_provider(
-        client: Annotated[OpenWeatherClient, Depends(get_openweather_client)]
-) -> WeatherProvider:
-    return OpenWeatherProvider(client)
+def get_open_weather_provider(request: Request) -> WeatherProvider:
+    return request.app.state.openweather_provider
 
 
 OpenWeatherProviderDI = Annotated[OpenWeatherProvider, Depends(get_open_weather_provider)]
 
 
 # MARK: - infra/redis
-async def get_redis() -> Redis:
-    return await redis_manager.get_client()
+def get_redis() -> Redis:
+    return redis_manager.get_client()
 
 
 RedisDI = Annotated[Redis, Depends(get_redis)]
@@ -39,12 +47,65 @@ RedisDI = Annotated[Redis, Depends(get_redis)]
 # MARK: - domain
 
 # MARK: - domain/weather
-def get_weather_cache_repository(redis: RedisDI) -> WeatherCacheRepository:
-    return RedisWeatherCacheRepository(redis)
+def get_weather_single_flight(request: Request) -> SingleFlight[Weather]:
+    return request.app.state.weather_single_flight
+
+
+def get_weather_refresher(request: Request) -> BackgroundRefresher:
+    return request.app.state.weather_refresher
+
+
+def get_weather_batcher(request: Request) -> MicroBatcher[WeatherByCityQuery, Weather] | None:
+    return request.app.state.weather_batcher
+
+
+def get_weather_cache_repository(request: Request, redis: RedisDI) -> WeatherCacheRepository:
+    return create_weather_cache_repository(request.app.state, redis)
+
+
+def create_weather_cache_repository(state: State, redis: Redis) -> WeatherCacheRepository:
+    repository = RedisWeatherCacheRepository(
+        redis,
+        fetch_lease=settings.redis.fetch_lease,
+        codec=create_weather_codec(settings.redis.codec),
+        renderer=state.weather_renderer,
+        hash_tags=settings.redis.hash_tags,
+    )
+    if not settings.local_cache.enabled:
+        return repository
+    return TieredWeatherCacheRepository(
+        l1=state.weather_l1_cache,
+        aliases=state.weather_l1_aliases,
+        l2=repository,
+        l2_stats=state.weather_l2_stats,
+        invalidation=state.weather_cache_invalidation,
+        rendered=state.weather_l1_rendered_cache if settings.weather.prerender else None,
+    )
+
+
+def get_weather_popularity(request: Request) -> WeatherPopularity | None:
+    return request.app.state.weather_popularity
 
 
 def get_weather_service(
         cache: Annotated[WeatherCacheRepository, Depends(get_weather_cache_repository)],
         weather_provider: Annotated[WeatherProvider, Depends(get_open_weather_provider)],
+        single_flight: Annotated[SingleFlight[Weather], Depends(get_weather_single_flight)],
+        refresher: Annotated[BackgroundRefresher, Depends(get_weather_refresher)],
+        batcher: Annotated[MicroBatcher[WeatherByCityQuery, Weather] | None, Depends(get_weather_batcher)],
 ) -> WeatherService:
-    return WeatherService(cache, weather_provider)
+    return WeatherService(cache, weather_provider, single_flight, refresher, settings.weather, batcher)
+
+
+def create_weather_service(state: State) -> WeatherService:
+    """
+    요청 밖(백그라운드 작업)에서 사용하는 service, 요청 경로와 같은 캐시, single flight 공유
+    """
+    return WeatherService(
+        create_weather_cache_repository(state, redis_manager.get_client()),
+        state.openweather_provider,
+        state.weather_single_flight,
+        state.weather_refresher,
+        settings.weather,
+        state.weather_batcher,
+    )
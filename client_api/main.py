@@ -1,29 +1,129 @@
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from client_api.dependency import create_weather_service
 from client_api.router import root_router
+from client_api.router.weather.response import WeatherResponse
 from client_api.shared.config.log_config import LOG_CONFIG
 from client_api.shared.middleware.error_handler import register_exception_handlers
+from client_api.shared.middleware.metrics import MetricsMiddleware
+from client_api.shared.middleware.server_timing import register_server_timing
 from client_api.settings import settings
 from contextlib import asynccontextmanager
+from dataclasses import asdict
+from domain.shared.background_refresher import BackgroundRefresher
+from domain.shared.single_flight import SingleFlight
+from domain.weather.popularity import WeatherPopularity
+from domain.weather.service import create_weather_batcher
+from domain.weather.warmer import WeatherCacheWarmer
+from infrastructure.memory.ttl_lru_cache import TTLLRUCache, CacheStats
+from infrastructure.metrics.prometheus import render_metrics, mark_process_dead
+from infrastructure.redis.codec import create_weather_codec
+from infrastructure.redis.leader_lease import RedisLeaderLease
+from infrastructure.redis.weather_cache_invalidation import RedisWeatherCacheInvalidation
+from infrastructure.redis.weather_cache_repository import RedisWeatherCacheRepository
+from infrastructure.redis.weather_popularity_repository import RedisWeatherPopularityRepository
 from infrastructure.redis.redis_manager import redis_manager
+from infrastructure.openweather.city_index import CityIndex
 from infrastructure.openweather.client import OpenWeatherClient
+from infrastructure.openweather.provider import OpenWeatherProvider
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    await redis_manager.connect(redis_url=settings.redis.url)
+    await redis_manager.connect(settings.redis)
     app.state.openweather_client = OpenWeatherClient(
         api_key=settings.openweathermap.api_key,
         host=settings.openweathermap.host,
+        http=settings.openweathermap.http,
+        circuit_breaker=settings.openweathermap.circuit_breaker,
+        hedge=settings.openweathermap.hedge,
     )
+    if settings.openweathermap.http.warmup_connections:
+        await app.state.openweather_client.warm_up(settings.openweathermap.http.warmup_connections)
+    app.state.city_index = (
+        CityIndex(settings.openweathermap.city_index.path) if settings.openweathermap.city_index.path else None
+    )
+    app.state.openweather_provider = OpenWeatherProvider(
+        app.state.openweather_client,
+        city_index=app.state.city_index,
+        reject_unknown=settings.openweathermap.city_index.reject_unknown,
+        strict=settings.openweathermap.strict_validation,
+        single_concurrency=settings.openweathermap.single_concurrency,
+    )
+    app.state.weather_batcher = (
+        create_weather_batcher(app.state.openweather_provider, settings.weather)
+        if app.state.openweather_provider.supports_batch and settings.weather.upstream_batch_window > 0 else None
+    )
+    app.state.weather_single_flight = SingleFlight()
+    app.state.weather_refresher = BackgroundRefresher(settings.weather.max_background_refresh)
+
+    app.state.weather_l1_cache = TTLLRUCache(
+        max_size=settings.local_cache.max_size,
+        ttl=settings.local_cache.ttl,
+    )
+    app.state.weather_l1_rendered_cache = TTLLRUCache(
+        max_size=settings.local_cache.max_size,
+        ttl=settings.local_cache.ttl,
+    )
+    # 도시 이름 -> city_id, L1의 city_id 항목을 이름으로 조회할 때 사용
+    app.state.weather_l1_aliases = TTLLRUCache(
+        max_size=settings.local_cache.max_size,
+        ttl=settings.local_cache.ttl,
+    )
+    app.state.weather_l2_stats = CacheStats()
+    app.state.weather_renderer = WeatherResponse.render if settings.weather.prerender else None
+    app.state.weather_cache_invalidation = RedisWeatherCacheInvalidation(redis_manager.get_client())
+    if settings.local_cache.enabled:
+        def on_invalidate(city: str) -> None:
+            app.state.weather_l1_cache.delete(city)
+            app.state.weather_l1_rendered_cache.delete(city)
+            app.state.weather_l1_aliases.delete(city)
+
+        def on_reconnect() -> None:
+            app.state.weather_l1_cache.clear()
+            app.state.weather_l1_rendered_cache.clear()
+            app.state.weather_l1_aliases.clear()
+
+        app.state.weather_cache_invalidation.start(on_invalidate=on_invalidate, on_reconnect=on_reconnect)
+
+    app.state.weather_popularity = None
+    app.state.weather_cache_warmer = None
+    if settings.weather.warmer.enabled:
+        app.state.weather_popularity = WeatherPopularity(
+            RedisWeatherPopularityRepository(redis_manager.get_client()),
+            max_pending=settings.weather.warmer.max_tracked,
+        )
+        app.state.weather_cache_warmer = WeatherCacheWarmer(
+            popularity=app.state.weather_popularity,
+            lease=RedisLeaderLease(redis_manager.get_client(), "weather:warmer:leader", settings.weather.warmer.lease_ttl),
+            cache=RedisWeatherCacheRepository(
+                redis_manager.get_client(),
+                codec=create_weather_codec(settings.redis.codec),
+                hash_tags=settings.redis.hash_tags,
+            ),
+            service_factory=lambda: create_weather_service(app.state),
+            settings=settings.weather.warmer,
+        )
+        app.state.weather_cache_warmer.start()
     yield
+    if app.state.weather_cache_warmer is not None:
+        await app.state.weather_cache_warmer.close()
+    await app.state.weather_refresher.close()
+    if app.state.weather_batcher is not None:
+        await app.state.weather_batcher.close()
+    await app.state.weather_cache_invalidation.close()
     await redis_manager.close()
     await app.state.openweather_client.close()
+    mark_process_dead()
+    if app.state.city_index is not None:
+        app.state.city_index.close()
 
 
 app = FastAPI(lifespan=lifespan, title="Client API")
+app.add_middleware(MetricsMiddleware)
 app.include_router(root_router)
 register_exception_handlers(app)
+register_server_timing(app, settings.server_timing)
 
 if __name__ == "__main__":
     uvicorn.run(
@@ -38,3 +138,51 @@ if __name__ == "__main__":
 @app.get("/")
 async def health_check():
     return {"status": "ok", "redis_url": settings.redis.url}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    body, content_type = render_metrics()
+    return Response(body, media_type=content_type)
+
+
+@app.get("/stats")
+async def stats():
+    return {
+        "openweather_pool": asdict(app.state.openweather_client.pool_stats),
+        "openweather_hedge": {
+            **asdict(app.state.openweather_client.hedge.stats),
+            "delay": app.state.openweather_client.hedge.delay,
+        },
+        "openweather_circuit_breakers": {
+            it.name: {"state": it.state, **asdict(it.stats)}
+            for it in app.state.openweather_client.circuit_breakers.breakers()
+        },
+        "weather_single_flight": {
+            **asdict(app.state.weather_single_flight.stats),
+            "in_flight": app.state.weather_single_flight.in_flight(),
+        },
+        "weather_upstream_batcher": asdict(app.state.weather_batcher.stats) if app.state.weather_batcher else None,
+        "weather_cache_warmer": (
+            asdict(app.state.weather_cache_warmer.stats) if app.state.weather_cache_warmer else None
+        ),
+        "weather_refresher": {
+            **asdict(app.state.weather_refresher.stats),
+            "in_flight": app.state.weather_refresher.in_flight(),
+        },
+        "weather_cache": {
+            "l1": {
+                **asdict(app.state.weather_l1_cache.stats),
+                "size": len(app.state.weather_l1_cache),
+            },
+            "l1_rendered": {
+                **asdict(app.state.weather_l1_rendered_cache.stats),
+                "size": len(app.state.weather_l1_rendered_cache),
+            },
+            "l1_aliases": {
+                **asdict(app.state.weather_l1_aliases.stats),
+                "size": len(app.state.weather_l1_aliases),
+            },
+            "l2": asdict(app.state.weather_l2_stats),
+        },
+    }
@@ -1,5 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from client_api.settings import settings
 
 
 class GetWeatherBatchRequest(BaseModel):
-    cities: list[str]
+    cities: list[str] = Field(max_length=settings.weather.batch_max_size)
@@ -1,6 +1,8 @@
+import json
+
 from pydantic import BaseModel
 
-from domain.weather.data.model import Weather
+from domain.weather.data.model import Weather, WeatherBatchItem, RenderedWeather
 
 
 class WeatherResponse(BaseModel):
@@ -10,6 +12,7 @@ class WeatherResponse(BaseModel):
 
     city: str
     conditions: list[Condition]
+    stale: bool = False  # upstream 갱신 전 또는 장애로 인해 soft ttl이 지난 값으로 응답한 경우
 
     @classmethod
     def from_model(cls, weather: Weather) -> "WeatherResponse":
@@ -21,5 +24,43 @@ class WeatherResponse(BaseModel):
                     description=c.description,
                 )
                 for c in weather.conditions
-            ]
+            ],
+            stale=weather.is_stale,
         )
+
+    @classmethod
+    def render(cls, weather: Weather) -> bytes:
+        """
+        캐시에 함께 저장할 응답 조각 (WEATHER__PRERENDER)
+        """
+        return cls.from_model(weather).model_dump_json().encode()
+
+
+class WeatherBatchItemResponse(BaseModel):
+    city: str  # 요청한 도시 이름
+    status: WeatherBatchItem.Status
+    weather: WeatherResponse | None = None
+    message: str | None = None  # 실패 사유
+
+    @classmethod
+    def from_model(cls, item: WeatherBatchItem) -> "WeatherBatchItemResponse":
+        return cls(
+            city=item.city,
+            status=item.status,
+            weather=WeatherResponse.from_model(item.weather) if item.weather else None,
+            message=item.message,
+        )
+
+    @classmethod
+    def render(cls, item: RenderedWeather | WeatherBatchItem) -> bytes:
+        """
+        캐시된 응답 조각은 재직렬화 없이 그대로 사용
+        """
+        if isinstance(item, WeatherBatchItem):
+            return cls.from_model(item).model_dump_json().encode()
+        return b"".join([
+            b'{"city":', json.dumps(item.city, ensure_ascii=False).encode(),
+            b',"status":"', WeatherBatchItem.Status.SUCCESS.value.encode(),
+            b'","weather":', item.body,
+            b',"message":null}',
+        ])
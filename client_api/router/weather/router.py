@@ -1,12 +1,19 @@
-from typing import Annotated
+from typing import Annotated, AsyncIterator
 
-from fastapi import APIRouter, Depends, Body, Path
+from fastapi import APIRouter, Depends, Body, Path, Query, Header, Response
 
-from client_api.dependency import get_weather_service
+from client_api.dependency import get_weather_service, get_weather_popularity
+from client_api.settings import settings
+from client_api.shared.dto.conditional import cache_headers, is_not_modified, not_modified_response
 from client_api.router.weather.request import GetWeatherBatchRequest
-from client_api.router.weather.response import WeatherResponse
+from client_api.router.weather.response import WeatherResponse, WeatherBatchItemResponse
 from client_api.shared.dto.response import ServerResponse
-from domain.weather.data.query import WeatherListByCitiesQuery, WeatherByCityQuery
+from client_api.shared.dto.stream import is_stream_accepted, stream_response
+from domain.shared.deadline import deadline_scope
+from infrastructure.metrics.prometheus import RESPONSE_SERIALIZATION_DURATION
+from domain.weather.data.model import Weather
+from domain.weather.data.query import WeatherListByCitiesQuery, WeatherByCityQuery, WeatherByCoordQuery
+from domain.weather.popularity import WeatherPopularity
 from domain.weather.service import WeatherService
 
 router = APIRouter(
@@ -15,28 +22,120 @@ router = APIRouter(
 )
 
 
-@router.get("/{city}")
+# "/{city}" 보다 먼저 선언 (by-coord를 도시 이름으로 처리하지 않도록)
+@router.get(
+    "/by-coord",
+    response_model=WeatherResponse,
+    responses={
+        304: {"description": "If-None-Match(ETag) 또는 If-Modified-Since(Last-Modified) 이후 변경되지 않음"},
+    },
+)
+async def get_weather_by_coord(
+        lat: Annotated[float, Query(ge=-90, le=90, description="위도")],
+        lon: Annotated[float, Query(ge=-180, le=180, description="경도")],
+        weather_service: Annotated[WeatherService, Depends(get_weather_service)],
+        if_none_match: Annotated[str | None, Header()] = None,
+        if_modified_since: Annotated[str | None, Header()] = None,
+):
+    with deadline_scope(settings.weather.deadline):
+        weather = await weather_service.get_weather_coord(WeatherByCoordQuery(lat=lat, lon=lon))
+    headers = cache_headers(weather.dt, weather.stale_at)
+    if is_not_modified(weather.dt, if_none_match, if_modified_since):
+        return not_modified_response(headers)
+    return _weather_response(weather, headers)
+
+
+@router.get(
+    "/{city}",
+    response_model=WeatherResponse,
+    responses={
+        304: {"description": "If-None-Match(ETag) 또는 If-Modified-Since(Last-Modified) 이후 변경되지 않음"},
+    },
+)
 async def get_weather(
         city: Annotated[str, Path(
             ...,
             description="영어 도시 이름"
         )],
-        weather_service: Annotated[WeatherService, Depends(get_weather_service)]
+        weather_service: Annotated[WeatherService, Depends(get_weather_service)],
+        popularity: Annotated[WeatherPopularity | None, Depends(get_weather_popularity)],
+        if_none_match: Annotated[str | None, Header()] = None,
+        if_modified_since: Annotated[str | None, Header()] = None,
 ):
     query = WeatherByCityQuery(city=city)
-    return await weather_service.get_weather_city(query)
+    if popularity:
+        popularity.record(city)
+    if settings.weather.prerender and (rendered := await weather_service.get_rendered_weather_city(query)):
+        headers = cache_headers(rendered.dt, rendered.stale_at)
+        if is_not_modified(rendered.dt, if_none_match, if_modified_since):
+            return not_modified_response(headers)
+        return Response(rendered.body, media_type="application/json", headers=headers)
+
+    with deadline_scope(settings.weather.deadline):
+        weather = await weather_service.get_weather_city(query)
+    headers = cache_headers(weather.dt, weather.stale_at)
+    if is_not_modified(weather.dt, if_none_match, if_modified_since):
+        return not_modified_response(headers)
+    return _weather_response(weather, headers)
 
 
-@router.post("/batch", response_model=ServerResponse[list[WeatherResponse]])
+@router.post(
+    "/batch",
+    response_model=ServerResponse[list[WeatherBatchItemResponse]],
+    responses={
+        200: {
+            "content": {
+                "application/x-ndjson": {},
+                "text/event-stream": {},
+            },
+            "description": "Accept 헤더가 application/x-ndjson, text/event-stream 이면 도시별 결과를 조회되는 순서대로 스트리밍",
+        },
+    },
+)
 async def get_weather_batch(
         request: Annotated[GetWeatherBatchRequest, Body(
             ...,
             description="날씨 배치조회",
             examples=[{"cities": ["Seoul", "Tokyo", "London"]}]
         )],
-        weather_service: Annotated[WeatherService, Depends(get_weather_service)]
+        weather_service: Annotated[WeatherService, Depends(get_weather_service)],
+        popularity: Annotated[WeatherPopularity | None, Depends(get_weather_popularity)],
+        accept: Annotated[str | None, Header()] = None,
 ):
-    weather_list = await weather_service.get_weather_cities(WeatherListByCitiesQuery(cities=request.cities))
-    return ServerResponse.success([
-        WeatherResponse.from_model(it) for it in weather_list
-    ])
+    query = WeatherListByCitiesQuery(cities=request.cities)
+    if popularity:
+        popularity.record(*request.cities)
+    if is_stream_accepted(accept):
+        return stream_response(_stream_weather_batch(weather_service, query), accept)
+
+    with deadline_scope(settings.weather.batch_deadline):
+        if settings.weather.prerender:
+            items = await weather_service.get_rendered_weather_cities(query)
+        else:
+            items = await weather_service.get_weather_cities(query)
+    with RESPONSE_SERIALIZATION_DURATION.time():
+        payload = b"[" + b",".join(WeatherBatchItemResponse.render(it) for it in items) + b"]"
+        body = ServerResponse.render_success(payload)
+    return Response(body, media_type="application/json")
+
+
+async def _stream_weather_batch(
+        weather_service: WeatherService,
+        query: WeatherListByCitiesQuery,
+) -> AsyncIterator[WeatherBatchItemResponse]:
+    """
+    handler가 반환된 후 응답을 전송하면서 실행되므로 deadline도 generator 안에서 설정
+    """
+    with deadline_scope(settings.weather.batch_deadline):
+        async for it in weather_service.iter_weather_cities(query):
+            yield WeatherBatchItemResponse.from_model(it)
+
+
+def _weather_response(weather: Weather, headers: dict[str, str]) -> Response:
+    """
+    response_model 검증, 직렬화를 거치지 않고 직접 직렬화 (response_serialization 단계에 json 변환까지 포함)
+    response_model은 문서용
+    """
+    with RESPONSE_SERIALIZATION_DURATION.time():
+        body = WeatherResponse.render(weather)
+    return Response(body, media_type="application/json", headers=headers)
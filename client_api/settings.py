@@ -1,8 +1,12 @@
 import os
+from enum import Enum
 from pathlib import Path
 
+from pydantic import BaseModel
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from domain.weather.settings import WeatherSettings
+from infrastructure.memory.settings import LocalCacheSettings
 from infrastructure.openweather.settings import OpenWeatherSettings
 from infrastructure.redis.settings import RedisSettings
 
@@ -10,9 +14,42 @@ BASE_DIR = Path(__file__).parent
 ENV = os.getenv("ENV", "local")
 
 
+class ServerTimingSettings(BaseModel):
+    """
+    prefix: SERVER_TIMING__
+    요청별 단계(cache, upstream, 응답 직렬화 등) 소요 시간을 Server-Timing 헤더로 응답
+    """
+    enabled: bool = False  # false이면 middleware를 등록하지 않음
+    slow_request_threshold: float = 1  # seconds, 이보다 오래 걸린 요청은 단계별 소요 시간을 로그로 기록
+
+
+class LogFormat(str, Enum):
+    CONSOLE = "console"  # 색상, 짧은 logger 이름 (local)
+    JSON = "json"  # 한 줄에 하나의 json (운영 환경 로그 수집용)
+
+
+class LogSettings(BaseModel):
+    """
+    prefix: LOG__
+    로그 출력(포맷, 파일 쓰기)은 background thread에서 처리
+    """
+    format: LogFormat = LogFormat.CONSOLE
+    file: str = "app.log"  # 비어 있으면 stdout에만 출력
+    file_max_bytes: int = 10 * 1024 * 1024  # 이 크기를 넘으면 파일 교체
+    file_backup_count: int = 5
+    upstream_level: str = "DEBUG"  # infrastructure.openweather 로그 레벨
+    # WARNING 미만 로그 중 남길 비율 (0 ~ 1)
+    access_sample_rate: float = 1
+    upstream_debug_sample_rate: float = 1
+
+
 class Settings(BaseSettings):
+    weather: WeatherSettings = WeatherSettings()
     redis: RedisSettings = RedisSettings()
+    local_cache: LocalCacheSettings = LocalCacheSettings()
     openweathermap: OpenWeatherSettings = OpenWeatherSettings()
+    server_timing: ServerTimingSettings = ServerTimingSettings()
+    log: LogSettings = LogSettings()
 
     model_config = SettingsConfigDict(
         env_file=(f"{BASE_DIR}/.env", f"{BASE_DIR}/.env.{ENV}"),
@@ -1,4 +1,15 @@
+import atexit
+import json
 import logging
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+import colorlog
+
+from client_api.settings import settings, LogSettings, LogFormat
 
 
 class ShortenNameFilter(logging.Filter):
@@ -17,78 +28,163 @@ class ShortenNameFilter(logging.Filter):
         return True
 
 
-# client_api/log_config.py
+class SamplingFilter(logging.Filter):
+    """
+    logger별로 WARNING 미만 로그를 sample_rate 비율만 남김 (access log, upstream debug log 등 대량 로그)
+    rates: logger 이름(prefix) -> sample_rate
+    """
 
-LOG_CONFIG = {
-    "version": 1,
-    "disable_existing_loggers": False,
-    "filters": {
-        "shorten_name": {
-            "()": ShortenNameFilter,
-            "max_length": 30,
-        },
-    },
-    "formatters": {
-        "default": {
-            "()": "colorlog.ColoredFormatter",
-            "format": "%(log_color)s%(levelname)s%(reset)s\t%(asctime)s\t%(name)-25s\t%(message)s",
-            "datefmt": "%Y-%m-%dT%H:%M:%S%z",
-            "log_colors": {
+    def __init__(self, rates: dict[str, float]):
+        super().__init__()
+        self.rates = tuple((name, rate) for name, rate in rates.items() if rate < 1)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        for name, rate in self.rates:
+            if record.name == name or record.name.startswith(name + "."):
+                return random.random() < rate
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    한 줄에 하나의 json (운영 환경 로그 수집용)
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        log = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            log["exception"] = self.formatException(record.exc_info)
+        return json.dumps(log, ensure_ascii=False)
+
+
+class QueueLogHandler(QueueHandler):
+    """
+    요청을 처리하는 thread(event loop)에서는 queue에 넣기만 하고,
+    포맷, 필터(ShortenNameFilter), 출력(stdout, 파일)은 listener thread에서 처리
+    """
+
+    def __init__(self, handlers: list[logging.Handler]):
+        super().__init__(queue.SimpleQueue())
+        self.listener = QueueListener(self.queue, *handlers, respect_handler_level=True)
+        self.listener.start()
+        atexit.register(self.close)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 같은 프로세스 안에서 전달하므로 메시지 포맷(직렬화)도 listener thread에서 처리
+        return record
+
+    def close(self) -> None:
+        if self.listener._thread:
+            self.listener.stop()
+            for handler in self.listener.handlers:
+                handler.close()
+        super().close()
+
+
+def create_queue_handler(
+        output_format: LogFormat,
+        filename: str,
+        max_bytes: int,
+        backup_count: int,
+) -> QueueLogHandler:
+    """
+    stdout + 크기 기준으로 교체되는 파일(filename이 비어 있으면 stdout만)
+    """
+    if output_format == LogFormat.JSON:
+        console_formatter = file_formatter = JsonFormatter()
+    else:
+        console_formatter = colorlog.ColoredFormatter(
+            "%(log_color)s%(levelname)s%(reset)s\t%(asctime)s\t%(name)-25s\t%(message)s",
+            datefmt="%Y-%m-%dT%H:%M:%S%z",
+            log_colors={
                 "DEBUG": "cyan",
                 "INFO": "green",
                 "WARNING": "yellow",
                 "ERROR": "red",
                 "CRITICAL": "bold_red",
             },
+        )
+        file_formatter = logging.Formatter(
+            "%(levelname)s\t%(asctime)s\t%(name)s\t%(message)s",
+            datefmt="%Y-%m-%dT%H:%M:%S%z",
+        )
+
+    handlers: list[logging.Handler] = [logging.StreamHandler(sys.stdout)]
+    handlers[0].setFormatter(console_formatter)
+    if filename:
+        file_handler = RotatingFileHandler(filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        file_handler.setFormatter(file_formatter)
+        handlers.append(file_handler)
+    if output_format != LogFormat.JSON:
+        for handler in handlers:
+            handler.addFilter(ShortenNameFilter(max_length=30))
+    return QueueLogHandler(handlers)
+
+
+def create_log_config(log: LogSettings) -> dict:
+    return {
+        "version": 1,
+        "disable_existing_loggers": False,
+        "filters": {
+            "sampling": {
+                "()": SamplingFilter,
+                "rates": {
+                    "uvicorn.access": log.access_sample_rate,
+                    "infrastructure.openweather": log.upstream_debug_sample_rate,
+                },
+            },
         },
-        "plain": {
-            "format": "%(levelname)s\t%(asctime)s\t%(name)s\t%(message)s",
-            "datefmt": "%Y-%m-%dT%H:%M:%S%z",
-        },
-    },
-    "handlers": {
-        "console": {
-            "class": "logging.StreamHandler",
-            "formatter": "default",
-            "filters": ["shorten_name"],
-            "stream": "ext://sys.stdout",
-        },
-        "file": {
-            "class": "logging.FileHandler",
-            "formatter": "plain",
-            "filters": ["shorten_name"],
-            "filename": "app.log",
-        },
-    },
-    "root": {
-        "level": "INFO",
-        "handlers": ["console", "file"],
-    },
-    "loggers": {
-        "uvicorn": {
-            "level": "INFO",
-            "handlers": ["console", "file"],
-            "propagate": False,
-        },
-        "uvicorn.error": {
-            "level": "INFO",
-            "handlers": ["console", "file"],
-            "propagate": False,
+        "handlers": {
+            "queue": {
+                "()": create_queue_handler,
+                "filters": ["sampling"],
+                "output_format": log.format,
+                "filename": log.file,
+                "max_bytes": log.file_max_bytes,
+                "backup_count": log.file_backup_count,
+            },
         },
-        "uvicorn.access": {
+        "root": {
             "level": "INFO",
-            "handlers": ["console", "file"],
-            "propagate": False,
+            "handlers": ["queue"],
         },
-        "httpx": {
-            "level": "ERROR",
-            "handlers": ["console", "file"],
-            "propagate": False,
+        "loggers": {
+            "uvicorn": {
+                "level": "INFO",
+                "handlers": ["queue"],
+                "propagate": False,
+            },
+            "uvicorn.error": {
+                "level": "INFO",
+                "handlers": ["queue"],
+                "propagate": False,
+            },
+            "uvicorn.access": {
+                "level": "INFO",
+                "handlers": ["queue"],
+                "propagate": False,
+            },
+            "httpx": {
+                "level": "ERROR",
+                "handlers": ["queue"],
+                "propagate": False,
+            },
+            "infrastructure.openweather": {
+                "level": log.upstream_level,
+                "handlers": ["queue"],
+                "propagate": False,
+            }
         },
-        "infrastructure.openweather": {
-            "level": "DEBUG",
-            "handlers": ["console", "file"],
-            "propagate": False,
-        }
-    },
-}
+    }
+
+
+# client_api/log_config.py
+
+LOG_CONFIG = create_log_config(settings.log)
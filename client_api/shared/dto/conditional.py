@@ -0,0 +1,51 @@
+import time
+from email.utils import formatdate, parsedate_to_datetime
+
+from fastapi import Response
+
+
+def cache_headers(dt: int | None, stale_at: float | None) -> dict[str, str]:
+    """
+    - ETag, Last-Modified: upstream 데이터 계산 시각(dt) 기준. dt가 같으면 같은 데이터
+    - Cache-Control: soft ttl까지 남은 시간 (stale 값은 0)
+    """
+    max_age = max(0, int(stale_at - time.time())) if stale_at else 0
+    headers = {"Cache-Control": f"public, max-age={max_age}"}
+    if dt:
+        headers["ETag"] = _etag(dt)
+        headers["Last-Modified"] = formatdate(dt, usegmt=True)
+    return headers
+
+
+def is_not_modified(dt: int | None, if_none_match: str | None, if_modified_since: str | None) -> bool:
+    """
+    If-None-Match가 있으면 If-Modified-Since는 무시 (RFC 9110 13.2.2)
+    """
+    if not dt:
+        return False
+    if if_none_match is not None:
+        tags = {_opaque_tag(it) for it in if_none_match.split(",")}
+        return "*" in tags or _opaque_tag(_etag(dt)) in tags
+    if if_modified_since:
+        try:
+            return dt <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def not_modified_response(headers: dict[str, str]) -> Response:
+    return Response(status_code=304, headers=headers)
+
+
+# MARK: - private
+def _etag(dt: int) -> str:
+    return f'W/"{dt:x}"'
+
+
+def _opaque_tag(tag: str) -> str:
+    """
+    weak 비교 (W/ 무시)
+    """
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
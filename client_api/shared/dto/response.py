@@ -13,4 +13,11 @@ class ServerResponse(BaseModel, Generic[T]):
 
     @classmethod
     def error(cls, message: str) -> "ServerResponse[None]":
-        return cls(message=message, payload=None)
\ No newline at end of file
+        return cls(message=message, payload=None)
+
+    @staticmethod
+    def render_success(payload: bytes) -> bytes:
+        """
+        이미 직렬화된 payload로 success 응답 생성
+        """
+        return b'{"message":"success","payload":' + payload + b'}'
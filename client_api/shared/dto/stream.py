@@ -0,0 +1,33 @@
+from typing import AsyncIterator
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+SSE_MEDIA_TYPE = "text/event-stream"
+
+
+def is_stream_accepted(accept: str | None) -> bool:
+    return bool(accept) and (NDJSON_MEDIA_TYPE in accept or SSE_MEDIA_TYPE in accept)
+
+
+def stream_response(items: AsyncIterator[BaseModel], accept: str) -> StreamingResponse:
+    """
+    항목을 조회가 끝나는 대로 전송
+    - application/x-ndjson: 항목당 한 줄의 json
+    - text/event-stream: 항목당 하나의 `data` 이벤트, 마지막에 `end` 이벤트
+    """
+    if SSE_MEDIA_TYPE in accept:
+        return StreamingResponse(_sse(items), media_type=SSE_MEDIA_TYPE, headers={"Cache-Control": "no-cache"})
+    return StreamingResponse(_ndjson(items), media_type=NDJSON_MEDIA_TYPE)
+
+
+async def _ndjson(items: AsyncIterator[BaseModel]) -> AsyncIterator[str]:
+    async for item in items:
+        yield item.model_dump_json() + "\n"
+
+
+async def _sse(items: AsyncIterator[BaseModel]) -> AsyncIterator[str]:
+    async for item in items:
+        yield f"data: {item.model_dump_json()}\n\n"
+    yield "event: end\ndata: {}\n\n"
@@ -1,8 +1,9 @@
 import logging
-from fastapi import Request, FastAPI, HTTPException
+from fastapi import Request, FastAPI, HTTPException, status
 from fastapi.responses import JSONResponse
 
 from client_api.shared.dto.response import ServerResponse
+from domain.weather.error import WeatherNotFoundError
 from infrastructure.openweather import BaseOpenWeatherError
 
 
@@ -17,6 +18,20 @@ async def openweather_error_handler(request: Request, exc: BaseOpenWeatherError)
     )
 
 
+async def weather_not_found_error_handler(request: Request, exc: WeatherNotFoundError) -> JSONResponse:
+    """
+    negative cache로 upstream 호출 없이 판단한 경우
+    """
+    status_code = status.HTTP_404_NOT_FOUND
+    message = str(exc)
+    _print_log(status_code, message)
+    response = ServerResponse.error(message=message)
+    return JSONResponse(
+        status_code=status_code,
+        content=response.model_dump(),
+    )
+
+
 async def common_error_handler(request: Request, exc: Exception) -> JSONResponse:
     """
     Client에게 상세 에러 내용을 알려주지 않음
@@ -33,6 +48,7 @@ async def common_error_handler(request: Request, exc: Exception) -> JSONResponse
 
 def register_exception_handlers(app: FastAPI) -> None:
     app.add_exception_handler(BaseOpenWeatherError, openweather_error_handler)
+    app.add_exception_handler(WeatherNotFoundError, weather_not_found_error_handler)
     app.add_exception_handler(Exception, common_error_handler)
 
 
@@ -0,0 +1,44 @@
+import time
+
+from starlette.types import ASGIApp, Receive, Scope, Send, Message
+
+from infrastructure.metrics.prometheus import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_PROGRESS
+
+
+class MetricsMiddleware:
+    """
+    route별 요청 시간, 처리중인 요청 수
+    - route는 path template(ex. /weather/{city}) 사용, 일치하는 route가 없으면 unmatched (label 수 제한)
+    - 응답 본문 전송(스트리밍 포함)이 끝날 때까지의 시간
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_progress.dec()
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.labels(
+                method,
+                route.path if route else "unmatched",
+                str(status),
+            ).observe(time.perf_counter() - started)
@@ -0,0 +1,75 @@
+import json
+import logging
+import time
+
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Receive, Scope, Send, Message
+
+from client_api.settings import ServerTimingSettings
+from infrastructure.metrics.timing import request_timings
+
+logger = logging.getLogger(__name__)
+
+
+class ServerTimingMiddleware:
+    """
+    요청 처리 중 기록된 단계별 소요 시간을 Server-Timing 헤더로 응답
+    - ex. server-timing: cache_get;dur=1.2, upstream_fetch;dur=85.3, app;dur=90.1 (ms, 같은 단계는 합계)
+    - 헤더는 응답 시작 시점 기준 (스트리밍 응답은 이후 단계 제외)
+    - slow_request_threshold 이상 걸린 요청은 단계별 소요 시간, 횟수를 json 한 줄로 로그
+    """
+
+    def __init__(self, app: ASGIApp, slow_request_threshold: float):
+        self.app = app
+        self.slow_request_threshold = slow_request_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+        with request_timings() as timings:
+            async def send_wrapper(message: Message) -> None:
+                nonlocal status
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+                    header = _server_timing(timings, time.perf_counter() - started)
+                    message["headers"] = [*message.get("headers", []), (b"server-timing", header.encode())]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                elapsed = time.perf_counter() - started
+                if elapsed >= self.slow_request_threshold:
+                    _log_slow_request(scope, status, elapsed, timings)
+
+
+def register_server_timing(app: FastAPI, settings: ServerTimingSettings) -> None:
+    """
+    비활성화 시 middleware를 등록하지 않음 (단계별 시간은 Prometheus에만 기록)
+    """
+    if settings.enabled:
+        app.add_middleware(ServerTimingMiddleware, slow_request_threshold=settings.slow_request_threshold)
+
+
+def _server_timing(timings: dict[str, list[float]], elapsed: float) -> str:
+    metrics = [f"{name};dur={total * 1000:.1f}" for name, (total, _) in timings.items()]
+    metrics.append(f"app;dur={elapsed * 1000:.1f}")
+    return ", ".join(metrics)
+
+
+def _log_slow_request(scope: Scope, status: int, elapsed: float, timings: dict[str, list[float]]) -> None:
+    logger.warning(json.dumps({
+        "event": "slow_request",
+        "method": scope["method"],
+        "path": scope["path"],
+        "status": status,
+        "duration_ms": round(elapsed * 1000, 1),
+        "stages": {
+            name: {"duration_ms": round(total * 1000, 1), "count": int(count)}
+            for name, (total, count) in timings.items()
+        },
+    }, ensure_ascii=False))
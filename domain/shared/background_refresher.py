@@ -0,0 +1,56 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from domain.shared.deadline import deadline_scope
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BackgroundRefresherStats:
+    scheduled: int = 0
+    skipped: int = 0  # 이미 갱신중이거나 동시 실행 수 제한으로 실행하지 않음
+    failed: int = 0
+
+
+class BackgroundRefresher:
+    """
+    응답을 기다리지 않는 백그라운드 갱신 작업 관리
+    - 같은 key는 동시에 하나만 실행
+    - 동시에 실행 가능한 작업 수 제한
+    """
+
+    def __init__(self, max_in_flight: int):
+        self.max_in_flight = max_in_flight
+        self.stats = BackgroundRefresherStats()
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def schedule(self, key: str, fn: Callable[[], Awaitable[object]]) -> bool:
+        if key in self._tasks or len(self._tasks) >= self.max_in_flight:
+            self.stats.skipped += 1
+            return False
+
+        task = asyncio.create_task(self._run(key, fn))
+        self._tasks[key] = task
+        task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        self.stats.scheduled += 1
+        return True
+
+    def in_flight(self) -> int:
+        return len(self._tasks)
+
+    async def close(self) -> None:
+        for task in list(self._tasks.values()):
+            task.cancel()
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    async def _run(self, key: str, fn: Callable[[], Awaitable[object]]) -> None:
+        try:
+            # 예약한 요청의 deadline과 관계없이 실행
+            with deadline_scope(None):
+                await fn()
+        except Exception as e:
+            self.stats.failed += 1
+            logger.warning("[BackgroundRefresher] failed key: %s error: %s", key, e)
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+
+
+class LeaderLease(ABC):
+    """
+    여러 worker 중 하나만 실행해야 하는 주기 작업의 실행 권한
+    lease를 가진 worker가 종료되면 ttl 이후 다른 worker가 획득
+    """
+
+    @abstractmethod
+    async def acquire(self) -> bool:
+        """
+        lease 획득 또는 갱신. 반환값: 이번 주기에 작업을 실행해도 되는지 여부
+        """
+        pass
+
+    @abstractmethod
+    async def release(self) -> None:
+        pass
@@ -0,0 +1,95 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+@dataclass
+class MicroBatcherStats:
+    batches: int = 0  # 실행된 batch 수
+    items: int = 0  # batch로 처리한 전체 요청 수
+    max_batch_size: int = 0
+
+
+class MicroBatcher(Generic[K, V]):
+    """
+    짧은 시간(window) 동안 들어온 요청을 모아서 하나의 batch 작업으로 실행
+
+    - 첫 요청이 들어오고 window가 지나거나, max_size만큼 모이면 실행
+    - fn은 요청 순서대로 결과(값 또는 예외)를 반환, 예외는 해당 요청의 호출자에게만 전달
+    - batch 작업은 task로 분리되어 있어 일부 호출자가 취소되어도 나머지 호출자에게 영향 없음
+    - batch 작업은 batch를 시작한 호출자의 context(요청 deadline 등)에서 실행
+    """
+
+    def __init__(
+            self,
+            fn: Callable[[list[K]], Awaitable[list[V | BaseException]]],
+            window: float,
+            max_size: int,
+    ):
+        self.fn = fn
+        self.window = window
+        self.max_size = max_size
+        self.stats = MicroBatcherStats()
+        self._pending: list[tuple[K, asyncio.Future[V]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, key: K) -> V:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((key, future))
+        if len(self._pending) >= self.max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    async def close(self) -> None:
+        self._flush()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _flush(self) -> None:
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        # 이미 취소된 호출자의 요청은 제외
+        batch = [(key, future) for key, future in self._pending if not future.done()]
+        self._pending = []
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[K, asyncio.Future[V]]]) -> None:
+        self.stats.batches += 1
+        self.stats.items += len(batch)
+        self.stats.max_batch_size = max(self.stats.max_batch_size, len(batch))
+        try:
+            results = await self.fn([key for key, _ in batch])
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            results = [e] * len(batch)
+        self._resolve(batch, results)
+
+    @staticmethod
+    def _resolve(batch: list[tuple[K, asyncio.Future[V]]], results: list[V | BaseException]) -> None:
+        for (_, future), result in zip(batch, results, strict=True):
+            if future.done():
+                continue
+            if isinstance(result, asyncio.CancelledError):
+                future.cancel()
+            elif isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
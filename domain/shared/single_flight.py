@@ -0,0 +1,67 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    flights: int = 0  # 실제로 실행된 작업 수
+    callers: int = 0  # 작업 결과를 받은 전체 호출자 수
+    shared: int = 0  # 다른 호출자의 작업에 합류한 호출자 수
+    errors: int = 0  # 에러로 끝난 작업 수
+    max_callers: int = 0  # 하나의 작업이 처리한 최대 호출자 수
+
+
+class _Flight(Generic[T]):
+    def __init__(self, task: asyncio.Task[T]):
+        self.task = task
+        self.callers = 1
+
+
+class SingleFlight(Generic[T]):
+    """
+    같은 key로 동시에 들어온 요청을 하나의 작업으로 합침
+
+    - 먼저 들어온 호출자가 작업(task)을 시작하고, 이후 호출자는 같은 task의 결과를 공유
+    - 에러도 동일하게 모든 호출자에게 전달
+    - 작업은 task로 분리되어 있어 일부 호출자가 취소되어도 나머지 호출자에게 영향 없음
+    """
+
+    def __init__(self):
+        self._flights: dict[str, _Flight[T]] = {}
+        self.stats = SingleFlightStats()
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        flight = self._flights.get(key)
+        if flight:
+            flight.callers += 1
+            self.stats.shared += 1
+        else:
+            flight = _Flight(asyncio.ensure_future(fn()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._finish(key, flight))
+
+        return await asyncio.shield(flight.task)
+
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    def _finish(self, key: str, flight: _Flight[T]) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+        self.stats.flights += 1
+        self.stats.callers += flight.callers
+        self.stats.max_callers = max(self.stats.max_callers, flight.callers)
+
+        # 모든 호출자가 취소된 경우에도 "exception was never retrieved" 경고가 발생하지 않도록 조회
+        if not flight.task.cancelled() and flight.task.exception():
+            self.stats.errors += 1
+
+        if flight.callers > 1:
+            logger.debug("[SingleFlight] key: %s callers: %s", key, flight.callers)
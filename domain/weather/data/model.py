@@ -1,4 +1,6 @@
+import time
 from dataclasses import dataclass
+from enum import Enum
 
 
 @dataclass(frozen=True)
@@ -10,3 +12,54 @@ class Weather:
 
     city: str
     conditions: list[Condition]
+    dt: int | None = None  # upstream 데이터 계산 시각, unix, UTC
+    city_id: int | None = None  # upstream 도시 ID (있으면 캐시는 도시 ID 기준으로 저장, 요청한 도시 이름은 alias)
+    stale_at: float | None = None  # soft ttl 만료 시각, unix, UTC. 이후에는 stale 값으로 응답하며 갱신
+    expires_at: float | None = None  # hard ttl 만료 시각, unix, UTC (캐시에서 조회한 경우에만 존재)
+
+    @property
+    def is_stale(self) -> bool:
+        return self.stale_at is not None and time.time() >= self.stale_at
+
+
+@dataclass(frozen=True)
+class WeatherNotFound:
+    """
+    존재하지 않는 도시 (negative cache)
+    """
+    city: str  # 요청한 도시 이름
+    expires_at: float | None = None  # 캐시 만료 시각, unix, UTC (캐시에서 조회한 경우에만 존재)
+
+
+@dataclass(frozen=True)
+class RenderedWeather:
+    """
+    표현 계층에서 미리 직렬화한 응답 (캐시 hit 시 역직렬화, 재직렬화 없이 그대로 응답)
+    """
+    city: str  # 요청한 도시 이름
+    body: bytes
+    stale_at: float  # soft ttl 만료 시각, unix, UTC. 이후에는 사용하지 않음
+    dt: int | None = None  # upstream 데이터 계산 시각, unix, UTC
+
+    @property
+    def is_stale(self) -> bool:
+        return time.time() >= self.stale_at
+
+
+@dataclass(frozen=True)
+class WeatherBatchItem:
+    """
+    배치 조회의 도시별 결과
+    """
+
+    class Status(str, Enum):
+        SUCCESS = "success"
+        NOT_FOUND = "not_found"
+        UNAVAILABLE = "unavailable"  # upstream 장애
+        TIMEOUT = "timeout"  # 배치 조회 제한 시간 초과
+        ERROR = "error"
+
+    city: str  # 요청한 도시 이름
+    status: Status
+    weather: Weather | None = None
+    message: str | None = None
@@ -1,9 +1,44 @@
+import math
+
 from pydantic import BaseModel
 
 
+def normalize_city(city: str) -> str:
+    """
+    대소문자, 앞뒤 공백만 다른 도시 이름을 같은 도시로 취급하기 위한 정규화
+    """
+    return city.strip().lower()
+
+
 class WeatherByCityQuery(BaseModel):
     city: str
 
 
 class WeatherListByCitiesQuery(BaseModel):
     cities: list[str]
+
+
+class WeatherByCoordQuery(BaseModel):
+    lat: float  # -90 ~ 90
+    lon: float  # -180 ~ 180
+
+    def quantize(self, cell_size: float) -> "WeatherByCoordQuery":
+        """
+        cell_size(도) 격자의 중심 좌표로 변환 (같은 격자 안의 좌표는 같은 캐시 항목, 같은 upstream 조회 사용)
+        cell_size가 0 이하이면 변환하지 않음
+        """
+        if cell_size <= 0:
+            return self
+        lat_index = min(math.floor((self.lat + 90) / cell_size), math.ceil(180 / cell_size) - 1)
+        lon_index = math.floor(((self.lon + 180) % 360) / cell_size)
+        return WeatherByCoordQuery(
+            lat=round(min(-90 + (lat_index + 0.5) * cell_size, 90), 6),
+            lon=round(min(-180 + (lon_index + 0.5) * cell_size, 180), 6),
+        )
+
+    @property
+    def cell_key(self) -> str:
+        """
+        캐시 key (quantize된 좌표에 사용)
+        """
+        return f"{self.lat},{self.lon}"
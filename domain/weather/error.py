@@ -0,0 +1,13 @@
+class WeatherProviderUnavailableError(Exception):
+    """
+    날씨 제공자의 일시적인 장애 (5xx, timeout 등)
+    마지막으로 조회한 값이 있다면 대신 응답할 수 있음
+    """
+    pass
+
+
+class WeatherNotFoundError(Exception):
+    """
+    존재하지 않는 도시
+    """
+    pass
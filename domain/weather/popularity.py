@@ -0,0 +1,61 @@
+from abc import ABC, abstractmethod
+from collections import Counter
+
+from domain.weather.data.query import normalize_city
+
+
+class WeatherPopularityRepository(ABC):
+    """
+    도시별 요청 빈도 (모든 worker 합산)
+    """
+
+    @abstractmethod
+    async def increment(self, counts: dict[str, int]) -> None:
+        pass
+
+    @abstractmethod
+    async def top(self, n: int) -> list[str]:
+        """
+        요청 빈도가 높은 순서로 n개의 도시 (정규화된 이름)
+        """
+        pass
+
+    @abstractmethod
+    async def decay(self, factor: float, max_size: int) -> None:
+        """
+        오래된 요청의 영향을 줄이기 위해 모든 빈도에 factor를 곱하고, 상위 max_size개만 유지
+        """
+        pass
+
+
+class WeatherPopularity:
+    """
+    요청 경로에서는 프로세스 내 카운터만 증가시키고, 주기적으로(flush) 저장소에 합산
+    """
+
+    def __init__(self, repository: WeatherPopularityRepository, max_pending: int = 10_000):
+        self.repository = repository
+        self.max_pending = max_pending  # flush 전까지 보관할 최대 도시 수
+        self._pending: Counter[str] = Counter()
+
+    def record(self, *cities: str) -> None:
+        for city in cities:
+            key = normalize_city(city)
+            if key in self._pending or len(self._pending) < self.max_pending:
+                self._pending[key] += 1
+
+    async def flush(self) -> None:
+        pending, self._pending = self._pending, Counter()
+        try:
+            await self.repository.increment(dict(pending))
+        except Exception:
+            # 저장 실패 시 다음 flush에 다시 합산
+            pending.update(self._pending)
+            self._pending = pending
+            raise
+
+    async def top(self, n: int) -> list[str]:
+        return await self.repository.top(n)
+
+    async def decay(self, factor: float, max_size: int) -> None:
+        await self.repository.decay(factor, max_size)
@@ -1,10 +1,28 @@
+import asyncio
 from abc import ABC, abstractmethod
 
 from domain.weather.data.model import Weather
-from domain.weather.data.query import WeatherByCityQuery
+from domain.weather.data.query import WeatherByCityQuery, WeatherByCoordQuery
 
 
 class WeatherProvider(ABC):
+    # get_many가 한 번의 upstream 호출로 여러 도시를 조회하는지 여부 (true면 service에서 cache miss를 모아서 get_many로 조회)
+    supports_batch: bool = False
+
     @abstractmethod
     async def get(self, query: WeatherByCityQuery) -> Weather:
         pass
+
+    async def get_many(self, queries: list[WeatherByCityQuery]) -> list[Weather | BaseException]:
+        """
+        여러 도시 조회. 요청 순서대로 날씨 또는 도시별 예외(not found, unavailable 등) 반환
+        기본 구현은 도시마다 get, 한 번에 조회할 수 있는 provider는 override
+        """
+        return await asyncio.gather(*(self.get(query) for query in queries), return_exceptions=True)
+
+    @abstractmethod
+    async def get_by_coord(self, query: WeatherByCoordQuery) -> Weather:
+        """
+        좌표로 조회 (가장 가까운 관측 지점의 날씨)
+        """
+        pass
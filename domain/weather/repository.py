@@ -1,19 +1,79 @@
 from abc import ABC, abstractmethod
 
-from domain.weather.data.model import Weather
-from domain.weather.data.query import WeatherListByCitiesQuery, WeatherByCityQuery
+from domain.weather.data.model import Weather, WeatherNotFound, RenderedWeather
+from domain.weather.data.query import WeatherListByCitiesQuery, WeatherByCityQuery, WeatherByCoordQuery
 
 
 class WeatherCacheRepository(ABC):
 
     @abstractmethod
-    async def save_weather_city(self, weather: Weather, ttl: int) -> None:
+    async def save_weather_city(self, weather: Weather, ttl: int, alias: str | None = None) -> None:
+        """
+        alias: 요청한 도시 이름 (upstream이 반환한 weather.city와 다를 수 있음, ex. "Seoul,KR" -> "Seoul")
+            없으면 weather.city. 이후 alias로 조회해도 같은 값 조회
+        """
         pass
 
     @abstractmethod
-    async def get_weather_city(self, query: WeatherByCityQuery) -> Weather | None:
+    async def save_weather_cities(self, weathers: list[Weather], ttl: int, aliases: list[str] | None = None) -> None:
+        """
+        여러 도시를 한 번에 저장 (배치 조회 결과 저장용)
+        aliases: weathers와 같은 순서의 요청한 도시 이름
+        """
         pass
 
     @abstractmethod
-    async def get_weather_cities(self, query: WeatherListByCitiesQuery) -> list[Weather]:
+    async def save_weather_city_not_found(self, city: str, ttl: int) -> None:
+        pass
+
+    @abstractmethod
+    async def get_weather_city(self, query: WeatherByCityQuery) -> Weather | WeatherNotFound | None:
+        pass
+
+    @abstractmethod
+    async def get_weather_cities(self, query: WeatherListByCitiesQuery) -> list[Weather | WeatherNotFound | None]:
+        """
+        요청 순서대로 반환, 캐시에 없는 도시는 None
+        """
+        pass
+
+    # MARK: - fetch lease (opt-in)
+    async def acquire_fetch_lease(self, query: WeatherByCityQuery) -> str | None:
+        """
+        cache miss 시 upstream 조회 권한(lease) 획득
+        - 반환값: lease token, 다른 프로세스가 이미 조회중이면 None
+        - lease를 지원하지 않는 구현체는 항상 획득 성공
+        """
+        return ""
+
+    async def release_fetch_lease(self, query: WeatherByCityQuery, token: str) -> None:
+        pass
+
+    async def wait_weather_city(self, query: WeatherByCityQuery) -> Weather | WeatherNotFound | None:
+        """
+        lease를 가진 프로세스가 캐시에 저장할 때까지 대기
+        lease가 사라졌는데 저장된 값이 없거나(lease holder 종료) 대기 시간이 지나면 None
+        """
+        return None
+
+    # MARK: - rendered response (opt-in)
+    async def get_rendered_weather_city(self, query: WeatherByCityQuery) -> RenderedWeather | None:
+        """
+        날씨와 함께 저장된 응답 조각 조회
+        지원하지 않는 구현체는 항상 None (일반 조회 경로 사용)
+        """
+        return None
+
+    async def get_rendered_weather_cities(self, query: WeatherListByCitiesQuery) -> list[RenderedWeather]:
+        return []
+
+    # MARK: - coordinate (opt-in)
+    async def get_weather_coord(self, query: WeatherByCoordQuery) -> Weather | None:
+        """
+        query: 격자 중심 좌표 (WeatherByCoordQuery.quantize)
+        지원하지 않는 구현체는 항상 None (매번 upstream 조회)
+        """
+        return None
+
+    async def save_weather_coord(self, query: WeatherByCoordQuery, weather: Weather, ttl: int) -> None:
         pass
@@ -1,10 +1,27 @@
 import asyncio
+import contextlib
+import logging
+import time
 from abc import ABC, abstractmethod
+from dataclasses import replace
+from typing import AsyncIterator
 
-from domain.weather.data.model import Weather
-from domain.weather.data.query import WeatherByCityQuery, WeatherListByCitiesQuery
+from domain.shared.background_refresher import BackgroundRefresher
+from domain.shared.micro_batcher import MicroBatcher
+from domain.shared.single_flight import SingleFlight
+from domain.weather.data.model import Weather, WeatherNotFound, WeatherBatchItem, RenderedWeather
+from domain.weather.data.query import (
+    WeatherByCityQuery,
+    WeatherByCoordQuery,
+    WeatherListByCitiesQuery,
+    normalize_city,
+)
+from domain.weather.error import WeatherProviderUnavailableError, WeatherNotFoundError
 from domain.weather.provider import WeatherProvider
 from domain.weather.repository import WeatherCacheRepository
+from domain.weather.settings import WeatherSettings
+
+logger = logging.getLogger(__name__)
 
 
 class IWeatherService(ABC):
@@ -13,45 +30,356 @@ class IWeatherService(ABC):
         pass
 
     @abstractmethod
-    async def get_weather_cities(self, query: WeatherListByCitiesQuery) -> list[Weather]:
+    async def get_weather_coord(self, query: WeatherByCoordQuery) -> Weather:
+        """
+        좌표를 settings.coord_cell_size 격자로 양자화하여 조회 (같은 격자 안의 좌표는 캐시, upstream 조회 공유)
+        """
+        pass
+
+    @abstractmethod
+    async def get_weather_cities(self, query: WeatherListByCitiesQuery) -> list[WeatherBatchItem]:
+        """
+        도시별 성공/실패 결과를 요청 순서대로 반환 (대소문자, 공백만 다른 도시는 하나로 합침)
+        """
+        pass
+
+    @abstractmethod
+    def iter_weather_cities(self, query: WeatherListByCitiesQuery) -> AsyncIterator[WeatherBatchItem]:
+        """
+        get_weather_cities의 스트리밍 버전. 캐시된 도시를 먼저 반환하고, 나머지는 조회가 끝나는 순서대로 반환
+        """
+        pass
+
+    @abstractmethod
+    async def refresh_weather_city(self, city: str) -> Weather:
+        """
+        캐시 상태와 관계없이 upstream에서 조회하여 저장 (cache warm-up용)
+        """
+        pass
+
+    @abstractmethod
+    async def get_rendered_weather_city(self, query: WeatherByCityQuery) -> RenderedWeather | None:
+        """
+        캐시된 응답 조각 조회. 없거나 soft ttl이 지났으면 None (get_weather_city로 조회, 갱신)
+        """
+        pass
+
+    @abstractmethod
+    async def get_rendered_weather_cities(
+            self,
+            query: WeatherListByCitiesQuery,
+    ) -> list[RenderedWeather | WeatherBatchItem]:
+        """
+        캐시된 응답 조각이 있는 도시는 RenderedWeather, 나머지는 get_weather_cities 결과 (요청 순서)
+        """
         pass
 
 
+def create_weather_batcher(
+        weather_provider: WeatherProvider,
+        settings: WeatherSettings,
+) -> MicroBatcher[WeatherByCityQuery, Weather]:
+    return MicroBatcher(
+        weather_provider.get_many,
+        window=settings.upstream_batch_window,
+        max_size=settings.upstream_batch_max_size,
+    )
+
+
+class _WeatherWriteBack:
+    """
+    배치 조회 중 upstream에서 조회한 날씨를 모아서 한 번에 저장
+    저장(flush) 이후에 끝난 조회는 각자 저장
+    """
+
+    def __init__(self):
+        self.weathers: list[Weather] = []
+        self.aliases: list[str] = []  # 요청한 도시 이름 (weathers와 같은 순서)
+        self.leases: list[tuple[WeatherByCityQuery, str]] = []  # 저장 후 해제할 fetch lease
+        self.closed = False
+
+    def add(self, weather: Weather, query: WeatherByCityQuery, token: str | None) -> None:
+        self.weathers.append(weather)
+        self.aliases.append(query.city)
+        if token:
+            self.leases.append((query, token))
+
+
 class WeatherService(IWeatherService):
 
     def __init__(
             self,
             cache: WeatherCacheRepository,
             weather_provider: WeatherProvider,
+            single_flight: SingleFlight[Weather] | None = None,
+            refresher: BackgroundRefresher | None = None,
+            settings: WeatherSettings | None = None,
+            batcher: MicroBatcher[WeatherByCityQuery, Weather] | None = None,
     ):
         self.cache = cache
         self.weather_provider = weather_provider
+        self.settings = settings or WeatherSettings()
+        # 요청마다 service가 생성되므로, 프로세스 단위로 공유하려면 외부에서 주입
+        self.single_flight = single_flight or SingleFlight()
+        self.refresher = refresher or BackgroundRefresher(self.settings.max_background_refresh)
+        # upstream 조회를 모아서 weather_provider.get_many로 실행 (배치 조회의 cache miss, 동시에 들어온 단건 cache miss)
+        self.batcher = batcher
+        if self.batcher is None and weather_provider.supports_batch and self.settings.upstream_batch_window > 0:
+            self.batcher = create_weather_batcher(weather_provider, self.settings)
 
     async def get_weather_city(self, query: WeatherByCityQuery) -> Weather:
         cached_weather = await self.cache.get_weather_city(query)
-        if cached_weather:
+        if not cached_weather:
+            return await self._get_weather(query.city)
+        if isinstance(cached_weather, WeatherNotFound):
+            raise WeatherNotFoundError(f"not found. city: {query.city}")
+        if not cached_weather.is_stale:
             return cached_weather
-        return await self._get_weather(query.city)
+        return await self._revalidate(cached_weather, query.city)
 
-    async def get_weather_cities(self, query: WeatherListByCitiesQuery) -> list[Weather]:
-        cached_weathers = await self.cache.get_weather_cities(query)
-        cached_cities_set = {weather.city for weather in cached_weathers}
+    async def get_weather_coord(self, query: WeatherByCoordQuery) -> Weather:
+        cell = query.quantize(self.settings.coord_cell_size)
+        cached_weather = await self.cache.get_weather_coord(cell)
+        if not cached_weather:
+            return await self._get_weather_coord(cell)
+        if not cached_weather.is_stale:
+            return cached_weather
+        if self.settings.stale_while_revalidate:
+            self.refresher.schedule(self._coord_key(cell), lambda: self._get_weather_coord(cell))
+            return cached_weather
+        return await self._get_weather_coord(cell, fallback=cached_weather)
 
-        missing_cities = [city for city in query.cities if city not in cached_cities_set]
+    async def get_weather_cities(self, query: WeatherListByCitiesQuery) -> list[WeatherBatchItem]:
+        cities = self._unique_cities(query.cities)
+        items = {normalize_city(item.city): item async for item in self.iter_weather_cities(query)}
+        return [items[key] for key in cities]
 
-        if missing_cities:
-            tasks = [self._get_weather(city) for city in missing_cities]
-            fetched_weathers = await asyncio.gather(*tasks)
-        else:
-            fetched_weathers = []
+    async def iter_weather_cities(self, query: WeatherListByCitiesQuery) -> AsyncIterator[WeatherBatchItem]:
+        cities = self._unique_cities(query.cities)
+        if not cities:
+            return
+
+        completed_keys: set[str] = set()
+        fallbacks: dict[str, Weather] = {}
+        cached_weathers = await self.cache.get_weather_cities(WeatherListByCitiesQuery(cities=list(cities.values())))
+        for (key, city), cached in zip(cities.items(), cached_weathers):
+            if cached is None:
+                continue
+            if isinstance(cached, WeatherNotFound):
+                item = self._not_found_item(city)
+            elif not cached.is_stale:
+                item = WeatherBatchItem(city=city, status=WeatherBatchItem.Status.SUCCESS, weather=cached)
+            elif self.settings.stale_while_revalidate:
+                item = WeatherBatchItem(
+                    city=city,
+                    status=WeatherBatchItem.Status.SUCCESS,
+                    weather=await self._revalidate(cached, city),
+                )
+            else:
+                fallbacks[key] = cached
+                continue
+            completed_keys.add(key)
+            yield item
+
+        # batcher를 사용하면 upstream 호출 수는 batcher(provider.get_many)가 제한
+        semaphore = asyncio.Semaphore(self.settings.batch_concurrency) if self.batcher is None else None
+        write_back = _WeatherWriteBack()
+        tasks = {
+            asyncio.create_task(self._get_batch_item(city, semaphore, write_back, fallbacks.get(key))): city
+            for key, city in cities.items()
+            if key not in completed_keys
+        }
+        if not tasks:
+            return
+
+        # 제한 시간이 지나면 조회된 결과만 응답. 이미 시작된 upstream 조회는 single flight에서 계속 진행되어 캐시에 저장됨
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.settings.batch_deadline
+        pending = set(tasks)
+        try:
+            while pending and (timeout := deadline - loop.time()) > 0:
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            # 클라이언트 연결 종료 등으로 중단된 경우에도 남은 작업 정리, 조회된 결과 저장
+            for task in pending:
+                task.cancel()
+            await self._flush(write_back)
+
+        for task in pending:
+            yield WeatherBatchItem(
+                city=tasks[task],
+                status=WeatherBatchItem.Status.TIMEOUT,
+                message=f"timeout. deadline: {self.settings.batch_deadline}s",
+            )
+
+    async def refresh_weather_city(self, city: str) -> Weather:
+        return await self._get_weather(city)
+
+    async def get_rendered_weather_city(self, query: WeatherByCityQuery) -> RenderedWeather | None:
+        rendered = await self.cache.get_rendered_weather_city(query)
+        if rendered and not rendered.is_stale:
+            return rendered
+        return None
+
+    async def get_rendered_weather_cities(
+            self,
+            query: WeatherListByCitiesQuery,
+    ) -> list[RenderedWeather | WeatherBatchItem]:
+        cities = self._unique_cities(query.cities)
+        if not cities:
+            return []
 
-        return cached_weathers + fetched_weathers
+        rendered = await self.cache.get_rendered_weather_cities(WeatherListByCitiesQuery(cities=list(cities.values())))
+        hits = {normalize_city(it.city): it for it in rendered if not it.is_stale}
+        missing_cities = [city for key, city in cities.items() if key not in hits]
+        items = {}
+        if missing_cities:
+            items = {
+                normalize_city(item.city): item
+                for item in await self.get_weather_cities(WeatherListByCitiesQuery(cities=missing_cities))
+            }
+        return [hits.get(key) or items[key] for key in cities]
 
     # MARK: - private
-    async def _get_weather(self, city: str) -> Weather:
+    async def _revalidate(self, stale_weather: Weather, city: str) -> Weather:
+        """
+        soft ttl이 만료된 값 갱신
+        - stale_while_revalidate: stale 값으로 즉시 응답하고 백그라운드에서 갱신
+        - 그 외: 요청 경로에서 갱신하고, upstream 장애 시 stale 값으로 응답
+        """
+        if self.settings.stale_while_revalidate:
+            self.refresher.schedule(normalize_city(city), lambda: self._get_weather(city))
+            return stale_weather
+        return await self._get_weather(city, fallback=stale_weather)
+
+    @staticmethod
+    def _unique_cities(cities: list[str]) -> dict[str, str]:
+        """
+        정규화한 도시 이름 -> 처음 요청한 도시 이름 (요청 순서 유지)
+        """
+        unique_cities: dict[str, str] = {}
+        for city in cities:
+            unique_cities.setdefault(normalize_city(city), city)
+        return unique_cities
+
+    @staticmethod
+    def _not_found_item(city: str) -> WeatherBatchItem:
+        return WeatherBatchItem(
+            city=city,
+            status=WeatherBatchItem.Status.NOT_FOUND,
+            message=f"not found. city: {city}",
+        )
+
+    async def _get_batch_item(
+            self,
+            city: str,
+            semaphore: asyncio.Semaphore | None,
+            write_back: _WeatherWriteBack,
+            fallback: Weather | None = None,
+    ) -> WeatherBatchItem:
+        """
+        배치 조회에서는 도시별 실패가 전체 요청을 실패시키지 않도록 결과로 변환
+        """
+        async with semaphore or contextlib.nullcontext():
+            try:
+                weather = await self._get_weather(city, fallback=fallback, write_back=write_back)
+                return WeatherBatchItem(city=city, status=WeatherBatchItem.Status.SUCCESS, weather=weather)
+            except WeatherNotFoundError:
+                return self._not_found_item(city)
+            except WeatherProviderUnavailableError as e:
+                return WeatherBatchItem(city=city, status=WeatherBatchItem.Status.UNAVAILABLE, message=str(e))
+            except Exception as e:
+                logger.error("[WeatherService] batch item failed city: %s error: %s", city, e)
+                return WeatherBatchItem(city=city, status=WeatherBatchItem.Status.ERROR, message="Unknown error")
+
+    async def _get_weather(
+            self,
+            city: str,
+            fallback: Weather | None = None,
+            write_back: _WeatherWriteBack | None = None,
+    ) -> Weather:
         """
         날씨 조회 + 캐시 저장
+        같은 도시에 대한 동시 cache miss는 하나의 upstream 조회로 합침
         """
-        weather = await self.weather_provider.get(WeatherByCityQuery(city=city))
-        await self.cache.save_weather_city(weather, 600)
+        try:
+            return await self.single_flight.do(
+                normalize_city(city),
+                lambda: self._fetch_weather(city, write_back),
+            )
+        except WeatherProviderUnavailableError as e:
+            if not (fallback and self.settings.serve_stale_on_error):
+                raise
+            logger.warning("[WeatherService] serve stale weather city: %s error: %s", city, e)
+            return fallback
+
+    async def _fetch_weather(self, city: str, write_back: _WeatherWriteBack | None = None) -> Weather:
+        """
+        여러 worker 간 중복 조회 방지를 위해 fetch lease를 획득한 경우에만 upstream 조회
+        lease를 획득하지 못하면 다른 worker가 저장한 값을 기다리고, lease holder가 종료된 경우에만 직접 조회
+        write_back이 있으면 저장을 미루고, lease는 저장 후 해제
+        """
+        query = WeatherByCityQuery(city=city)
+        token = await self.cache.acquire_fetch_lease(query)
+        if token is None:
+            weather = await self.cache.wait_weather_city(query)
+            if isinstance(weather, WeatherNotFound):
+                raise WeatherNotFoundError(f"not found. city: {city}")
+            if weather:
+                return weather
+            token = await self.cache.acquire_fetch_lease(query)
+
+        try:
+            try:
+                weather = await (self.batcher.load(query) if self.batcher else self.weather_provider.get(query))
+            except WeatherNotFoundError:
+                # 존재하지 않는 도시 반복 조회로 인한 upstream 호출 방지
+                await self.cache.save_weather_city_not_found(city, self.settings.not_found_ttl)
+                raise
+            weather = replace(weather, stale_at=time.time() + self.settings.soft_ttl)
+            if write_back and not write_back.closed:
+                write_back.add(weather, query, token)
+                token = None
+            else:
+                await self.cache.save_weather_city(weather, self.settings.hard_ttl, alias=city)
+            return weather
+        finally:
+            if token:
+                await self.cache.release_fetch_lease(query, token)
+
+    @staticmethod
+    def _coord_key(cell: WeatherByCoordQuery) -> str:
+        """
+        single flight, 백그라운드 갱신 key (도시 이름과 구분)
+        """
+        return f"coord:{cell.cell_key}"
+
+    async def _get_weather_coord(self, cell: WeatherByCoordQuery, fallback: Weather | None = None) -> Weather:
+        """
+        격자 중심 좌표로 조회 + 캐시 저장, 같은 격자에 대한 동시 cache miss는 하나의 upstream 조회로 합침
+        """
+        try:
+            return await self.single_flight.do(self._coord_key(cell), lambda: self._fetch_weather_coord(cell))
+        except WeatherProviderUnavailableError as e:
+            if not (fallback and self.settings.serve_stale_on_error):
+                raise
+            logger.warning("[WeatherService] serve stale weather coord: %s error: %s", cell.cell_key, e)
+            return fallback
+
+    async def _fetch_weather_coord(self, cell: WeatherByCoordQuery) -> Weather:
+        weather = await self.weather_provider.get_by_coord(cell)
+        weather = replace(weather, stale_at=time.time() + self.settings.soft_ttl)
+        await self.cache.save_weather_coord(cell, weather, self.settings.hard_ttl)
         return weather
+
+    async def _flush(self, write_back: _WeatherWriteBack) -> None:
+        write_back.closed = True
+        try:
+            await self.cache.save_weather_cities(write_back.weathers, self.settings.hard_ttl, write_back.aliases)
+        finally:
+            await asyncio.gather(*[
+                self.cache.release_fetch_lease(query, token)
+                for query, token in write_back.leases
+            ])
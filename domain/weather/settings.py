@@ -0,0 +1,38 @@
+from pydantic import BaseModel
+
+
+class WeatherWarmerSettings(BaseModel):
+    """
+    prefix: WEATHER__WARMER__
+    요청 빈도가 높은 도시를 soft ttl 만료 전에 미리 갱신
+    """
+    enabled: bool = False
+    interval: float = 10  # seconds, 요청 수 합산, 갱신 주기
+    top_n: int = 100  # 갱신 대상 도시 수 (요청 빈도 상위)
+    refresh_ahead: float = 60  # seconds, soft ttl 만료까지 남은 시간이 이보다 적으면 갱신
+    concurrency: int = 5  # 동시 갱신 수
+    lease_ttl: float = 30  # seconds, leader worker 종료 시 다른 worker가 이어받기까지의 시간 (interval보다 길게)
+    decay_interval: float = 300  # seconds, 요청 빈도 감소 주기
+    decay_factor: float = 0.5
+    max_tracked: int = 10000  # 요청 빈도를 유지할 최대 도시 수
+
+
+class WeatherSettings(BaseModel):
+    """
+    prefix: WEATHER__
+    """
+    soft_ttl: int = 600  # seconds, 이후에는 stale 값으로 응답하고 백그라운드에서 갱신
+    hard_ttl: int = 3600  # seconds, 캐시에서 삭제되는 시간
+    stale_while_revalidate: bool = True  # false이면 soft ttl 만료 시 요청 경로에서 갱신
+    serve_stale_on_error: bool = True  # upstream 장애 시 hard ttl 이내의 값으로 응답
+    max_background_refresh: int = 10  # 동시에 실행 가능한 백그라운드 갱신 수
+    deadline: float = 10  # seconds, 단건 조회 요청의 upstream 조회 제한 시간 (재시도 포함)
+    not_found_ttl: int = 60  # seconds, 존재하지 않는 도시 캐시 시간
+    batch_max_size: int = 500  # 배치 조회 최대 도시 수
+    batch_concurrency: int = 20  # 배치 조회 1건당 동시 upstream 조회 수 (cache miss를 모아서 조회하지 않는 provider만 적용)
+    batch_deadline: float = 10  # seconds, 이후에는 조회된 결과만 응답
+    upstream_batch_window: float = 0.005  # seconds, 이 시간 동안 들어온 cache miss를 모아서 한 번에 조회 (0이면 도시마다 조회)
+    upstream_batch_max_size: int = 100  # 한 번에 모아서 조회할 최대 도시 수
+    coord_cell_size: float = 0.05  # degrees, 좌표 조회는 이 크기의 격자 단위로 캐시 공유 (0.05 ≒ 5.5km, 0이면 좌표별로 조회)
+    prerender: bool = False  # 캐시 저장 시 응답 json을 함께 저장하고, hit이면 직렬화 없이 그대로 응답
+    warmer: WeatherWarmerSettings = WeatherWarmerSettings()
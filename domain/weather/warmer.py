@@ -0,0 +1,126 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from domain.shared.leader_lease import LeaderLease
+from domain.weather.data.model import Weather, WeatherNotFound
+from domain.weather.data.query import WeatherListByCitiesQuery
+from domain.weather.popularity import WeatherPopularity
+from domain.weather.repository import WeatherCacheRepository
+from domain.weather.service import IWeatherService
+from domain.weather.settings import WeatherWarmerSettings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WeatherCacheWarmerStats:
+    runs: int = 0
+    leader_runs: int = 0  # leader로 warm-up을 실행한 주기 수
+    refreshed: int = 0
+    failed: int = 0
+
+
+class WeatherCacheWarmer:
+    """
+    요청 빈도가 높은 도시를 soft ttl 만료 전에 미리 갱신하여, 인기 도시는 요청 경로에서 cache miss/stale이 발생하지 않도록 유지
+
+    - 모든 worker: 주기마다 프로세스 내 요청 수를 저장소에 합산
+    - leader worker(하나): 상위 top_n 도시 중 soft ttl 만료가 refresh_ahead 이내이거나 캐시에 없는 도시 갱신
+    """
+
+    def __init__(
+            self,
+            popularity: WeatherPopularity,
+            lease: LeaderLease,
+            cache: WeatherCacheRepository,
+            service_factory: Callable[[], IWeatherService],
+            settings: WeatherWarmerSettings | None = None,
+    ):
+        self.popularity = popularity
+        self.lease = lease
+        self.cache = cache
+        self.service_factory = service_factory
+        self.settings = settings or WeatherWarmerSettings()
+        self.stats = WeatherCacheWarmerStats()
+        self._task: asyncio.Task | None = None
+        self._decayed_at = time.monotonic()
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._loop())
+
+    async def close(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await self.popularity.flush()
+            await self.lease.release()
+        except Exception as e:
+            logger.warning("[WeatherCacheWarmer] close failed: %s", e)
+
+    async def run_once(self) -> int:
+        """
+        반환값: 갱신을 시도한 도시 수
+        """
+        self.stats.runs += 1
+        await self.popularity.flush()
+        if not await self.lease.acquire():
+            return 0
+        self.stats.leader_runs += 1
+
+        if time.monotonic() - self._decayed_at >= self.settings.decay_interval:
+            await self.popularity.decay(self.settings.decay_factor, self.settings.max_tracked)
+            self._decayed_at = time.monotonic()
+
+        cities = await self.popularity.top(self.settings.top_n)
+        if not cities:
+            return 0
+        cached = dict(zip(cities, await self.cache.get_weather_cities(WeatherListByCitiesQuery(cities=cities))))
+        refresh_before = time.time() + self.settings.refresh_ahead
+        targets = [city for city in cities if self._should_refresh(cached.get(city), refresh_before)]
+        if targets:
+            await self._refresh(targets)
+        return len(targets)
+
+    # MARK: - private
+    @staticmethod
+    def _should_refresh(cached: Weather | WeatherNotFound | None, refresh_before: float) -> bool:
+        if cached is None:
+            return True
+        if isinstance(cached, WeatherNotFound):
+            return False
+        return cached.stale_at is None or cached.stale_at <= refresh_before
+
+    async def _refresh(self, cities: list[str]) -> None:
+        service = self.service_factory()
+        semaphore = asyncio.Semaphore(self.settings.concurrency)
+
+        async def refresh(city: str) -> None:
+            async with semaphore:
+                try:
+                    await service.refresh_weather_city(city)
+                    self.stats.refreshed += 1
+                except Exception as e:
+                    self.stats.failed += 1
+                    logger.warning("[WeatherCacheWarmer] refresh failed city: %s error: %s", city, e)
+
+        await asyncio.gather(*(refresh(city) for city in cities))
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.settings.interval)
+            try:
+                count = await self.run_once()
+                if count:
+                    logger.info("[WeatherCacheWarmer] refreshed cities: %s", count)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("[WeatherCacheWarmer] run failed: %s", e)
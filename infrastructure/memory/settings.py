@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+
+class LocalCacheSettings(BaseModel):
+    """
+    prefix: LOCAL_CACHE__
+    Redis 앞단의 프로세스 내 캐시(L1)
+    """
+    enabled: bool = True
+    max_size: int = 1000  # 프로세스당 최대 항목 수
+    ttl: float = 60  # seconds, Redis ttl이 더 짧으면 Redis ttl을 따름
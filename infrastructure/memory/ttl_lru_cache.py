@@ -0,0 +1,68 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+V = TypeVar("V")
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0  # 용량 초과로 삭제
+    expirations: int = 0  # ttl 만료로 삭제
+    invalidations: int = 0  # 외부 요청으로 삭제
+
+
+class TTLLRUCache(Generic[V]):
+    """
+    프로세스 내 메모리 캐시
+    - max_size를 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+    - 항목별 만료시각은 ttl과 expires_at 중 빠른 시각
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._items: OrderedDict[str, tuple[V, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: str) -> V | None:
+        item = self._items.get(key)
+        if item is None:
+            self.stats.misses += 1
+            return None
+
+        value, expires_at = item
+        if time.time() >= expires_at:
+            del self._items[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+
+        self._items.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def set(self, key: str, value: V, expires_at: float | None = None) -> None:
+        max_expires_at = time.time() + self.ttl
+        expires_at = min(expires_at, max_expires_at) if expires_at else max_expires_at
+
+        self._items[key] = (value, expires_at)
+        self._items.move_to_end(key)
+
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+            self.stats.evictions += 1
+
+    def delete(self, key: str) -> None:
+        if self._items.pop(key, None) is not None:
+            self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        self.stats.invalidations += len(self._items)
+        self._items.clear()
@@ -0,0 +1,221 @@
+import time
+from dataclasses import replace
+
+from domain.weather.data.model import Weather, WeatherNotFound, RenderedWeather
+from domain.weather.data.query import WeatherListByCitiesQuery, WeatherByCityQuery, WeatherByCoordQuery, normalize_city
+from domain.weather.repository import WeatherCacheRepository
+from infrastructure.memory.ttl_lru_cache import TTLLRUCache, CacheStats
+from infrastructure.metrics.prometheus import L1_HITS, L1_MISSES, L1_RENDERED_HITS, L1_RENDERED_MISSES
+from infrastructure.redis.weather_cache_invalidation import RedisWeatherCacheInvalidation
+
+
+class TieredWeatherCacheRepository(WeatherCacheRepository):
+    """
+    L1(프로세스 내 메모리) + L2(Redis 등 공유 캐시)
+    - 조회: L1 -> L2 순서로 조회하고, L2에서 찾은 값은 L1에 저장
+    - 저장: L2, L1에 저장 후 다른 worker의 L1 항목 삭제 요청
+    - 응답 조각(rendered): L2에서 조회한 값을 soft ttl 동안 L1에 저장, 날씨 저장 시 삭제
+    - city_id가 있는 날씨는 "id:{city_id}" 하나에 저장하고 도시 이름은 aliases에 city_id로 기록
+      (같은 도시의 여러 표기가 하나의 항목을 공유, 갱신/삭제 요청도 city_id 기준)
+    """
+
+    def __init__(
+            self,
+            l1: TTLLRUCache[Weather | WeatherNotFound],
+            aliases: TTLLRUCache[int],
+            l2: WeatherCacheRepository,
+            l2_stats: CacheStats,
+            invalidation: RedisWeatherCacheInvalidation | None = None,
+            rendered: TTLLRUCache[RenderedWeather] | None = None,
+    ):
+        self.l1 = l1
+        self.l2 = l2
+        self.l2_stats = l2_stats
+        self.invalidation = invalidation
+        self.rendered = rendered
+        # 정규화한 도시 이름 -> city_id, repository는 요청마다 생성되므로 l1과 같이 worker에서 공유
+        self.aliases = aliases
+
+    @staticmethod
+    def _id_key(city_id: int) -> str:
+        return f"id:{city_id}"
+
+    def _get_l1(self, name: str) -> Weather | WeatherNotFound | None:
+        """
+        이름별 항목(negative cache, city_id가 없는 날씨)이 우선, 없으면 city_id 항목
+        """
+        weather = self.l1.get(name)
+        # 같은 key의 도시 이름(ex. "id:1")으로 조회한 경우 city_id 항목은 무시
+        if weather and not (isinstance(weather, Weather) and weather.city_id):
+            return weather
+        city_id = self.aliases.get(name)
+        if city_id is None:
+            return None
+        weather = self.l1.get(self._id_key(city_id))
+        if isinstance(weather, Weather) and weather.city_id == city_id:
+            return weather
+        return None
+
+    def _set_l1(self, name: str, weather: Weather | WeatherNotFound, expires_at: float | None) -> None:
+        if isinstance(weather, Weather) and weather.city_id:
+            self.aliases.set(name, weather.city_id)
+            self.l1.set(self._id_key(weather.city_id), weather, expires_at=expires_at)
+        else:
+            self.l1.set(name, weather, expires_at=expires_at)
+
+    async def save_weather_city(self, weather: Weather, ttl: int, alias: str | None = None) -> None:
+        await self.save_weather_cities([weather], ttl, [alias])
+
+    async def save_weather_cities(self, weathers: list[Weather], ttl: int, aliases: list[str | None] | None = None) -> None:
+        if not weathers:
+            return
+
+        aliases = aliases or [None] * len(weathers)
+        await self.l2.save_weather_cities(weathers, ttl, aliases)
+        expires_at = time.time() + ttl
+        keys = []
+        for weather, alias in zip(weathers, aliases):
+            value = replace(weather, expires_at=expires_at)
+            names = list(dict.fromkeys([normalize_city(alias or weather.city), normalize_city(weather.city)]))
+            for name in names:
+                if weather.city_id:
+                    # L2와 같이 이름별 항목(negative cache)은 삭제
+                    self.l1.delete(name)
+                self._set_l1(name, value, expires_at)
+                self._delete_rendered(name)
+            # 다른 worker는 city_id 항목을 삭제하므로 이 worker가 모르는 표기로 저장된 값도 함께 갱신됨
+            keys += ([self._id_key(weather.city_id)] if weather.city_id else []) + names
+        if self.invalidation:
+            await self.invalidation.publish(*keys)
+
+    async def save_weather_city_not_found(self, city: str, ttl: int) -> None:
+        await self.l2.save_weather_city_not_found(city, ttl)
+        expires_at = time.time() + ttl
+        self.l1.set(normalize_city(city), WeatherNotFound(city=city, expires_at=expires_at), expires_at=expires_at)
+        self._delete_rendered(city)
+        if self.invalidation:
+            await self.invalidation.publish(city)
+
+    async def get_weather_city(self, query: WeatherByCityQuery) -> Weather | WeatherNotFound | None:
+        key = normalize_city(query.city)
+        weather = self._get_l1(key)
+        if weather:
+            L1_HITS.inc()
+            return weather
+
+        L1_MISSES.inc()
+        weather = await self.l2.get_weather_city(query)
+        if not weather:
+            self.l2_stats.misses += 1
+            return None
+
+        self.l2_stats.hits += 1
+        self._set_l1(key, weather, weather.expires_at)
+        return weather
+
+    async def get_weather_cities(self, query: WeatherListByCitiesQuery) -> list[Weather | WeatherNotFound | None]:
+        weathers = [self._get_l1(normalize_city(city)) for city in query.cities]
+        missing = [i for i, weather in enumerate(weathers) if not weather]
+
+        L1_HITS.inc(len(weathers) - len(missing))
+        L1_MISSES.inc(len(missing))
+        if not missing:
+            return weathers
+
+        fetched = await self.l2.get_weather_cities(WeatherListByCitiesQuery(cities=[query.cities[i] for i in missing]))
+        for i, weather in zip(missing, fetched):
+            if not weather:
+                self.l2_stats.misses += 1
+                continue
+            self.l2_stats.hits += 1
+            # 요청한 도시 이름을 city_id에 연결 (alias로 조회한 경우 weather.city와 다름)
+            self._set_l1(normalize_city(query.cities[i]), weather, weather.expires_at)
+            weathers[i] = weather
+
+        return weathers
+
+    # MARK: - coordinate
+    @staticmethod
+    def _coord_key(query: WeatherByCoordQuery) -> str:
+        return f"coord:{query.cell_key}"
+
+    async def get_weather_coord(self, query: WeatherByCoordQuery) -> Weather | None:
+        key = self._coord_key(query)
+        weather = self.l1.get(key)
+        # 같은 key의 도시 이름(ex. "coord:1.0,2.0")으로 저장된 negative cache는 무시
+        if isinstance(weather, Weather):
+            L1_HITS.inc()
+            return weather
+
+        L1_MISSES.inc()
+        weather = await self.l2.get_weather_coord(query)
+        if not weather:
+            self.l2_stats.misses += 1
+            return None
+
+        self.l2_stats.hits += 1
+        self.l1.set(key, weather, expires_at=weather.expires_at)
+        return weather
+
+    async def save_weather_coord(self, query: WeatherByCoordQuery, weather: Weather, ttl: int) -> None:
+        await self.l2.save_weather_coord(query, weather, ttl)
+        key = self._coord_key(query)
+        expires_at = time.time() + ttl
+        self.l1.set(key, replace(weather, expires_at=expires_at), expires_at=expires_at)
+        if self.invalidation:
+            await self.invalidation.publish(key)
+
+    # MARK: - rendered response
+    async def get_rendered_weather_city(self, query: WeatherByCityQuery) -> RenderedWeather | None:
+        if self.rendered is None:
+            return await self.l2.get_rendered_weather_city(query)
+
+        key = normalize_city(query.city)
+        rendered = self.rendered.get(key)
+        if rendered:
+            L1_RENDERED_HITS.inc()
+            return replace(rendered, city=query.city)
+
+        L1_RENDERED_MISSES.inc()
+        rendered = await self.l2.get_rendered_weather_city(query)
+        if rendered:
+            self.rendered.set(key, rendered, expires_at=rendered.stale_at)
+        return rendered
+
+    async def get_rendered_weather_cities(self, query: WeatherListByCitiesQuery) -> list[RenderedWeather]:
+        if self.rendered is None:
+            return await self.l2.get_rendered_weather_cities(query)
+
+        rendered = []
+        missing_cities = []
+        for city in query.cities:
+            hit = self.rendered.get(normalize_city(city))
+            if hit:
+                rendered.append(replace(hit, city=city))
+            else:
+                missing_cities.append(city)
+
+        L1_RENDERED_HITS.inc(len(rendered))
+        L1_RENDERED_MISSES.inc(len(missing_cities))
+        if not missing_cities:
+            return rendered
+
+        fetched = await self.l2.get_rendered_weather_cities(WeatherListByCitiesQuery(cities=missing_cities))
+        for it in fetched:
+            self.rendered.set(normalize_city(it.city), it, expires_at=it.stale_at)
+
+        return rendered + fetched
+
+    def _delete_rendered(self, city: str) -> None:
+        if self.rendered is not None:
+            self.rendered.delete(normalize_city(city))
+
+    # MARK: - fetch lease
+    async def acquire_fetch_lease(self, query: WeatherByCityQuery) -> str | None:
+        return await self.l2.acquire_fetch_lease(query)
+
+    async def release_fetch_lease(self, query: WeatherByCityQuery, token: str) -> None:
+        await self.l2.release_fetch_lease(query, token)
+
+    async def wait_weather_city(self, query: WeatherByCityQuery) -> Weather | WeatherNotFound | None:
+        return await self.l2.wait_weather_city(query)
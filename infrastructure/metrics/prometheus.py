@@ -0,0 +1,100 @@
+"""
+Prometheus metric
+
+여러 worker 프로세스로 실행할 때는 시작 전에 PROMETHEUS_MULTIPROC_DIR(비어 있는 디렉터리)를 지정
+- 각 worker가 해당 디렉터리의 mmap 파일에 기록하고, /metrics 조회 시 모든 worker의 값을 합산
+- 지정하지 않으면 프로세스 내 값만 노출
+"""
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+from infrastructure.metrics.timing import Stage
+
+STAGE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# MARK: - http
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency",
+    ["method", "route", "status"],
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests in progress",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+# MARK: - stage
+STAGE_DURATION = Histogram(
+    "weather_stage_duration_seconds",
+    "Latency of each stage in the weather request path",
+    ["stage"],
+    buckets=STAGE_BUCKETS,
+)
+# 요청 경로에서 labels() 조회 비용을 줄이기 위해 미리 생성, 요청별 합계(Server-Timing)에도 기록
+CACHE_GET_DURATION = Stage("cache_get", STAGE_DURATION.labels("cache_get"))
+CACHE_SET_DURATION = Stage("cache_set", STAGE_DURATION.labels("cache_set"))
+UPSTREAM_FETCH_DURATION = Stage("upstream_fetch", STAGE_DURATION.labels("upstream_fetch"))
+MODEL_VALIDATION_DURATION = Stage("model_validation", STAGE_DURATION.labels("model_validation"))
+RESPONSE_SERIALIZATION_DURATION = Stage("response_serialization", STAGE_DURATION.labels("response_serialization"))
+
+# MARK: - cache
+CACHE_REQUESTS = Counter(
+    "weather_cache_requests",
+    "Weather cache lookups by tier and result",
+    ["tier", "result"],
+)
+L1_HITS = CACHE_REQUESTS.labels("l1", "hit")
+L1_MISSES = CACHE_REQUESTS.labels("l1", "miss")
+L1_RENDERED_HITS = CACHE_REQUESTS.labels("l1_rendered", "hit")
+L1_RENDERED_MISSES = CACHE_REQUESTS.labels("l1_rendered", "miss")
+REDIS_HITS = CACHE_REQUESTS.labels("redis", "hit")
+REDIS_MISSES = CACHE_REQUESTS.labels("redis", "miss")
+REDIS_RENDERED_HITS = CACHE_REQUESTS.labels("redis_rendered", "hit")
+REDIS_RENDERED_MISSES = CACHE_REQUESTS.labels("redis_rendered", "miss")
+
+# MARK: - upstream
+UPSTREAM_RESPONSES = Counter(
+    "openweather_responses",
+    "OpenWeather responses by endpoint and status code (timeout, error: no response)",
+    ["endpoint", "status"],
+)
+UPSTREAM_RETRIES = Counter(
+    "openweather_retries",
+    "OpenWeather retry attempts by endpoint",
+    ["endpoint"],
+)
+
+
+def is_multiprocess() -> bool:
+    return "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """
+    반환값: (Prometheus text format, content type)
+    """
+    if not is_multiprocess():
+        return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    """
+    worker 종료 시 호출, 종료된 worker의 livesum gauge 값 제외
+    """
+    if is_multiprocess():
+        multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,66 @@
+"""
+요청별 단계(stage) 소요 시간
+
+- 요청 처리 중에는 request_timings() 안에서 기록된 단계별 시간을 요청 단위로 합산 (Server-Timing 헤더, 느린 요청 로그)
+- request_timings() 밖(백그라운드 작업 등)에서는 Prometheus histogram에만 기록
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from prometheus_client import Histogram
+
+# stage 이름 -> [소요 시간 합계(seconds), 횟수]
+_timings: ContextVar[dict[str, list[float]] | None] = ContextVar("request_timings", default=None)
+
+
+@contextmanager
+def request_timings() -> Iterator[dict[str, list[float]]]:
+    timings: dict[str, list[float]] = {}
+    token = _timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _timings.reset(token)
+
+
+def record(name: str, elapsed: float) -> None:
+    timings = _timings.get()
+    if timings is None:
+        return
+    total = timings.get(name)
+    if total:
+        total[0] += elapsed
+        total[1] += 1
+    else:
+        timings[name] = [elapsed, 1]
+
+
+class Stage:
+    """
+    with stage.time(): ... 로 Prometheus histogram과 요청별 합계에 함께 기록
+    """
+    __slots__ = ("name", "histogram")
+
+    def __init__(self, name: str, histogram: Histogram):
+        self.name = name
+        self.histogram = histogram
+
+    def time(self) -> "_StageTimer":
+        return _StageTimer(self)
+
+
+class _StageTimer:
+    __slots__ = ("stage", "started")
+
+    def __init__(self, stage: Stage):
+        self.stage = stage
+
+    def __enter__(self) -> None:
+        self.started = time.perf_counter()
+
+    def __exit__(self, *_) -> None:
+        elapsed = time.perf_counter() - self.started
+        self.stage.histogram.observe(elapsed)
+        record(self.stage.name, elapsed)
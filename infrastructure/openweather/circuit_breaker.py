@@ -0,0 +1,132 @@
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+
+from infrastructure.openweather.settings import CircuitBreakerSettings
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class CircuitBreakerStats:
+    opened: int = 0
+    half_opened: int = 0
+    closed: int = 0
+    rejected: int = 0  # open 상태에서 바로 실패 처리한 요청 수
+
+
+class CircuitBreaker:
+    """
+    - closed: 요청 허용. window 안의 에러율 또는 연속 timeout이 기준을 넘으면 open
+    - open: 요청을 보내지 않고 바로 실패. open_duration 이후 half-open
+    - half-open: 시험 요청만 허용. 성공하면 closed, 실패하면 다시 open
+    """
+
+    def __init__(self, name: str, settings: CircuitBreakerSettings):
+        self.name = name
+        self.settings = settings
+        self.state = CircuitState.CLOSED
+        self.stats = CircuitBreakerStats()
+        self._calls: deque[tuple[float, bool]] = deque()  # (시각, 실패 여부)
+        self._failures = 0
+        self._consecutive_timeouts = 0
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+
+    def allow(self) -> bool:
+        if self.state == CircuitState.OPEN:
+            if time.monotonic() - self._opened_at < self.settings.open_duration:
+                self.stats.rejected += 1
+                return False
+            self._transition(CircuitState.HALF_OPEN)
+
+        if self.state == CircuitState.HALF_OPEN:
+            if self._half_open_calls >= self.settings.half_open_max_calls:
+                self.stats.rejected += 1
+                return False
+            self._half_open_calls += 1
+
+        return True
+
+    def record_success(self) -> None:
+        self._consecutive_timeouts = 0
+        if self.state == CircuitState.HALF_OPEN:
+            self._transition(CircuitState.CLOSED)
+            return
+        self._record(failed=False)
+
+    def record_failure(self, timeout: bool = False) -> None:
+        self._consecutive_timeouts = self._consecutive_timeouts + 1 if timeout else 0
+        if self.state == CircuitState.HALF_OPEN:
+            self._transition(CircuitState.OPEN)
+            return
+
+        self._record(failed=True)
+        if self._consecutive_timeouts >= self.settings.consecutive_timeouts or self._failure_rate_exceeded():
+            self._transition(CircuitState.OPEN)
+
+    def release(self) -> None:
+        """
+        결과를 판단할 수 없이 끝난 요청 (취소, 요청 deadline으로 인한 timeout)
+        """
+        if self.state == CircuitState.HALF_OPEN:
+            self._half_open_calls = max(0, self._half_open_calls - 1)
+
+    # MARK: - private
+    def _record(self, failed: bool) -> None:
+        now = time.monotonic()
+        self._calls.append((now, failed))
+        self._failures += failed
+        while self._calls and self._calls[0][0] < now - self.settings.window:
+            _, expired_failed = self._calls.popleft()
+            self._failures -= expired_failed
+
+    def _failure_rate_exceeded(self) -> bool:
+        calls = len(self._calls)
+        return calls >= self.settings.minimum_calls \
+            and self._failures / calls >= self.settings.failure_rate_threshold
+
+    def _transition(self, state: CircuitState) -> None:
+        logger.warning("[CircuitBreaker] %s %s -> %s", self.name, self.state.value, state.value)
+        self.state = state
+        self._half_open_calls = 0
+        match state:
+            case CircuitState.OPEN:
+                self._opened_at = time.monotonic()
+                self.stats.opened += 1
+            case CircuitState.HALF_OPEN:
+                self.stats.half_opened += 1
+            case CircuitState.CLOSED:
+                self._calls.clear()
+                self._failures = 0
+                self._consecutive_timeouts = 0
+                self.stats.closed += 1
+
+
+class CircuitBreakerRegistry:
+    """
+    host, endpoint별 circuit breaker
+    """
+
+    def __init__(self, settings: CircuitBreakerSettings):
+        self.settings = settings
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, host: str, path: str) -> CircuitBreaker:
+        name = f"{host}{path}"
+        breaker = self._breakers.get(name)
+        if not breaker:
+            breaker = CircuitBreaker(name, self.settings)
+            self._breakers[name] = breaker
+        return breaker
+
+    def breakers(self) -> list[CircuitBreaker]:
+        return list(self._breakers.values())
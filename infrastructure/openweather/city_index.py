@@ -0,0 +1,143 @@
+"""
+OpenWeather 도시 ID 색인
+
+https://bulk.openweathermap.org/sample/city.list.json.gz 로 만든 색인 파일을 mmap으로 읽어서,
+도시 이름(`name`, `name,country`, `name,state,country`)을 OpenWeather 도시 ID로 변환
+
+색인 파일 생성
+python -m infrastructure.openweather.city_index city.list.json.gz [-o .data/openweather/city_index.bin]
+"""
+import argparse
+import gzip
+import json
+import mmap
+import re
+import struct
+import unicodedata
+from pathlib import Path
+from typing import Iterable
+
+_MAGIC = b"OWCI"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHI")  # magic, version, reserved, count
+_ENTRY = struct.Struct("<IHI")  # key offset, key length, city id
+_MAX_NAME_LENGTH = 100
+_INVALID_CHARACTERS = re.compile(r"[<>{}\[\]\\|^~$%*=+;:@#\"`/]")
+_WHITESPACE = re.compile(r"\s+")
+_COMMA = re.compile(r"\s*,\s*")
+
+
+def index_key(name: str) -> str:
+    """
+    색인 검색용 정규화: 대소문자, 악센트, 연속 공백, 쉼표 앞뒤 공백 무시
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _COMMA.sub(",", _WHITESPACE.sub(" ", stripped.casefold().strip()))
+
+
+def is_plausible_city_name(name: str) -> bool:
+    """
+    upstream 조회 전에 도시 이름이 될 수 없는 입력 걸러내기 (형식만 확인)
+    - 1 ~ 100자, 문자(letter)를 하나 이상 포함
+    - 제어 문자, 도시 이름에 쓰이지 않는 기호 없음
+    """
+    name = name.strip()
+    if not name or len(name) > _MAX_NAME_LENGTH:
+        return False
+    if _INVALID_CHARACTERS.search(name):
+        return False
+    if any(unicodedata.category(c).startswith("C") for c in name):
+        return False
+    return any(c.isalpha() for c in name)
+
+
+class CityIndex:
+    """
+    header | entries(key 순으로 정렬) | keys(utf-8)
+    - 같은 key에 여러 도시가 있으면(ex. london) AMBIGUOUS
+    - 조회: entries 이진 탐색, 파일 전체를 메모리에 올리지 않음
+    """
+    AMBIGUOUS = 0  # 존재하는 이름이지만 하나의 도시로 정할 수 없음
+
+    def __init__(self, path: str | Path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, self._count = _HEADER.unpack_from(self._mm)
+        if magic != _MAGIC or version != _VERSION:
+            self._mm.close()
+            raise ValueError(f"invalid city index: {path}")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def lookup(self, name: str) -> int | None:
+        """
+        반환값: 도시 ID, 여러 도시면 AMBIGUOUS, 없으면 None
+        """
+        key = index_key(name).encode()
+        low, high = 0, self._count
+        while low < high:
+            mid = (low + high) // 2
+            offset, length, city_id = _ENTRY.unpack_from(self._mm, _HEADER.size + mid * _ENTRY.size)
+            current = self._mm[offset:offset + length]
+            if current < key:
+                low = mid + 1
+            elif current > key:
+                high = mid
+            else:
+                return city_id
+        return None
+
+    def close(self) -> None:
+        self._mm.close()
+
+    @staticmethod
+    def build(cities: Iterable[dict], path: str | Path) -> int:
+        """
+        cities: city.list.json 항목 ({"id", "name", "state", "country", ...})
+        반환값: key 수
+        """
+        ids: dict[bytes, int] = {}
+        for city in cities:
+            name, country, state = city["name"], city.get("country") or "", city.get("state") or ""
+            keys = {name, f"{name},{country}"}
+            if state:
+                keys.add(f"{name},{state},{country}")
+            for key in keys:
+                encoded = index_key(key).encode()
+                if not encoded:
+                    continue
+                current = ids.get(encoded)
+                ids[encoded] = city["id"] if current in (None, city["id"]) else CityIndex.AMBIGUOUS
+
+        keys = sorted(ids)
+        keys_offset = _HEADER.size + len(keys) * _ENTRY.size
+        entries = bytearray()
+        offset = keys_offset
+        for key in keys:
+            entries += _ENTRY.pack(offset, len(key), ids[key])
+            offset += len(key)
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, 0, len(keys)))
+            f.write(entries)
+            f.write(b"".join(keys))
+        return len(keys)
+
+
+def load_city_list(path: str | Path) -> list[dict]:
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, "rb") as f:
+        return json.load(f)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("city_list", help="city.list.json 또는 city.list.json.gz")
+    parser.add_argument("-o", "--output", default=".data/openweather/city_index.bin")
+    args = parser.parse_args()
+    count = CityIndex.build(load_city_list(args.city_list), args.output)
+    print(f"{count} keys -> {args.output} ({Path(args.output).stat().st_size} bytes)")
@@ -1,7 +1,12 @@
+import asyncio
 import logging
+import time
+from dataclasses import dataclass
+
 import httpx
 from tenacity import (
     retry,
+    stop_any,
     stop_after_attempt,
     wait_exponential_jitter,
     retry_if_exception,
@@ -9,8 +14,15 @@ from tenacity import (
     RetryCallState,
 )
 
+from domain.shared import deadline
+from infrastructure.metrics import timing
+from infrastructure.metrics.prometheus import UPSTREAM_FETCH_DURATION, UPSTREAM_RESPONSES, UPSTREAM_RETRIES
+from infrastructure.openweather.circuit_breaker import CircuitBreakerRegistry, CircuitBreaker
+from infrastructure.openweather.hedge import HedgePolicy
 from infrastructure.openweather.error import OpenWeatherClientError, OpenWeatherNotFoundError, \
-    OpenWeatherBadRequestError, OpenWeatherUnauthorizedError
+    OpenWeatherBadRequestError, OpenWeatherUnauthorizedError, OpenWeatherCircuitOpenError, \
+    OpenWeatherDeadlineExceededError
+from infrastructure.openweather.settings import HttpClientSettings, CircuitBreakerSettings, HedgeSettings
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +57,44 @@ async def _log_response(response: httpx.Response) -> None:
         )
 
 
+# MARK: - Pool metrics
+@dataclass
+class HttpPoolStats:
+    requests: int = 0
+    new_connections: int = 0  # 새 connection을 열고 보낸 요청
+    reused_connections: int = 0  # pool의 connection을 재사용한 요청
+    pool_wait_seconds: float = 0  # 요청 시작부터 connection을 얻을 때까지 걸린 시간 합계
+    max_pool_wait_seconds: float = 0
+
+
+class _PoolTrace:
+    """
+    httpx trace extension으로 요청마다 connection 재사용 여부, pool 대기 시간 기록
+    connection을 얻은 뒤 처음 발생하는 이벤트가 connect_tcp면 새 connection, send_request_headers면 재사용
+    """
+
+    def __init__(self, stats: HttpPoolStats):
+        self.stats = stats
+        self.started = time.perf_counter()
+        self.acquired = False
+
+    async def __call__(self, event_name: str, info: dict) -> None:
+        if self.acquired:
+            return
+        if event_name == "connection.connect_tcp.started":
+            self.stats.new_connections += 1
+        elif event_name.endswith(".send_request_headers.started"):
+            self.stats.reused_connections += 1
+        else:
+            return
+
+        self.acquired = True
+        wait = time.perf_counter() - self.started
+        self.stats.requests += 1
+        self.stats.pool_wait_seconds += wait
+        self.stats.max_pool_wait_seconds = max(self.stats.max_pool_wait_seconds, wait)
+
+
 # MARK: - Retry
 def is_retryable(exception: BaseException) -> bool:
     """
@@ -58,6 +108,30 @@ def is_retryable(exception: BaseException) -> bool:
     return False
 
 
+_log_before_sleep = before_sleep_log(logger, logging.WARNING)
+
+
+def before_sleep(retry_state: RetryCallState) -> None:
+    """
+    재시도 대기 전 로그, 재시도 횟수, 대기 시간 기록
+    """
+    _log_before_sleep(retry_state)
+    args = retry_state.args
+    UPSTREAM_RETRIES.labels(args[2] if len(args) > 2 else "UNKNOWN").inc()
+    timing.record("upstream_retry_wait", retry_state.upcoming_sleep)
+
+
+def stop_before_deadline(retry_state: RetryCallState) -> bool:
+    """
+    요청 deadline까지 남은 시간에 대기 시간과 한 번의 시도가 들어가지 않으면 중단
+    """
+    budget = deadline.remaining()
+    if budget is None:
+        return False
+    client: OpenWeatherClient = retry_state.args[0]
+    return budget - retry_state.upcoming_sleep < client.http.min_attempt_time
+
+
 # MARK: - Error
 def raise_custom_error(retry_state: RetryCallState) -> None:
     args = retry_state.args
@@ -78,12 +152,32 @@ class OpenWeatherClient:
             self,
             api_key: str,
             host: str,
-            timeout: float = 30,  # seconds
+            timeout: float | None = None,  # seconds, 지정하면 http의 timeout 대신 사용
+            transport: httpx.AsyncBaseTransport | None = None,  # 테스트, 벤치마크용
+            http: HttpClientSettings | None = None,
+            circuit_breaker: CircuitBreakerSettings | None = None,
+            hedge: HedgeSettings | None = None,
     ):
         self.api_key = api_key
         self.host = host
+        self.http = http or HttpClientSettings()
+        self.pool_stats = HttpPoolStats()
+        self.circuit_breakers = CircuitBreakerRegistry(circuit_breaker or CircuitBreakerSettings())
+        self.hedge = HedgePolicy(hedge or HedgeSettings())
         self.client = httpx.AsyncClient(
-            timeout=httpx.Timeout(timeout),
+            timeout=httpx.Timeout(timeout) if timeout is not None else httpx.Timeout(
+                connect=self.http.connect_timeout,
+                read=self.http.read_timeout,
+                write=self.http.write_timeout,
+                pool=self.http.pool_timeout,
+            ),
+            limits=httpx.Limits(
+                max_connections=self.http.max_connections,
+                max_keepalive_connections=self.http.max_keepalive_connections,
+                keepalive_expiry=self.http.keepalive_expiry,
+            ),
+            http2=self.http.http2,
+            transport=transport,
             event_hooks={
                 "request": [_log_request],
                 "response": [_log_response],
@@ -91,19 +185,44 @@ class OpenWeatherClient:
         )
 
     async def get(self, path: str, params: dict[str, str | int | float] | None = None) -> dict:
+        if self.hedge.settings.enabled:
+            return await self._hedged_get(path, params)
         return await self._request("GET", path, params=params)
 
+    async def get_raw(self, path: str, params: dict[str, str | int | float] | None = None) -> bytes:
+        """
+        응답 body를 json으로 파싱하지 않고 반환 (호출하는 쪽에서 필요한 필드만 파싱)
+        """
+        if self.hedge.settings.enabled:
+            return await self._hedged_get(path, params, raw=True)
+        return await self._request("GET", path, params=params, raw=True)
+
     async def post(self, path: str, json: dict[str, str | int | float | list | dict | None] | None = None) -> dict:
         return await self._request("POST", path, json=json)
 
     async def close(self) -> None:
         await self.client.aclose()
 
+    async def warm_up(self, connections: int) -> int:
+        """
+        connection을 미리 열어서 첫 요청의 TCP, TLS handshake 비용 제거
+        동시에 요청해야 요청마다 다른 connection이 열림 (http2는 하나의 connection 공유)
+        반환값: 연결에 성공한 요청 수
+        """
+        results = await asyncio.gather(
+            *[self.client.head(self.host) for _ in range(connections)],
+            return_exceptions=True,
+        )
+        succeeded = sum(1 for it in results if isinstance(it, httpx.Response))
+        if succeeded < connections:
+            logger.warning("[OpenWeather] warm up %s/%s connections", succeeded, connections)
+        return succeeded
+
     @retry(
-        stop=stop_after_attempt(5),
+        stop=stop_any(stop_after_attempt(5), stop_before_deadline),
         wait=wait_exponential_jitter(initial=0.5, max=10),
         retry=retry_if_exception(is_retryable),
-        before_sleep=before_sleep_log(logger, logging.WARNING),
+        before_sleep=before_sleep,
         retry_error_callback=raise_custom_error
     )
     async def _request(
@@ -112,21 +231,45 @@ class OpenWeatherClient:
             path: str,
             params: dict[str, str | int | float] | None = None,
             json: dict[str, str | int | float | list | dict | None] | None = None,
-    ) -> dict:
+            raw: bool = False,
+    ) -> dict | bytes:
         url = f"{self.host}{path}"
         params = params or {}
         params["appid"] = self.api_key
 
-        response = await self.client.request(
-            method=method,
-            url=url,
-            params=params,
-            json=json,
-        )
+        breaker = self.circuit_breakers.get(self.host, path) if self.circuit_breakers.settings.enabled else None
+        if breaker and not breaker.allow():
+            raise OpenWeatherCircuitOpenError(method=method, path=path)
+
+        timeout, capped = self._attempt_timeout(method, path)
+        try:
+            with UPSTREAM_FETCH_DURATION.time():
+                response = await self.client.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=json,
+                    timeout=timeout,
+                    extensions={"trace": _PoolTrace(self.pool_stats)},
+                )
+        except httpx.TimeoutException:
+            # 요청 deadline 때문에 줄어든 timeout은 upstream 상태로 판단하지 않음
+            self._record(breaker, failed=None if capped else True, timeout=True)
+            UPSTREAM_RESPONSES.labels(path, "timeout").inc()
+            raise
+        except httpx.TransportError:
+            self._record(breaker, failed=True)
+            UPSTREAM_RESPONSES.labels(path, "error").inc()
+            raise
+        except BaseException:
+            self._record(breaker, failed=None)
+            raise
+        self._record(breaker, failed=response.status_code >= 500)
+        UPSTREAM_RESPONSES.labels(path, str(response.status_code)).inc()
 
         match response.status_code:
             case status if 200 <= status < 300:
-                return response.json()
+                return response.content if raw else response.json()
             case 400:
                 raise OpenWeatherBadRequestError()
             case 401:
@@ -143,6 +286,78 @@ class OpenWeatherClient:
                 response.raise_for_status()
                 return response.json()
 
+    async def _hedged_get(
+            self,
+            path: str,
+            params: dict[str, str | int | float] | None,
+            raw: bool = False,
+    ) -> dict | bytes:
+        """
+        응답이 hedge.delay 안에 오지 않으면 같은 요청을 한 번 더 보내고 먼저 성공한 응답 사용
+        GET(멱등)에만 사용
+        """
+        self.hedge.start()
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        primary = asyncio.create_task(self._request("GET", path, params=dict(params or {}), raw=raw))
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.hedge.delay)
+            if not done and self.hedge.acquire():
+                tasks.add(asyncio.create_task(self._request("GET", path, params=dict(params or {}), raw=raw)))
+
+            pending = tasks
+            error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception():
+                        error = error or task.exception()
+                        continue
+                    self.hedge.record_latency(loop.time() - started)
+                    if task is not primary:
+                        self.hedge.stats.won += 1
+                    return task.result()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+                if task.done() and not task.cancelled():
+                    task.exception()  # 사용하지 않은 응답의 에러는 무시
+
+    def _attempt_timeout(self, method: str, path: str) -> tuple[httpx.Timeout, bool]:
+        """
+        요청 deadline이 있으면 남은 시간 이내로 timeout 제한
+        반환값: (timeout, deadline으로 인해 줄어들었는지 여부)
+        """
+        timeout = self.client.timeout
+        budget = deadline.remaining()
+        if budget is None:
+            return timeout, False
+        if budget <= 0:
+            raise OpenWeatherDeadlineExceededError(method=method, path=path)
+
+        return httpx.Timeout(
+            connect=min(timeout.connect, budget),
+            read=min(timeout.read, budget),
+            write=min(timeout.write, budget),
+            pool=min(timeout.pool, budget),
+        ), budget < timeout.read
+
+    @staticmethod
+    def _record(breaker: CircuitBreaker | None, failed: bool | None, timeout: bool = False) -> None:
+        """
+        failed: None이면 결과를 판단할 수 없음 (취소 등)
+        """
+        if not breaker:
+            return
+        if failed is None:
+            breaker.release()
+        elif failed:
+            breaker.record_failure(timeout=timeout)
+        else:
+            breaker.record_success()
+
     def _sanitize_params(self, params: dict) -> dict:
         sensitive_keys = {"appid"}
         return {k: v for k, v in params.items() if k not in sensitive_keys}
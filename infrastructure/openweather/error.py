@@ -1,5 +1,7 @@
 from fastapi import status
 
+from domain.weather.error import WeatherProviderUnavailableError, WeatherNotFoundError
+
 
 class BaseOpenWeatherError(Exception):
     status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -8,13 +10,33 @@ class BaseOpenWeatherError(Exception):
         super().__init__(message)
 
 
-class OpenWeatherClientError(BaseOpenWeatherError):
+class OpenWeatherClientError(BaseOpenWeatherError, WeatherProviderUnavailableError):
     status_code: int = status.HTTP_502_BAD_GATEWAY
 
     def __init__(self, method: str, path: str, retry: int, exception: Exception | None = None):
         super().__init__(f"failed {method} {path}. retry:{retry} ")
 
 
+class OpenWeatherCircuitOpenError(OpenWeatherClientError):
+    """
+    circuit breaker가 열려있어 요청을 보내지 않음
+    """
+    status_code: int = status.HTTP_503_SERVICE_UNAVAILABLE
+
+    def __init__(self, method: str, path: str):
+        BaseOpenWeatherError.__init__(self, f"circuit open {method} {path}")
+
+
+class OpenWeatherDeadlineExceededError(OpenWeatherClientError):
+    """
+    요청 deadline이 지나 upstream을 조회하지 않음
+    """
+    status_code: int = status.HTTP_504_GATEWAY_TIMEOUT
+
+    def __init__(self, method: str, path: str):
+        BaseOpenWeatherError.__init__(self, f"deadline exceeded {method} {path}")
+
+
 class OpenWeatherBadRequestError(BaseOpenWeatherError):
     status_code = status.HTTP_400_BAD_REQUEST
 
@@ -22,7 +44,7 @@ class OpenWeatherBadRequestError(BaseOpenWeatherError):
         super().__init__(f"bad request")
 
 
-class OpenWeatherNotFoundError(BaseOpenWeatherError):
+class OpenWeatherNotFoundError(BaseOpenWeatherError, WeatherNotFoundError):
     status_code: int = status.HTTP_404_NOT_FOUND
 
     def __init__(self, params: dict | None = None):
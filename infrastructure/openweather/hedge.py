@@ -0,0 +1,48 @@
+from collections import deque
+from dataclasses import dataclass
+
+from infrastructure.openweather.settings import HedgeSettings
+
+
+@dataclass
+class HedgeStats:
+    requests: int = 0  # hedge 대상 요청 수
+    hedged: int = 0  # hedge 요청을 보낸 수
+    won: int = 0  # hedge 요청의 응답을 사용한 수
+    budget_exhausted: int = 0  # 지연되었지만 budget이 없어 hedge 요청을 보내지 않은 수
+
+
+class HedgePolicy:
+    """
+    - delay: 최근 응답 시간의 percentile (min_delay ~ max_delay)
+    - budget: 요청마다 budget_ratio만큼 쌓이고 hedge 요청마다 1씩 사용 (최대 max_burst)
+    """
+    _RECALCULATE_INTERVAL = 50  # 표본이 이만큼 추가될 때마다 delay 다시 계산
+
+    def __init__(self, settings: HedgeSettings):
+        self.settings = settings
+        self.stats = HedgeStats()
+        self.delay = settings.max_delay
+        self._latencies: deque[float] = deque(maxlen=settings.max_samples)
+        self._added = 0
+        self._budget = 0.0
+
+    def start(self) -> None:
+        self.stats.requests += 1
+        self._budget = min(self.settings.max_burst, self._budget + self.settings.budget_ratio)
+
+    def acquire(self) -> bool:
+        if self._budget < 1:
+            self.stats.budget_exhausted += 1
+            return False
+        self._budget -= 1
+        self.stats.hedged += 1
+        return True
+
+    def record_latency(self, seconds: float) -> None:
+        self._latencies.append(seconds)
+        self._added += 1
+        if self._added % self._RECALCULATE_INTERVAL == 0 and len(self._latencies) >= self.settings.min_samples:
+            ordered = sorted(self._latencies)
+            index = min(len(ordered) - 1, int(len(ordered) * self.settings.percentile / 100))
+            self.delay = min(self.settings.max_delay, max(self.settings.min_delay, ordered[index]))
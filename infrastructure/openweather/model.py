@@ -1,5 +1,6 @@
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 from pydantic.alias_generators import to_camel, to_snake
+from typing_extensions import TypedDict  # pydantic: python 3.12 미만은 typing.TypedDict 사용 불가
 
 from domain.weather.data.model import Weather
 
@@ -86,5 +87,75 @@ class WeatherResponse(BaseResponse):
                     description=it.description,
                 )
                 for it in self.weather
-            ]
+            ],
+            dt=self.dt,
+            city_id=self.id,
         )
+
+
+class GroupWeatherResponse(BaseResponse):
+    """
+    여러 도시 조회 (/data/2.5/group?id=...)
+    도시별 항목은 WeatherResponse와 같은 형식이지만 base, timezone(sys.timezone으로 이동), cod가 없음
+    """
+
+    class City(WeatherResponse):
+        base: str | None = None
+        timezone: int | None = None
+        cod: int | None = None
+
+    cnt: int  # Number of cities
+    list: list[City]
+
+
+# MARK: - projection
+class WeatherConditionProjection(TypedDict):
+    main: str
+    description: str
+
+
+class WeatherProjection(TypedDict):
+    """
+    WeatherResponse 중 도메인 모델에 필요한 필드만 (나머지 필드는 검증하지 않고 건너뜀)
+    """
+    id: int
+    name: str
+    dt: int
+    weather: list[WeatherConditionProjection]
+
+
+class GroupWeatherProjection(TypedDict):
+    list: list[WeatherProjection]
+
+
+_WEATHER_PROJECTION = TypeAdapter(WeatherProjection)
+_GROUP_WEATHER_PROJECTION = TypeAdapter(GroupWeatherProjection)
+
+
+def _projection_to_domain(data: WeatherProjection) -> Weather:
+    return Weather(
+        city=data["name"],
+        conditions=[
+            Weather.Condition(
+                condition=it["main"],
+                description=it["description"],
+            )
+            for it in data["weather"]
+        ],
+        dt=data["dt"],
+        city_id=data["id"],
+    )
+
+
+def parse_weather(content: bytes) -> Weather:
+    """
+    응답 body(json bytes)를 dict로 만들지 않고 바로 파싱
+    """
+    return _projection_to_domain(_WEATHER_PROJECTION.validate_json(content))
+
+
+def parse_group_weather(content: bytes) -> dict[int, Weather]:
+    """
+    반환값: 도시 ID -> Weather
+    """
+    return {it["id"]: _projection_to_domain(it) for it in _GROUP_WEATHER_PROJECTION.validate_json(content)["list"]}
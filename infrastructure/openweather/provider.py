@@ -1,18 +1,132 @@
+import asyncio
+
 from domain.weather.data.model import Weather
-from domain.weather.data.query import WeatherByCityQuery
+from domain.weather.data.query import WeatherByCityQuery, WeatherByCoordQuery
 from domain.weather.provider import WeatherProvider
+from infrastructure.metrics.prometheus import MODEL_VALIDATION_DURATION
+from infrastructure.openweather.city_index import CityIndex, is_plausible_city_name
 from infrastructure.openweather.client import OpenWeatherClient
-from infrastructure.openweather.model import WeatherResponse
+from infrastructure.openweather.error import OpenWeatherNotFoundError
+from infrastructure.openweather.model import (
+    WeatherResponse,
+    GroupWeatherResponse,
+    parse_weather,
+    parse_group_weather,
+)
 
 
 class OpenWeatherProvider(WeatherProvider):
+    GROUP_MAX_SIZE = 20  # /data/2.5/group 한 번에 조회 가능한 도시 수
 
-    def __init__(self, client: OpenWeatherClient):
+    def __init__(
+            self,
+            client: OpenWeatherClient,
+            city_index: CityIndex | None = None,
+            reject_unknown: bool = False,
+            strict: bool = False,
+            single_concurrency: int = 20,
+    ):
+        """
+        city_index: 도시 이름이 하나의 도시로 정해지면 도시 ID로 조회
+        reject_unknown: 색인에 없는 도시 이름은 upstream 조회 없이 not found
+        strict: 응답 전체를 WeatherResponse로 검증 (디버깅용)
+            False면 응답 bytes에서 도메인 모델에 필요한 필드만 파싱
+        single_concurrency: get_many에서 도시 ID로 정해지지 않는 도시를 도시마다 조회할 때 동시 조회 수 (provider 단위)
+        """
         self.client = client
+        self.city_index = city_index
+        self.reject_unknown = reject_unknown
+        self.strict = strict
+        self._single_semaphore = asyncio.Semaphore(single_concurrency)
+
+    @property
+    def supports_batch(self) -> bool:
+        # 색인이 없으면 group으로 조회할 수 없으므로 도시마다 조회 (service에서 batch_concurrency로 제한)
+        return self.city_index is not None
 
     async def get(self, query: WeatherByCityQuery) -> Weather:
-        data = await self.client.get(
-            "/data/2.5/weather",
-            params={"q": query.city},
+        return await self._get_weather(self._params(query.city))
+
+    async def get_by_coord(self, query: WeatherByCoordQuery) -> Weather:
+        return await self._get_weather({"lat": query.lat, "lon": query.lon})
+
+    async def get_many(self, queries: list[WeatherByCityQuery]) -> list[Weather | BaseException]:
+        """
+        도시 ID로 정해지는 도시는 GROUP_MAX_SIZE개씩 /data/2.5/group으로 조회, 나머지는 도시마다 get
+        group 조회는 동시에 실행, 도시마다 조회는 single_concurrency개까지 동시에 실행
+        """
+        results: list[Weather | BaseException | None] = [None] * len(queries)
+        indexes_by_id: dict[int, list[int]] = {}
+        singles: list[int] = []
+        for i, query in enumerate(queries):
+            try:
+                params = self._params(query.city)
+            except OpenWeatherNotFoundError as e:
+                results[i] = e
+                continue
+            if "id" in params:
+                indexes_by_id.setdefault(params["id"], []).append(i)
+            else:
+                singles.append(i)
+
+        ids = list(indexes_by_id)
+        chunks = [ids[i:i + self.GROUP_MAX_SIZE] for i in range(0, len(ids), self.GROUP_MAX_SIZE)]
+        responses = await asyncio.gather(
+            *(self._get_group(chunk) for chunk in chunks),
+            *(self._get_single(queries[i]) for i in singles),
+            return_exceptions=True,
         )
-        return WeatherResponse.model_validate(data).to_domain()
+        for chunk, response in zip(chunks, responses):
+            for city_id in chunk:
+                # 색인에 있지만 응답에 없는 도시는 not found
+                weather = response if isinstance(response, BaseException) else response.get(
+                    city_id,
+                    OpenWeatherNotFoundError(params={"id": city_id}),
+                )
+                for i in indexes_by_id[city_id]:
+                    results[i] = weather
+        for i, response in zip(singles, responses[len(chunks):]):
+            results[i] = response
+        return results
+
+    async def _get_single(self, query: WeatherByCityQuery) -> Weather:
+        async with self._single_semaphore:
+            return await self.get(query)
+
+    async def _get_weather(self, params: dict) -> Weather:
+        if not self.strict:
+            content = await self.client.get_raw("/data/2.5/weather", params=params)
+            with MODEL_VALIDATION_DURATION.time():
+                return parse_weather(content)
+
+        data = await self.client.get("/data/2.5/weather", params=params)
+        with MODEL_VALIDATION_DURATION.time():
+            return WeatherResponse.model_validate(data).to_domain()
+
+    async def _get_group(self, ids: list[int]) -> dict[int, Weather]:
+        params = {"id": ",".join(map(str, ids))}
+        if not self.strict:
+            content = await self.client.get_raw("/data/2.5/group", params=params)
+            with MODEL_VALIDATION_DURATION.time():
+                return parse_group_weather(content)
+
+        data = await self.client.get("/data/2.5/group", params=params)
+        with MODEL_VALIDATION_DURATION.time():
+            return {it.id: it.to_domain() for it in GroupWeatherResponse.model_validate(data).list}
+
+    def _params(self, city: str) -> dict:
+        """
+        - 도시 이름이 될 수 없는 입력: upstream 조회 없이 not found
+        - 색인에서 하나의 도시로 정해짐: id
+        - 그 외(여러 도시, 색인 없음): q
+        """
+        if not is_plausible_city_name(city):
+            raise OpenWeatherNotFoundError(params={"q": city})
+        if self.city_index is None:
+            return {"q": city}
+        city_id = self.city_index.lookup(city)
+        if city_id is None and self.reject_unknown:
+            raise OpenWeatherNotFoundError(params={"q": city})
+        if city_id:
+            return {"id": city_id}
+        return {"q": city}
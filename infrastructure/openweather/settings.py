@@ -1,8 +1,67 @@
 from pydantic import BaseModel
 
 
+class HttpClientSettings(BaseModel):
+    """
+    prefix: OPENWEATHERMAP__HTTP__
+    """
+    max_connections: int = 100  # 동시에 열 수 있는 connection 수
+    max_keepalive_connections: int = 20  # 재사용을 위해 유지하는 idle connection 수
+    keepalive_expiry: float = 30  # seconds, idle connection 유지 시간
+    connect_timeout: float = 5  # seconds
+    read_timeout: float = 10  # seconds
+    write_timeout: float = 10  # seconds
+    pool_timeout: float = 5  # seconds, connection pool에서 connection을 기다리는 시간
+    http2: bool = False  # 하나의 connection으로 여러 요청을 동시에 처리
+    warmup_connections: int = 0  # 시작 시 미리 열어둘 connection 수 (max_keepalive_connections 이하)
+    min_attempt_time: float = 0.5  # seconds, 요청 deadline까지 남은 시간이 이보다 적으면 재시도하지 않음
+
+
+class CircuitBreakerSettings(BaseModel):
+    """
+    prefix: OPENWEATHERMAP__CIRCUIT_BREAKER__
+    """
+    enabled: bool = True
+    window: float = 30  # seconds, 에러율 계산 구간
+    minimum_calls: int = 20  # window 안의 요청 수가 이보다 적으면 에러율로 판단하지 않음
+    failure_rate_threshold: float = 0.5  # 에러율이 이 이상이면 open
+    consecutive_timeouts: int = 5  # 연속 timeout 수가 이 이상이면 open
+    open_duration: float = 30  # seconds, open 이후 half-open으로 전환되기까지의 시간
+    half_open_max_calls: int = 1  # half-open 상태에서 동시에 보낼 수 있는 시험 요청 수
+
+
+class HedgeSettings(BaseModel):
+    """
+    prefix: OPENWEATHERMAP__HEDGE__
+    GET 요청이 일정 시간 안에 응답하지 않으면 같은 요청을 한 번 더 보내고 먼저 온 응답 사용
+    """
+    enabled: bool = False
+    percentile: float = 95  # 최근 응답 시간의 이 percentile이 지나도 응답이 없으면 hedge 요청
+    min_delay: float = 0.05  # seconds
+    max_delay: float = 2  # seconds, 응답 시간 표본이 부족할 때도 사용
+    min_samples: int = 100  # 응답 시간 표본이 이보다 적으면 max_delay 사용
+    max_samples: int = 1000  # 최근 응답 시간 표본 수
+    budget_ratio: float = 0.05  # 전체 요청 대비 hedge 요청 비율 상한 (quota 보호)
+    max_burst: int = 10  # 한 번에 사용할 수 있는 최대 hedge 요청 수
+
+
+class CityIndexSettings(BaseModel):
+    """
+    prefix: OPENWEATHERMAP__CITY_INDEX__
+    도시 ID 색인 (python -m infrastructure.openweather.city_index 로 생성)
+    """
+    path: str = ""  # 비어 있으면 색인 없이 도시 이름(q)으로 조회
+    reject_unknown: bool = False  # 색인에 없는 도시 이름은 upstream 조회 없이 not found 처리
+
+
 class OpenWeatherSettings(BaseModel):
     host: str = ""
     api_key: str = ""
-
-
+    http: HttpClientSettings = HttpClientSettings()
+    circuit_breaker: CircuitBreakerSettings = CircuitBreakerSettings()
+    hedge: HedgeSettings = HedgeSettings()
+    city_index: CityIndexSettings = CityIndexSettings()
+    # 디버깅용: upstream 응답 전체를 WeatherResponse로 검증 (기본은 도메인 모델에 필요한 필드만 파싱)
+    strict_validation: bool = False
+    # 여러 도시 조회 중 색인으로 도시 ID가 정해지지 않는 도시를 도시마다 조회할 때 동시 조회 수 (worker 단위)
+    single_concurrency: int = 20
@@ -0,0 +1,208 @@
+import json
+import math
+import struct
+from abc import ABC, abstractmethod
+from dataclasses import asdict
+from enum import Enum
+
+from dacite import from_dict
+
+from domain.weather.data.model import Weather, WeatherNotFound
+
+# MARK: - Interned strings
+# https://openweathermap.org/weather-conditions
+# 인덱스가 저장된 값에 포함되므로 항목은 뒤에만 추가 (순서 변경, 삭제 금지)
+CONDITIONS = (
+    "Thunderstorm", "Drizzle", "Rain", "Snow", "Mist", "Smoke", "Haze", "Dust", "Fog", "Sand", "Ash", "Squall",
+    "Tornado", "Clear", "Clouds",
+)
+DESCRIPTIONS = (
+    "thunderstorm with light rain", "thunderstorm with rain", "thunderstorm with heavy rain", "light thunderstorm",
+    "thunderstorm", "heavy thunderstorm", "ragged thunderstorm", "thunderstorm with light drizzle",
+    "thunderstorm with drizzle", "thunderstorm with heavy drizzle",
+    "light intensity drizzle", "drizzle", "heavy intensity drizzle", "light intensity drizzle rain", "drizzle rain",
+    "heavy intensity drizzle rain", "shower rain and drizzle", "heavy shower rain and drizzle", "shower drizzle",
+    "light rain", "moderate rain", "heavy intensity rain", "very heavy rain", "extreme rain", "freezing rain",
+    "light intensity shower rain", "shower rain", "heavy intensity shower rain", "ragged shower rain",
+    "light snow", "snow", "heavy snow", "sleet", "light shower sleet", "shower sleet", "light rain and snow",
+    "rain and snow", "light shower snow", "shower snow", "heavy shower snow",
+    "mist", "smoke", "haze", "sand/dust whirls", "fog", "sand", "dust", "volcanic ash", "squalls", "tornado",
+    "clear sky", "few clouds", "scattered clouds", "broken clouds", "overcast clouds",
+)
+_CONDITION_INDEX = {it: i for i, it in enumerate(CONDITIONS)}
+_DESCRIPTION_INDEX = {it: i for i, it in enumerate(DESCRIPTIONS)}
+_INLINE = 0xFF  # table에 없는 문자열은 길이 + utf-8로 저장
+
+
+class WeatherCodecType(str, Enum):
+    JSON = "json"
+    BINARY = "binary"
+
+
+class WeatherCodec(ABC):
+    """
+    캐시 값 인코딩
+    decode는 모든 포맷을 읽을 수 있어야 함 (배포 중 이전 포맷으로 저장된 값이 남아있음)
+    """
+
+    @abstractmethod
+    def encode(self, value: Weather | WeatherNotFound) -> bytes:
+        pass
+
+    def decode(self, data: bytes) -> Weather | WeatherNotFound:
+        if data[:1] == b"{":
+            return _decode_json(data)
+        if data[0] == 3:
+            return BinaryWeatherCodec.decode_v3(data)
+        if data[0] == 2:
+            return BinaryWeatherCodec.decode_v2(data)
+        if data[0] == 1:
+            return BinaryWeatherCodec.decode_v1(data)
+        raise ValueError(f"unknown weather codec version: {data[0]}")
+
+
+class JsonWeatherCodec(WeatherCodec):
+    """
+    json 문자열 (version byte 없음, 첫 바이트가 '{')
+    """
+
+    def encode(self, value: Weather | WeatherNotFound) -> bytes:
+        data = asdict(value)
+        if isinstance(value, WeatherNotFound):
+            data = {"not_found": True, **data}
+        return json.dumps(data).encode()
+
+
+class BinaryWeatherCodec(WeatherCodec):
+    """
+    version(1) | kind(1) | stale_at(8) | expires_at(8) | dt(8) | city_id(4) | city | conditions
+    - 시각이 없으면 NaN, dt, city_id가 없으면 0
+    - 문자열: 길이(2) + utf-8
+    - conditions: 개수(1) + [condition, description], table에 있는 문자열은 인덱스(1)만 저장
+    - v1: dt 없음, v2: city_id 없음
+    """
+    VERSION = 3
+    _HEADER = struct.Struct("<BBddqI")
+    _HEADER_V2 = struct.Struct("<BBddq")
+    _HEADER_V1 = struct.Struct("<BBdd")
+    _KIND_WEATHER = 0
+    _KIND_NOT_FOUND = 1
+
+    def encode(self, value: Weather | WeatherNotFound) -> bytes:
+        if isinstance(value, WeatherNotFound):
+            return self._HEADER.pack(self.VERSION, self._KIND_NOT_FOUND, math.nan, _pack_time(value.expires_at), 0, 0) \
+                + _pack_str(value.city)
+
+        parts = [
+            self._HEADER.pack(
+                self.VERSION,
+                self._KIND_WEATHER,
+                _pack_time(value.stale_at),
+                _pack_time(value.expires_at),
+                value.dt or 0,
+                value.city_id or 0,
+            ),
+            _pack_str(value.city),
+            bytes((len(value.conditions),)),
+        ]
+        for condition in value.conditions:
+            parts.append(_pack_interned(condition.condition, _CONDITION_INDEX))
+            parts.append(_pack_interned(condition.description, _DESCRIPTION_INDEX))
+        return b"".join(parts)
+
+    @classmethod
+    def decode_v3(cls, data: bytes) -> Weather | WeatherNotFound:
+        _, kind, stale_at, expires_at, dt, city_id = cls._HEADER.unpack_from(data)
+        return cls._decode_body(data, cls._HEADER.size, kind, stale_at, expires_at, dt, city_id)
+
+    @classmethod
+    def decode_v2(cls, data: bytes) -> Weather | WeatherNotFound:
+        _, kind, stale_at, expires_at, dt = cls._HEADER_V2.unpack_from(data)
+        return cls._decode_body(data, cls._HEADER_V2.size, kind, stale_at, expires_at, dt)
+
+    @classmethod
+    def decode_v1(cls, data: bytes) -> Weather | WeatherNotFound:
+        _, kind, stale_at, expires_at = cls._HEADER_V1.unpack_from(data)
+        return cls._decode_body(data, cls._HEADER_V1.size, kind, stale_at, expires_at, 0)
+
+    @classmethod
+    def _decode_body(
+            cls,
+            data: bytes,
+            offset: int,
+            kind: int,
+            stale_at: float,
+            expires_at: float,
+            dt: int,
+            city_id: int = 0,
+    ) -> Weather | WeatherNotFound:
+        city, offset = _unpack_str(data, offset)
+
+        if kind == cls._KIND_NOT_FOUND:
+            return WeatherNotFound(city=city, expires_at=_unpack_time(expires_at))
+
+        count = data[offset]
+        offset += 1
+        conditions = []
+        for _ in range(count):
+            condition, offset = _unpack_interned(data, offset, CONDITIONS)
+            description, offset = _unpack_interned(data, offset, DESCRIPTIONS)
+            conditions.append(Weather.Condition(condition=condition, description=description))
+
+        return Weather(
+            city=city,
+            conditions=conditions,
+            dt=dt or None,
+            city_id=city_id or None,
+            stale_at=_unpack_time(stale_at),
+            expires_at=_unpack_time(expires_at),
+        )
+
+
+def create_weather_codec(codec_type: WeatherCodecType) -> WeatherCodec:
+    match codec_type:
+        case WeatherCodecType.BINARY:
+            return BinaryWeatherCodec()
+        case _:
+            return JsonWeatherCodec()
+
+
+# MARK: - private
+def _decode_json(data: bytes) -> Weather | WeatherNotFound:
+    value = json.loads(data)
+    if value.pop("not_found", False):
+        return from_dict(data_class=WeatherNotFound, data=value)
+    return from_dict(data_class=Weather, data=value)
+
+
+def _pack_time(value: float | None) -> float:
+    return math.nan if value is None else value
+
+
+def _unpack_time(value: float) -> float | None:
+    return None if math.isnan(value) else value
+
+
+def _pack_str(value: str) -> bytes:
+    encoded = value.encode()
+    return struct.pack("<H", len(encoded)) + encoded
+
+
+def _unpack_str(data: bytes, offset: int) -> tuple[str, int]:
+    (length,) = struct.unpack_from("<H", data, offset)
+    offset += 2
+    return data[offset:offset + length].decode(), offset + length
+
+
+def _pack_interned(value: str, index: dict[str, int]) -> bytes:
+    i = index.get(value)
+    if i is not None:
+        return bytes((i,))
+    return bytes((_INLINE,)) + _pack_str(value)
+
+
+def _unpack_interned(data: bytes, offset: int, table: tuple[str, ...]) -> tuple[str, int]:
+    i = data[offset]
+    if i != _INLINE:
+        return table[i], offset + 1
+    return _unpack_str(data, offset + 1)
@@ -0,0 +1,47 @@
+import uuid
+
+from redis.asyncio import Redis
+from redis.exceptions import WatchError
+
+from domain.shared.leader_lease import LeaderLease
+
+
+class RedisLeaderLease(LeaderLease):
+    """
+    key: leader worker의 token, ttl마다 갱신하지 않으면 만료
+    """
+
+    def __init__(self, redis: Redis, key: str, ttl: float):
+        self.redis = redis
+        self.key = key
+        self.ttl = ttl
+        self.token = uuid.uuid4().hex
+
+    async def acquire(self) -> bool:
+        if await self.redis.set(self.key, self.token, nx=True, px=int(self.ttl * 1000)):
+            return True
+
+        # 이미 leader이면 만료 시간 갱신, 다른 worker의 lease는 변경하지 않도록 token 비교
+        async with self.redis.pipeline(transaction=True) as pipe:
+            try:
+                await pipe.watch(self.key)
+                if await pipe.get(self.key) != self.token.encode():
+                    return False
+                pipe.multi()
+                pipe.pexpire(self.key, int(self.ttl * 1000))
+                await pipe.execute()
+                return True
+            except WatchError:
+                return False
+
+    async def release(self) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            try:
+                await pipe.watch(self.key)
+                if await pipe.get(self.key) != self.token.encode():
+                    return
+                pipe.multi()
+                pipe.delete(self.key)
+                await pipe.execute()
+            except WatchError:
+                pass
@@ -1,24 +1,86 @@
 from typing import Optional
-from redis.asyncio import Redis
+from redis.asyncio import Redis, BlockingConnectionPool
+from redis.asyncio.cluster import RedisCluster, ClusterNode
+from redis.asyncio.retry import Retry
+from redis.asyncio.sentinel import Sentinel, SentinelConnectionPool
+from redis.backoff import ExponentialWithJitterBackoff
 import logging
 
+from infrastructure.redis.settings import RedisSettings, RedisMode
+
 logger = logging.getLogger(__name__)
 
+
+class SentinelBlockingConnectionPool(SentinelConnectionPool, BlockingConnectionPool):
+    """
+    sentinel이 알려준 master로 연결, max_connections를 넘으면 connection이 반환될 때까지 대기
+    """
+    pass
+
+
+def create_redis_client(settings: RedisSettings) -> Redis | RedisCluster:
+    """
+    - standalone, sentinel: BlockingConnectionPool (Redis가 느릴 때 connection을 계속 만들지 않고 pool_timeout 동안 대기)
+    - cluster: node별 connection pool
+    """
+    # 캐시 값이 binary일 수 있으므로 decode 하지 않음
+    options = dict(
+        password=settings.password,
+        decode_responses=False,
+        socket_timeout=settings.socket_timeout,
+        socket_connect_timeout=settings.socket_connect_timeout,
+        health_check_interval=settings.health_check_interval,
+        retry=Retry(
+            ExponentialWithJitterBackoff(base=settings.retry_backoff_base, cap=settings.retry_backoff_cap),
+            settings.retry_attempts,
+        ),
+    )
+
+    if settings.mode == RedisMode.CLUSTER:
+        return RedisCluster(
+            startup_nodes=[ClusterNode(host, port) for host, port in settings.addresses],
+            max_connections=settings.max_connections,
+            **options,
+        )
+
+    if settings.mode == RedisMode.SENTINEL:
+        sentinel = Sentinel(
+            settings.addresses,
+            socket_timeout=settings.socket_timeout,
+            socket_connect_timeout=settings.socket_connect_timeout,
+        )
+        return sentinel.master_for(
+            settings.sentinel_service_name,
+            connection_pool_class=SentinelBlockingConnectionPool,
+            max_connections=settings.max_connections,
+            timeout=settings.pool_timeout,
+            **options,
+        )
+
+    pool = BlockingConnectionPool.from_url(
+        settings.url,
+        max_connections=settings.max_connections,
+        timeout=settings.pool_timeout,
+        **options,
+    )
+    return Redis.from_pool(pool)
+
+
 class RedisManager:
     def __init__(self):
-        self.client: Optional[Redis] = None
+        self.client: Optional[Redis | RedisCluster] = None
 
-    async def connect(self, redis_url: str):
-        self.client = Redis.from_url(redis_url, decode_responses=True)
+    async def connect(self, settings: RedisSettings):
+        self.client = create_redis_client(settings)
         await self.client.ping()
-        logger.info(f"Redis connected {redis_url}")
+        logger.info(f"Redis connected mode: {settings.mode.value} nodes: {settings.addresses}")
 
     async def close(self):
         if self.client:
             await self.client.aclose()
             logger.info(f"Redis disconnected")
 
-    def get_client(self) -> Redis:
+    def get_client(self) -> Redis | RedisCluster:
         if not self.client:
             raise RuntimeError("Redis client not connected. Call connect() first.")
         return self.client
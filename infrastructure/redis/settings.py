@@ -1,17 +1,68 @@
+from enum import Enum
+
 from pydantic import BaseModel
 from typing import Optional
 
+from infrastructure.redis.codec import WeatherCodecType
+
+
+class RedisMode(str, Enum):
+    STANDALONE = "standalone"
+    SENTINEL = "sentinel"  # nodes: sentinel 주소, master는 sentinel_service_name으로 조회
+    CLUSTER = "cluster"  # nodes: 처음 접속할 cluster node 주소
+
+
+class FetchLeaseSettings(BaseModel):
+    """
+    prefix: REDIS__FETCH_LEASE__
+    cache miss 시 여러 worker 중 하나만 upstream을 조회하도록 하는 분산 lease
+    """
+    enabled: bool = False
+    ttl: float = 10  # seconds, lease holder가 종료되어도 ttl 이후 다른 worker가 조회 가능
+    poll_interval: float = 0.05  # seconds
+    wait_timeout: float = 10  # seconds
+
 
 class RedisSettings(BaseModel):
     """
     prefix: REDIS__
     """
+    mode: RedisMode = RedisMode.STANDALONE
     host: str = ""
     port: int = 6379
     password: Optional[str] = None
+    nodes: list[str] = []  # "host:port", sentinel/cluster 에서 사용. 비어있으면 host:port
+    sentinel_service_name: str = "mymaster"
+
+    # connection pool (worker 단위, cluster는 node 단위)
+    max_connections: int = 50
+    # seconds, 모든 connection이 사용중이면 반환될 때까지 대기. 초과하면 ConnectionError
+    # (cluster는 대기하지 않고 바로 에러)
+    pool_timeout: float = 1
+    socket_timeout: float = 1  # seconds, 명령 응답 대기
+    socket_connect_timeout: float = 1  # seconds
+    health_check_interval: int = 30  # seconds, 이 시간 이상 사용하지 않은 connection은 사용 전 PING으로 확인
+    # timeout, 연결 에러 시 재시도 (exponential backoff + jitter)
+    retry_attempts: int = 1
+    retry_backoff_base: float = 0.01  # seconds
+    retry_backoff_cap: float = 0.1  # seconds
+
+    fetch_lease: FetchLeaseSettings = FetchLeaseSettings()
+    # 캐시 값 저장 포맷. 조회는 포맷과 관계없이 가능하므로, 모든 worker 배포 후 binary로 변경
+    codec: WeatherCodecType = WeatherCodecType.JSON
 
     @property
     def url(self) -> str:
         if self.password:
             return f"redis://:{self.password}@{self.host}:{self.port}"
         return f"redis://{self.host}:{self.port}"
+
+    @property
+    def hash_tags(self) -> bool:
+        return self.mode == RedisMode.CLUSTER
+
+    @property
+    def addresses(self) -> list[tuple[str, int]]:
+        if not self.nodes:
+            return [(self.host, self.port)]
+        return [(host, int(port)) for host, port in (node.rsplit(":", 1) for node in self.nodes)]
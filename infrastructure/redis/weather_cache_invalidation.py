@@ -0,0 +1,67 @@
+import asyncio
+import logging
+import uuid
+from typing import Callable
+
+from redis.asyncio import Redis
+
+from domain.weather.data.query import normalize_city
+
+logger = logging.getLogger(__name__)
+
+
+class RedisWeatherCacheInvalidation:
+    """
+    worker 간 L1 캐시 일관성 유지를 위한 pub/sub 채널
+    한 worker가 캐시를 갱신하면 다른 worker의 L1 항목을 삭제
+    """
+    CHANNEL = 'weather:invalidate'
+    RECONNECT_DELAY = 1  # seconds
+
+    def __init__(self, redis: Redis):
+        self.redis = redis
+        self.node_id = uuid.uuid4().hex  # 자신이 발행한 메시지 구분용
+        self._task: asyncio.Task | None = None
+
+    async def publish(self, *cities: str) -> None:
+        """
+        여러 도시는 줄바꿈으로 구분하여 하나의 메시지로 발행
+        """
+        if not cities:
+            return
+        await self.redis.publish(self.CHANNEL, f"{self.node_id} " + "\n".join(normalize_city(city) for city in cities))
+
+    def start(self, on_invalidate: Callable[[str], None], on_reconnect: Callable[[], None]) -> None:
+        """
+        on_invalidate: 다른 worker가 갱신한 도시 (정규화된 이름)
+        on_reconnect: 구독이 끊긴 동안의 메시지는 유실되므로 L1 전체 삭제 필요
+        """
+        self._task = asyncio.create_task(self._listen(on_invalidate, on_reconnect))
+
+    async def close(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _listen(self, on_invalidate: Callable[[str], None], on_reconnect: Callable[[], None]) -> None:
+        while True:
+            try:
+                async with self.redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+                    await pubsub.subscribe(self.CHANNEL)
+                    on_reconnect()
+                    logger.info(f"Redis subscribed {self.CHANNEL}")
+
+                    async for message in pubsub.listen():
+                        node_id, _, cities = message["data"].decode().partition(" ")
+                        if node_id != self.node_id:
+                            for city in cities.split("\n"):
+                                on_invalidate(city)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Redis subscription lost {self.CHANNEL}: {e}")
+                await asyncio.sleep(self.RECONNECT_DELAY)
@@ -1,50 +1,294 @@
-import json
+import asyncio
+import struct
+import time
+import uuid
 
-from dataclasses import asdict
-from dacite import from_dict
+from dataclasses import replace
+from typing import Callable
 from redis.asyncio import Redis
+from redis.exceptions import WatchError
 
-from domain.weather.data.model import Weather
-from domain.weather.data.query import WeatherListByCitiesQuery, WeatherByCityQuery
+from domain.weather.data.model import Weather, WeatherNotFound, RenderedWeather
+from domain.weather.data.query import WeatherListByCitiesQuery, WeatherByCityQuery, WeatherByCoordQuery, normalize_city
 from domain.weather.repository import WeatherCacheRepository
+from infrastructure.metrics.prometheus import (
+    CACHE_GET_DURATION,
+    CACHE_SET_DURATION,
+    REDIS_HITS,
+    REDIS_MISSES,
+    REDIS_RENDERED_HITS,
+    REDIS_RENDERED_MISSES,
+)
+from infrastructure.redis.codec import WeatherCodec, JsonWeatherCodec
+from infrastructure.redis.settings import FetchLeaseSettings
 
 
 class RedisWeatherCacheRepository(WeatherCacheRepository):
     CITY_WEATHER_KEY = 'weather:city'
-    CITY_WEATHER_TTL = 600  # milliseconds
+    CITY_WEATHER_TTL = 600  # seconds
+    CITY_ID_WEATHER_KEY = 'weather:id'
+    CITY_ALIAS_KEY = 'weather:alias'  # 정규화한 도시 이름 -> OpenWeather city id
+    CITY_ALIAS_TTL = 86400  # seconds, 날씨를 저장할 때마다 갱신 (더 이상 요청하지 않는 표기는 만료)
+    CITY_FETCH_LEASE_KEY = 'weather:lease:city'
+    CITY_RENDERED_KEY = 'weather:rendered:city'
+    COORD_WEATHER_KEY = 'weather:coord'
+    RENDERED_HEADER = struct.Struct('<dq')  # stale_at, dt (없으면 0)
 
-    def __init__(self, redis: Redis):
+    def __init__(
+            self,
+            redis: Redis,
+            fetch_lease: FetchLeaseSettings | None = None,
+            codec: WeatherCodec | None = None,
+            renderer: Callable[[Weather], bytes] | None = None,
+            hash_tags: bool = False,
+    ):
         self.redis = redis
+        self.fetch_lease = fetch_lease or FetchLeaseSettings()
+        self.codec = codec or JsonWeatherCodec()
+        # 지정하면 날씨 저장 시 응답 조각을 soft ttl 동안 함께 저장
+        self.renderer = renderer
+        # Redis Cluster: key의 도시 부분을 hash tag로 감싸서 같은 도시의 key(날씨, 응답 조각, lease)를 같은 slot에 저장
+        # ex. weather:city:{seoul}, weather:rendered:city:{seoul}
+        self.hash_tags = hash_tags
+
+    def _key(self, prefix: str, name: str | int) -> str:
+        return f"{prefix}:{{{name}}}" if self.hash_tags else f"{prefix}:{name}"
 
     def _city_weather_key(self, city: str) -> str:
-        return f"{self.CITY_WEATHER_KEY}:{city.lower()}"
+        return self._key(self.CITY_WEATHER_KEY, normalize_city(city))
+
+    def _city_id_weather_key(self, city_id: int) -> str:
+        return self._key(self.CITY_ID_WEATHER_KEY, city_id)
+
+    def _city_alias_key(self, city: str) -> str:
+        return self._key(self.CITY_ALIAS_KEY, normalize_city(city))
+
+    def _city_fetch_lease_key(self, city: str) -> str:
+        return self._key(self.CITY_FETCH_LEASE_KEY, normalize_city(city))
+
+    def _city_rendered_key(self, city: str) -> str:
+        return self._key(self.CITY_RENDERED_KEY, normalize_city(city))
+
+    @staticmethod
+    def _city_names(weather: Weather, alias: str | None) -> list[str]:
+        """
+        요청한 도시 이름, upstream이 반환한 도시 이름 (정규화, 중복 제거)
+        """
+        return list(dict.fromkeys([normalize_city(alias or weather.city), normalize_city(weather.city)]))
+
+    async def save_weather_city(self, weather: Weather, ttl: int = CITY_WEATHER_TTL, alias: str | None = None) -> None:
+        await self.save_weather_cities([weather], ttl, [alias])
+
+    async def save_weather_cities(
+            self,
+            weathers: list[Weather],
+            ttl: int = CITY_WEATHER_TTL,
+            aliases: list[str | None] | None = None,
+    ) -> None:
+        """
+        city_id가 있으면 weather:id:{city_id} 하나에 저장하고 도시 이름별로 weather:alias:{city}에 city_id 기록
+        - 이름별 항목(negative cache 등)은 삭제, 조회 시 이름별 항목이 우선
+        city_id가 없으면 도시 이름별로 저장
+        """
+        if not weathers:
+            return
+
+        expires_at = time.time() + ttl
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for weather, alias in zip(weathers, aliases or [None] * len(weathers)):
+                value = self.codec.encode(replace(weather, expires_at=expires_at))
+                names = self._city_names(weather, alias)
+                if weather.city_id:
+                    await pipe.set(self._city_id_weather_key(weather.city_id), value, ex=ttl)
+                    # cluster에서는 여러 key 명령이 같은 slot에만 가능하므로 key별로 명령
+                    for name in names:
+                        await pipe.set(self._city_alias_key(name), weather.city_id, ex=max(ttl, self.CITY_ALIAS_TTL))
+                        await pipe.delete(self._city_weather_key(name))
+                else:
+                    for name in names:
+                        await pipe.set(self._city_weather_key(name), value, ex=ttl)
+                if self.renderer:
+                    await self._set_rendered(pipe, weather, expires_at, names)
+
+            with CACHE_SET_DURATION.time():
+                await pipe.execute()
 
-    async def save_weather_city(self, weather: Weather, ttl: int = CITY_WEATHER_TTL) -> None:
-        key = self._city_weather_key(weather.city)
-        value = json.dumps(asdict(weather))
-        await self.redis.set(key, value, ex=ttl)
+    async def save_weather_city_not_found(self, city: str, ttl: int) -> None:
+        key = self._city_weather_key(city)
+        value = self.codec.encode(WeatherNotFound(city=city, expires_at=time.time() + ttl))
+        if not self.renderer:
+            await self.redis.set(key, value, ex=ttl)
+            return
 
-    async def get_weather_city(self, query: WeatherByCityQuery) -> Weather | None:
-        key = self._city_weather_key(query.city)
-        value = await self.redis.get(key)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            await pipe.set(key, value, ex=ttl)
+            await pipe.delete(self._city_rendered_key(city))
+            await pipe.execute()
+
+    async def get_weather_city(self, query: WeatherByCityQuery) -> Weather | WeatherNotFound | None:
+        with CACHE_GET_DURATION.time():
+            [value] = await self._get_city_values([query.city])
 
         if not value:
+            REDIS_MISSES.inc()
             return None
 
-        return from_dict(data_class=Weather, data=json.loads(value))
+        REDIS_HITS.inc()
+        return self.codec.decode(value)
 
-    async def get_weather_cities(self, query: WeatherListByCitiesQuery) -> list[Weather]:
+    async def get_weather_cities(self, query: WeatherListByCitiesQuery) -> list[Weather | WeatherNotFound | None]:
         if not query.cities:
             return []
 
-        async with self.redis.pipeline() as pipe:
-            for city in query.cities:
+        with CACHE_GET_DURATION.time():
+            values = await self._get_city_values(query.cities)
+
+        hits = sum(1 for value in values if value)
+        REDIS_HITS.inc(hits)
+        REDIS_MISSES.inc(len(values) - hits)
+        return [self.codec.decode(value) if value else None for value in values]
+
+    async def _get_city_values(self, cities: list[str]) -> list[bytes | None]:
+        """
+        1. 도시 이름별 항목, 도시 이름의 city_id(weather:alias:{city}) 조회 (pipeline)
+        2. 이름별 항목이 없고 city_id가 있으면 weather:id:{city_id} 조회
+        - 이름별 항목만 있던 이전보다 round trip이 하나 늘 수 있지만, 반복 조회는 L1에서 처리
+        """
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for city in cities:
                 await pipe.get(self._city_weather_key(city))
+                await pipe.get(self._city_alias_key(city))
+            results = await pipe.execute()
+        values, city_ids = results[0::2], results[1::2]
+
+        missing = [i for i, (value, city_id) in enumerate(zip(values, city_ids)) if not value and city_id]
+        if not missing:
+            return values
 
-            values = await pipe.execute()
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for i in missing:
+                await pipe.get(self._city_id_weather_key(int(city_ids[i])))
+            for i, value in zip(missing, await pipe.execute()):
+                values[i] = value
+        return values
+
+    # MARK: - coordinate
+    def _coord_weather_key(self, query: WeatherByCoordQuery) -> str:
+        return self._key(self.COORD_WEATHER_KEY, query.cell_key)
+
+    async def get_weather_coord(self, query: WeatherByCoordQuery) -> Weather | None:
+        with CACHE_GET_DURATION.time():
+            value = await self.redis.get(self._coord_weather_key(query))
+
+        if not value:
+            REDIS_MISSES.inc()
+            return None
 
-        return [
-            from_dict(data_class=Weather, data=json.loads(value))
-            for value in values
+        REDIS_HITS.inc()
+        return self.codec.decode(value)
+
+    async def save_weather_coord(self, query: WeatherByCoordQuery, weather: Weather, ttl: int) -> None:
+        value = self.codec.encode(replace(weather, expires_at=time.time() + ttl))
+        with CACHE_SET_DURATION.time():
+            await self.redis.set(self._coord_weather_key(query), value, ex=ttl)
+
+    # MARK: - rendered response
+    async def get_rendered_weather_city(self, query: WeatherByCityQuery) -> RenderedWeather | None:
+        if not self.renderer:
+            return await super().get_rendered_weather_city(query)
+
+        with CACHE_GET_DURATION.time():
+            value = await self.redis.get(self._city_rendered_key(query.city))
+        if not value:
+            REDIS_RENDERED_MISSES.inc()
+            return None
+        REDIS_RENDERED_HITS.inc()
+        return self._decode_rendered(query.city, value)
+
+    async def get_rendered_weather_cities(self, query: WeatherListByCitiesQuery) -> list[RenderedWeather]:
+        if not self.renderer or not query.cities:
+            return await super().get_rendered_weather_cities(query)
+
+        # MGET 대신 pipeline (cluster에서는 node별로 나눠서 실행)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for city in query.cities:
+                await pipe.get(self._city_rendered_key(city))
+            with CACHE_GET_DURATION.time():
+                values = await pipe.execute()
+        rendered = [
+            self._decode_rendered(city, value)
+            for city, value in zip(query.cities, values)
             if value
         ]
+        REDIS_RENDERED_HITS.inc(len(rendered))
+        REDIS_RENDERED_MISSES.inc(len(values) - len(rendered))
+        return rendered
+
+    async def _set_rendered(self, pipe, weather: Weather, expires_at: float, names: list[str]) -> None:
+        """
+        soft ttl이 지나면 삭제되도록 저장 (이후에는 일반 조회 경로에서 stale 처리, 갱신)
+        value: stale_at(8 bytes) + dt(8 bytes) + 응답 조각
+        """
+        stale_at = min(weather.stale_at or expires_at, expires_at)
+        px = int((stale_at - time.time()) * 1000)
+        if px <= 0:
+            return
+        value = self.RENDERED_HEADER.pack(stale_at, weather.dt or 0) + self.renderer(weather)
+        for name in names:
+            await pipe.set(self._city_rendered_key(name), value, px=px)
+
+    def _decode_rendered(self, city: str, value: bytes) -> RenderedWeather:
+        stale_at, dt = self.RENDERED_HEADER.unpack_from(value)
+        return RenderedWeather(city=city, body=value[self.RENDERED_HEADER.size:], stale_at=stale_at, dt=dt or None)
+
+    # MARK: - fetch lease
+    async def acquire_fetch_lease(self, query: WeatherByCityQuery) -> str | None:
+        if not self.fetch_lease.enabled:
+            return await super().acquire_fetch_lease(query)
+
+        token = uuid.uuid4().hex
+        acquired = await self.redis.set(
+            self._city_fetch_lease_key(query.city),
+            token,
+            nx=True,
+            px=int(self.fetch_lease.ttl * 1000),
+        )
+        return token if acquired else None
+
+    async def release_fetch_lease(self, query: WeatherByCityQuery, token: str) -> None:
+        if not self.fetch_lease.enabled:
+            return
+
+        # 다른 worker가 ttl 만료 후 새로 획득한 lease는 삭제하지 않도록 token 비교 후 삭제
+        key = self._city_fetch_lease_key(query.city)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            try:
+                await pipe.watch(key)
+                if await pipe.get(key) != token.encode():
+                    return
+                pipe.multi()
+                pipe.delete(key)
+                await pipe.execute()
+            except WatchError:
+                pass
+
+    async def wait_weather_city(self, query: WeatherByCityQuery) -> Weather | WeatherNotFound | None:
+        if not self.fetch_lease.enabled:
+            return await super().wait_weather_city(query)
+
+        lease_key = self._city_fetch_lease_key(query.city)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.fetch_lease.wait_timeout
+
+        while loop.time() < deadline:
+            await asyncio.sleep(self.fetch_lease.poll_interval)
+
+            # lease 해제 전에 저장하므로 lease 확인 -> 값 조회 순서
+            lease_exists = await self.redis.exists(lease_key)
+            [value] = await self._get_city_values([query.city])
+            if value:
+                return self.codec.decode(value)
+            if not lease_exists:
+                return None
+
+        return None
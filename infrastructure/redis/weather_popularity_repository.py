@@ -0,0 +1,31 @@
+from redis.asyncio import Redis
+
+from domain.weather.popularity import WeatherPopularityRepository
+
+
+class RedisWeatherPopularityRepository(WeatherPopularityRepository):
+    """
+    sorted set (member: 정규화된 도시 이름, score: 요청 수), 모든 worker가 합산
+    """
+    POPULARITY_KEY = 'weather:popularity'
+
+    def __init__(self, redis: Redis):
+        self.redis = redis
+
+    async def increment(self, counts: dict[str, int]) -> None:
+        if not counts:
+            return
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for city, count in counts.items():
+                pipe.zincrby(self.POPULARITY_KEY, count, city)
+            await pipe.execute()
+
+    async def top(self, n: int) -> list[str]:
+        return [it.decode() for it in await self.redis.zrevrange(self.POPULARITY_KEY, 0, n - 1)]
+
+    async def decay(self, factor: float, max_size: int) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.zunionstore(self.POPULARITY_KEY, {self.POPULARITY_KEY: factor})
+            # 점수가 낮은 도시부터 삭제
+            pipe.zremrangebyrank(self.POPULARITY_KEY, 0, -(max_size + 1))
+            await pipe.execute()
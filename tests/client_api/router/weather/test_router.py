@@ -0,0 +1,56 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from client_api.dependency import get_weather_service, get_weather_popularity
+from client_api.router.weather.router import router
+from client_api.settings import settings
+from domain.shared import deadline
+from domain.weather.data.model import Weather
+from domain.weather.data.query import WeatherByCityQuery
+from domain.weather.service import WeatherService
+from domain.weather.settings import WeatherSettings
+from tests.domain.weather.test_service import FakeWeatherCacheRepository, FakeWeatherProvider
+
+
+class SlowWeatherProvider(FakeWeatherProvider):
+    def __init__(self):
+        super().__init__()
+        self.remaining: list[float | None] = []
+
+    async def get(self, query: WeatherByCityQuery) -> Weather:
+        self.remaining.append(deadline.remaining())
+        await asyncio.sleep(0.3)
+        return await super().get(query)
+
+
+def _app(service: WeatherService) -> FastAPI:
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_weather_service] = lambda: service
+    app.dependency_overrides[get_weather_popularity] = lambda: None
+    return app
+
+
+@pytest.mark.unit
+class TestWeatherBatchStream:
+    async def test_stream_sets_batch_deadline(self, monkeypatch):
+        """스트리밍 배치 조회도 upstream 조회에 batch_deadline 적용"""
+        monkeypatch.setattr(settings.weather, "batch_deadline", 0.1)
+        provider = SlowWeatherProvider()
+        service = WeatherService(FakeWeatherCacheRepository(), provider, settings=WeatherSettings(batch_deadline=0.1))
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=_app(service)), base_url="http://test") as client:
+            response = await client.post(
+                "/weather/batch",
+                json={"cities": ["Seoul"]},
+                headers={"Accept": "application/x-ndjson"},
+            )
+
+        items = [json.loads(line) for line in response.text.splitlines()]
+        assert [it["status"] for it in items] == ["timeout"]
+        assert len(provider.remaining) == 1
+        assert provider.remaining[0] is not None and 0 < provider.remaining[0] <= 0.1
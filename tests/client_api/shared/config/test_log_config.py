@@ -0,0 +1,109 @@
+import json
+import logging
+import sys
+
+import pytest
+
+from client_api.settings import LogFormat, LogSettings
+from client_api.shared.config.log_config import (
+    JsonFormatter,
+    SamplingFilter,
+    create_log_config,
+    create_queue_handler,
+)
+
+
+def _record(name: str, level: int = logging.INFO, msg: str = "message", args: tuple = ()) -> logging.LogRecord:
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+@pytest.mark.unit
+class TestSamplingFilter:
+    def test_sample_rate(self):
+        """
+        대상 logger(하위 logger 포함)의 WARNING 미만 로그만 sample_rate로 거름
+        """
+        log_filter = SamplingFilter({"uvicorn.access": 0, "infrastructure.openweather": 0})
+
+        assert not log_filter.filter(_record("uvicorn.access"))
+        assert not log_filter.filter(_record("infrastructure.openweather.client", logging.DEBUG))
+        assert log_filter.filter(_record("infrastructure.openweather.client", logging.WARNING))
+        assert log_filter.filter(_record("uvicorn.accessor"))
+        assert log_filter.filter(_record("domain.weather.service"))
+
+    def test_full_rate(self):
+        log_filter = SamplingFilter({"uvicorn.access": 1})
+
+        assert all(log_filter.filter(_record("uvicorn.access")) for _ in range(100))
+
+    def test_partial_rate(self):
+        log_filter = SamplingFilter({"uvicorn.access": 0.5})
+
+        kept = sum(log_filter.filter(_record("uvicorn.access")) for _ in range(2000))
+        assert 800 < kept < 1200
+
+
+@pytest.mark.unit
+class TestJsonFormatter:
+    def test_format(self):
+        log = json.loads(JsonFormatter().format(_record("domain.weather", msg="도시 %s", args=("Seoul",))))
+
+        assert log["level"] == "INFO"
+        assert log["logger"] == "domain.weather"
+        assert log["message"] == "도시 Seoul"
+        assert "exception" not in log
+
+    def test_exception(self):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord("app", logging.ERROR, __file__, 1, "failed", (), sys.exc_info())
+
+        log = json.loads(JsonFormatter().format(record))
+
+        assert "ValueError: boom" in log["exception"]
+
+
+@pytest.mark.unit
+class TestQueueLogHandler:
+    def test_writes_in_listener_thread(self, tmp_path):
+        """
+        queue를 거쳐 파일에 기록, close 하면 남은 로그까지 기록
+        """
+        path = tmp_path / "app.log"
+        handler = create_queue_handler(LogFormat.JSON, str(path), 1024 * 1024, 1)
+        logger = logging.getLogger("tests.log_config.queue")
+        logger.propagate = False
+        logger.addHandler(handler)
+        try:
+            for i in range(10):
+                logger.warning("line %s", i)
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+        handler.close()  # 두 번 닫아도 안전
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [line["message"] for line in lines] == [f"line {i}" for i in range(10)]
+
+    def test_rotate(self, tmp_path):
+        path = tmp_path / "app.log"
+        handler = create_queue_handler(LogFormat.JSON, str(path), 200, 2)
+        logger = logging.getLogger("tests.log_config.rotate")
+        logger.propagate = False
+        logger.addHandler(handler)
+        try:
+            for i in range(50):
+                logger.warning("line %s", i)
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["app.log", "app.log.1", "app.log.2"]
+
+    def test_log_config(self):
+        config = create_log_config(LogSettings(file="", access_sample_rate=0.1))
+
+        assert config["handlers"]["queue"]["filename"] == ""
+        assert config["filters"]["sampling"]["rates"]["uvicorn.access"] == 0.1
+        assert all(logger["handlers"] == ["queue"] for logger in config["loggers"].values())
@@ -0,0 +1,49 @@
+import time
+
+import pytest
+
+from client_api.shared.dto.conditional import cache_headers, is_not_modified
+
+DT = 1700000000  # Tue, 14 Nov 2023 22:13:20 GMT
+
+
+@pytest.mark.unit
+class TestConditional:
+    def test_cache_headers(self):
+        headers = cache_headers(DT, time.time() + 60.5)
+
+        assert headers == {
+            "Cache-Control": "public, max-age=60",
+            "ETag": 'W/"6553f100"',
+            "Last-Modified": "Tue, 14 Nov 2023 22:13:20 GMT",
+        }
+
+    def test_cache_headers_without_dt(self):
+        """dt가 없으면(이전에 저장된 값) validator 없이 응답, stale 값은 max-age=0"""
+        assert cache_headers(None, time.time() - 1) == {"Cache-Control": "public, max-age=0"}
+
+    @pytest.mark.parametrize("if_none_match, expected", [
+        ('W/"6553f100"', True),
+        ('"6553f100"', True),
+        ('"a", W/"6553f100"', True),
+        ("*", True),
+        ('W/"6553f0ff"', False),
+    ])
+    def test_if_none_match(self, if_none_match, expected):
+        assert is_not_modified(DT, if_none_match, None) is expected
+
+    @pytest.mark.parametrize("if_modified_since, expected", [
+        ("Tue, 14 Nov 2023 22:13:20 GMT", True),
+        ("Wed, 15 Nov 2023 00:00:00 GMT", True),
+        ("Tue, 14 Nov 2023 22:13:19 GMT", False),
+        ("invalid", False),
+    ])
+    def test_if_modified_since(self, if_modified_since, expected):
+        assert is_not_modified(DT, None, if_modified_since) is expected
+
+    def test_if_none_match_precedence(self):
+        """If-None-Match가 있으면 If-Modified-Since 무시"""
+        assert not is_not_modified(DT, '"other"', "Wed, 15 Nov 2023 00:00:00 GMT")
+
+    def test_without_dt(self):
+        assert not is_not_modified(None, "*", None)
@@ -0,0 +1,51 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+from prometheus_client import REGISTRY
+
+from client_api.shared.middleware.metrics import MetricsMiddleware
+
+
+def _count(route: str, status: str) -> float:
+    value = REGISTRY.get_sample_value(
+        "http_request_duration_seconds_count",
+        {"method": "GET", "route": route, "status": status},
+    )
+    return value or 0
+
+
+@pytest.fixture
+async def client():
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: str):
+        return {"id": item_id}
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.mark.unit
+class TestMetricsMiddleware:
+    async def test_route_template(self, client):
+        """path가 아니라 route template으로 기록 (label 수 제한)"""
+        before = _count("/items/{item_id}", "200")
+
+        await client.get("/items/1")
+        await client.get("/items/2")
+
+        assert _count("/items/{item_id}", "200") == before + 2
+
+    async def test_unmatched(self, client):
+        before = _count("unmatched", "404")
+
+        await client.get("/unknown/path")
+
+        assert _count("unmatched", "404") == before + 1
+
+    async def test_in_progress_restored(self, client):
+        await client.get("/items/1")
+
+        assert REGISTRY.get_sample_value("http_requests_in_progress", {"method": "GET"}) == 0
@@ -0,0 +1,65 @@
+import json
+import logging
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from client_api.settings import ServerTimingSettings
+from client_api.shared.middleware.server_timing import register_server_timing
+from infrastructure.metrics.prometheus import CACHE_GET_DURATION
+from infrastructure.metrics.timing import record
+
+
+def _app(settings: ServerTimingSettings) -> FastAPI:
+    app = FastAPI()
+    register_server_timing(app, settings)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: str):
+        for _ in range(2):
+            with CACHE_GET_DURATION.time():
+                pass
+        record("upstream_retry_wait", 0.5)
+        return {"id": item_id}
+
+    return app
+
+
+async def _get(app: FastAPI, path: str) -> httpx.Response:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        return await client.get(path)
+
+
+@pytest.mark.unit
+class TestServerTiming:
+    async def test_header(self):
+        response = await _get(_app(ServerTimingSettings(enabled=True, slow_request_threshold=60)), "/items/1")
+
+        metrics = [it.split(";")[0] for it in response.headers["server-timing"].split(", ")]
+        assert metrics == ["cache_get", "upstream_retry_wait", "app"]
+        assert "upstream_retry_wait;dur=500.0" in response.headers["server-timing"]
+
+    async def test_disabled(self):
+        """비활성화 시 middleware를 등록하지 않음"""
+        app = _app(ServerTimingSettings(enabled=False))
+
+        response = await _get(app, "/items/1")
+
+        assert "server-timing" not in response.headers
+        assert app.user_middleware == []
+
+    async def test_slow_request_log(self, caplog):
+        """느린 요청은 단계별 소요 시간, 횟수를 json 한 줄로 로그"""
+        with caplog.at_level(logging.WARNING, logger="client_api.shared.middleware.server_timing"):
+            await _get(_app(ServerTimingSettings(enabled=True, slow_request_threshold=0)), "/items/1")
+
+        log = json.loads(caplog.records[-1].getMessage())
+        assert log["event"] == "slow_request"
+        assert log["path"] == "/items/1"
+        assert log["status"] == 200
+        assert log["stages"]["cache_get"]["count"] == 2
+
+    def test_record_outside_request(self):
+        """요청 밖에서는 기록하지 않음"""
+        record("cache_get", 1)
@@ -0,0 +1,36 @@
+import asyncio
+
+import pytest
+
+from domain.shared.deadline import deadline_scope, remaining
+
+
+@pytest.mark.unit
+class TestDeadline:
+    def test_without_deadline(self):
+        assert remaining() is None
+
+    def test_shorter_deadline_kept(self):
+        """이미 더 짧은 deadline이 있으면 유지"""
+        with deadline_scope(1):
+            with deadline_scope(10):
+                assert remaining() <= 1
+            with deadline_scope(0.5):
+                assert remaining() <= 0.5
+        assert remaining() is None
+
+    def test_detached(self):
+        with deadline_scope(1):
+            with deadline_scope(None):
+                assert remaining() is None
+
+    async def test_propagated_to_task(self):
+        """deadline 안에서 생성된 task에도 전달"""
+        with deadline_scope(1):
+            task = asyncio.create_task(_remaining())
+
+        assert 0 < await task <= 1
+
+
+async def _remaining() -> float | None:
+    return remaining()
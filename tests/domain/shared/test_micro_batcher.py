@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from domain.shared.micro_batcher import MicroBatcher
+
+
+class _Recorder:
+    def __init__(self):
+        self.batches: list[list[int]] = []
+
+    async def __call__(self, keys: list[int]) -> list[int | BaseException]:
+        self.batches.append(keys)
+        await asyncio.sleep(0)
+        return [ValueError(key) if key < 0 else key * 10 for key in keys]
+
+
+@pytest.mark.unit
+class TestMicroBatcher:
+    async def test_concurrent_loads_combined(self):
+        """window 안에 들어온 요청은 하나의 batch로 실행"""
+        fn = _Recorder()
+        batcher = MicroBatcher(fn, window=0.01, max_size=100)
+
+        results = await asyncio.gather(*(batcher.load(i) for i in range(5)))
+
+        assert results == [0, 10, 20, 30, 40]
+        assert fn.batches == [[0, 1, 2, 3, 4]]
+        assert batcher.stats.batches == 1
+        assert batcher.stats.max_batch_size == 5
+
+    async def test_max_size_flushes_immediately(self):
+        fn = _Recorder()
+        batcher = MicroBatcher(fn, window=10, max_size=2)
+
+        results = await asyncio.wait_for(asyncio.gather(*(batcher.load(i) for i in range(4))), timeout=1)
+
+        assert results == [0, 10, 20, 30]
+        assert fn.batches == [[0, 1], [2, 3]]
+
+    async def test_error_only_for_failed_key(self):
+        """요청별 예외는 해당 호출자에게만 전달"""
+        batcher = MicroBatcher(_Recorder(), window=0.01, max_size=100)
+
+        results = await asyncio.gather(batcher.load(1), batcher.load(-1), return_exceptions=True)
+
+        assert results[0] == 10
+        assert isinstance(results[1], ValueError)
+
+    async def test_batch_failure_for_all(self):
+        async def fail(keys: list[int]) -> list[int]:
+            raise RuntimeError("upstream")
+
+        batcher = MicroBatcher(fail, window=0.01, max_size=100)
+
+        results = await asyncio.gather(batcher.load(1), batcher.load(2), return_exceptions=True)
+
+        assert all(isinstance(it, RuntimeError) for it in results)
+
+    async def test_cancelled_caller_excluded(self):
+        """batch 실행 전에 취소된 요청은 제외"""
+        fn = _Recorder()
+        batcher = MicroBatcher(fn, window=0.01, max_size=100)
+
+        cancelled = asyncio.create_task(batcher.load(1))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        assert await batcher.load(2) == 20
+        assert fn.batches == [[2]]
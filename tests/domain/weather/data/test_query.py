@@ -0,0 +1,32 @@
+import pytest
+
+from domain.weather.data.query import WeatherByCoordQuery
+
+
+@pytest.mark.unit
+class TestWeatherByCoordQuery:
+    def test_quantize_to_cell_center(self):
+        """같은 격자 안의 좌표는 같은 격자 중심 좌표, 같은 key"""
+        cells = {
+            WeatherByCoordQuery(lat=lat, lon=lon).quantize(0.05).cell_key
+            for lat, lon in [(37.5665, 126.978), (37.5512, 126.9882), (37.5999, 126.9501)]
+        }
+
+        assert cells == {"37.575,126.975"}
+
+    def test_quantize_neighbor_cell(self):
+        assert WeatherByCoordQuery(lat=37.6001, lon=126.978).quantize(0.05).cell_key == "37.625,126.975"
+
+    @pytest.mark.parametrize("lat, lon, expected", [
+        (90, 180, "89.5,-179.5"),
+        (-90, -180, "-89.5,-179.5"),
+        (-33.8688, 151.2093, "-33.5,151.5"),
+    ])
+    def test_quantize_bounds(self, lat, lon, expected):
+        """극점, 날짜변경선(180 = -180)도 범위 안의 격자로"""
+        assert WeatherByCoordQuery(lat=lat, lon=lon).quantize(1).cell_key == expected
+
+    def test_no_quantize(self):
+        query = WeatherByCoordQuery(lat=37.5665, lon=126.978)
+
+        assert query.quantize(0) == query
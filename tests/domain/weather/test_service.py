@@ -1,23 +1,42 @@
+import asyncio
+import time
+
 import pytest
-from domain.weather.data.model import Weather
-from domain.weather.data.query import WeatherByCityQuery, WeatherListByCitiesQuery
+from domain.shared.background_refresher import BackgroundRefresher
+from domain.shared.single_flight import SingleFlight
+from domain.weather.data.model import Weather, WeatherNotFound, WeatherBatchItem, RenderedWeather
+from domain.weather.data.query import WeatherByCityQuery, WeatherByCoordQuery, WeatherListByCitiesQuery
+from domain.weather.error import WeatherProviderUnavailableError, WeatherNotFoundError
 from domain.weather.provider import WeatherProvider
 from domain.weather.repository import WeatherCacheRepository
-from domain.weather.service import WeatherService
+from domain.weather.service import WeatherService, create_weather_batcher
+from domain.weather.settings import WeatherSettings
 
 
 # Fake in-memory cache repository (Redis 대신 사용)
 class FakeWeatherCacheRepository(WeatherCacheRepository):
     def __init__(self):
         import time
-        self.cache: dict[str, tuple[Weather, float]] = {}  # (weather, expiry_time)
+        self.cache: dict[str, tuple[Weather | WeatherNotFound, float]] = {}  # (weather, expiry_time)
         self.time = time
+        self.save_weather_cities_count = 0
 
-    async def save_weather_city(self, weather: Weather, ttl: int) -> None:
+    async def save_weather_city(self, weather: Weather, ttl: int, alias: str | None = None) -> None:
         expiry_time = self.time.time() + ttl
         self.cache[weather.city] = (weather, expiry_time)
+        if alias:
+            self.cache[alias] = (weather, expiry_time)
+
+    async def save_weather_cities(self, weathers: list[Weather], ttl: int, aliases: list[str] | None = None) -> None:
+        self.save_weather_cities_count += 1
+        for weather, alias in zip(weathers, aliases or [None] * len(weathers)):
+            await self.save_weather_city(weather, ttl, alias)
+
+    async def save_weather_city_not_found(self, city: str, ttl: int) -> None:
+        expiry_time = self.time.time() + ttl
+        self.cache[city] = (WeatherNotFound(city=city), expiry_time)
 
-    async def get_weather_city(self, query: WeatherByCityQuery) -> Weather | None:
+    async def get_weather_city(self, query: WeatherByCityQuery) -> Weather | WeatherNotFound | None:
         if query.city not in self.cache:
             return None
 
@@ -30,20 +49,22 @@ class FakeWeatherCacheRepository(WeatherCacheRepository):
 
         return weather
 
-    async def get_weather_cities(self, query: WeatherListByCitiesQuery) -> list[Weather]:
+    async def get_weather_cities(self, query: WeatherListByCitiesQuery) -> list[Weather | WeatherNotFound | None]:
         results = []
         current_time = self.time.time()
 
         for city in query.cities:
+            weather = None
             if city in self.cache:
-                weather, expiry_time = self.cache[city]
+                cached, expiry_time = self.cache[city]
 
                 # TTL 체크
                 if current_time <= expiry_time:
-                    results.append(weather)
+                    weather = cached
                 else:
                     # 만료된 항목 삭제
                     del self.cache[city]
+            results.append(weather)
 
         return results
 
@@ -53,11 +74,22 @@ class FakeWeatherProvider(WeatherProvider):
     def __init__(self):
         self.call_count = 0
         self.called_cities = []
+        self.delay = 0.0  # 동시 요청 테스트용 응답 지연
+        self.error: Exception | None = None
+        self.not_found_cities: set[str] = set()
+        self.coords: list[WeatherByCoordQuery] = []
 
     async def get(self, query: WeatherByCityQuery) -> Weather:
         self.call_count += 1
         self.called_cities.append(query.city)
 
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        if query.city in self.not_found_cities:
+            raise WeatherNotFoundError(f"not found. city: {query.city}")
+
         return Weather(
             city=query.city,
             conditions=[
@@ -68,6 +100,14 @@ class FakeWeatherProvider(WeatherProvider):
             ]
         )
 
+    async def get_by_coord(self, query: WeatherByCoordQuery) -> Weather:
+        self.coords.append(query)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return Weather(city=f"{query.lat},{query.lon}", conditions=[])
+
 
 @pytest.fixture
 def cache_repo():
@@ -247,7 +287,7 @@ class TestWeatherService:
         assert cached2.city == "City2"
 
     async def test_get_weather_cities_with_expired(self, cache_repo):
-        """get_weather_cities에서 만료된 항목은 제외되는지 확인"""
+        """get_weather_cities에서 만료된 항목은 None으로 반환되는지 확인"""
         import time
 
         # 서로 다른 TTL로 여러 항목 저장
@@ -266,10 +306,512 @@ class TestWeatherService:
         query = WeatherListByCitiesQuery(cities=["Seoul", "Tokyo", "London"])
         results = await cache_repo.get_weather_cities(query)
 
-        assert len(results) == 1
-        assert results[0].city == "Tokyo"
+        assert results[0] is None
+        assert results[1].city == "Tokyo"
+        assert results[2] is None
 
         # 만료된 항목들은 캐시에서도 삭제되었는지 확인
         assert "Seoul" not in cache_repo.cache
         assert "London" not in cache_repo.cache
         assert "Tokyo" in cache_repo.cache
+
+
+@pytest.mark.unit
+class TestWeatherServiceSingleFlight:
+    async def test_concurrent_cache_miss_single_upstream_call(self, weather_service, weather_provider, cache_repo):
+        """같은 도시에 대한 동시 cache miss는 provider를 한 번만 호출"""
+        weather_provider.delay = 0.05
+        query = WeatherByCityQuery(city="Seoul")
+
+        results = await asyncio.gather(*[weather_service.get_weather_city(query) for _ in range(10)])
+
+        assert all(result.city == "Seoul" for result in results)
+        assert weather_provider.call_count == 1
+        assert weather_service.single_flight.stats.flights == 1
+        assert weather_service.single_flight.stats.callers == 10
+        assert weather_service.single_flight.stats.max_callers == 10
+
+    async def test_normalized_city_shares_flight(self, weather_service, weather_provider):
+        """대소문자, 공백만 다른 도시는 같은 조회를 공유"""
+        weather_provider.delay = 0.05
+
+        await asyncio.gather(
+            weather_service.get_weather_city(WeatherByCityQuery(city="Seoul")),
+            weather_service.get_weather_city(WeatherByCityQuery(city=" seoul ")),
+            weather_service.get_weather_city(WeatherByCityQuery(city="SEOUL")),
+        )
+
+        assert weather_provider.call_count == 1
+
+    async def test_error_shared_with_all_callers(self, weather_service, weather_provider):
+        """upstream 에러는 같은 조회를 기다리던 모든 호출자에게 전달"""
+        weather_provider.delay = 0.05
+        weather_provider.error = RuntimeError("upstream error")
+        query = WeatherByCityQuery(city="Seoul")
+
+        results = await asyncio.gather(
+            *[weather_service.get_weather_city(query) for _ in range(3)],
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert weather_provider.call_count == 1
+        assert weather_service.single_flight.stats.errors == 1
+
+    async def test_batch_shares_flight_with_single(self, cache_repo, weather_provider):
+        """배치 조회와 단건 조회가 동시에 발생해도 같은 도시는 한 번만 조회"""
+        weather_provider.delay = 0.05
+        single_flight = SingleFlight()
+        # 요청마다 service가 생성되는 상황을 재현
+        service_a = WeatherService(cache=cache_repo, weather_provider=weather_provider, single_flight=single_flight)
+        service_b = WeatherService(cache=cache_repo, weather_provider=weather_provider, single_flight=single_flight)
+
+        await asyncio.gather(
+            service_a.get_weather_cities(WeatherListByCitiesQuery(cities=["Seoul", "Tokyo"])),
+            service_b.get_weather_city(WeatherByCityQuery(city="Seoul")),
+        )
+
+        assert sorted(weather_provider.called_cities) == ["Seoul", "Tokyo"]
+
+    async def test_cancelled_caller_does_not_cancel_flight(self, weather_service, weather_provider):
+        """먼저 요청한 호출자가 취소되어도 다른 호출자는 결과를 받음"""
+        weather_provider.delay = 0.05
+        query = WeatherByCityQuery(city="Seoul")
+
+        first = asyncio.create_task(weather_service.get_weather_city(query))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(weather_service.get_weather_city(query))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        result = await second
+
+        assert result.city == "Seoul"
+        assert weather_provider.call_count == 1
+
+
+def _stale_weather(city: str) -> Weather:
+    return Weather(
+        city=city,
+        conditions=[Weather.Condition(condition="Rain", description="old rain")],
+        stale_at=time.time() - 1,
+    )
+
+
+@pytest.mark.unit
+class TestWeatherServiceStaleWhileRevalidate:
+    async def test_fresh_weather_saved_with_soft_ttl(self, weather_service, cache_repo):
+        """조회한 날씨는 soft ttl 만료 시각과 함께 hard ttl로 저장"""
+        result = await weather_service.get_weather_city(WeatherByCityQuery(city="Seoul"))
+
+        assert result.stale_at is not None
+        assert not result.is_stale
+        _, expiry_time = cache_repo.cache["Seoul"]
+        assert expiry_time > result.stale_at
+
+    async def test_stale_served_and_refreshed_in_background(self, weather_service, weather_provider, cache_repo):
+        """soft ttl이 지난 값은 즉시 응답하고 백그라운드에서 한 번만 갱신"""
+        await cache_repo.save_weather_city(_stale_weather("Seoul"), 600)
+        weather_provider.delay = 0.05
+        query = WeatherByCityQuery(city="Seoul")
+
+        results = await asyncio.gather(*[weather_service.get_weather_city(query) for _ in range(5)])
+
+        assert all(result.is_stale for result in results)
+        assert weather_service.refresher.stats.scheduled == 1
+
+        await asyncio.sleep(0.1)
+
+        assert weather_provider.call_count == 1
+        refreshed = await weather_service.get_weather_city(query)
+        assert not refreshed.is_stale
+        assert refreshed.conditions[0].condition == "Clear"
+
+    async def test_background_refresh_bounded(self, cache_repo, weather_provider):
+        """동시에 실행되는 백그라운드 갱신 수 제한"""
+        weather_provider.delay = 0.05
+        service = WeatherService(cache_repo, weather_provider, refresher=BackgroundRefresher(max_in_flight=2))
+        for city in ["Seoul", "Tokyo", "London"]:
+            await cache_repo.save_weather_city(_stale_weather(city), 600)
+
+        await service.get_weather_cities(WeatherListByCitiesQuery(cities=["Seoul", "Tokyo", "London"]))
+
+        assert service.refresher.in_flight() == 2
+        assert service.refresher.stats.skipped == 1
+        await service.refresher.close()
+
+    async def test_serve_stale_on_upstream_error(self, cache_repo, weather_provider):
+        """upstream 장애 시 stale 값으로 응답"""
+        service = WeatherService(
+            cache_repo,
+            weather_provider,
+            settings=WeatherSettings(stale_while_revalidate=False),
+        )
+        await cache_repo.save_weather_city(_stale_weather("Seoul"), 600)
+        weather_provider.error = WeatherProviderUnavailableError("timeout")
+
+        result = await service.get_weather_city(WeatherByCityQuery(city="Seoul"))
+
+        assert result.is_stale
+        assert result.conditions[0].description == "old rain"
+        assert weather_provider.call_count == 1
+
+    async def test_upstream_error_without_stale_value(self, weather_service, weather_provider):
+        """stale 값이 없으면 upstream 에러 그대로 전달"""
+        weather_provider.error = WeatherProviderUnavailableError("timeout")
+
+        with pytest.raises(WeatherProviderUnavailableError):
+            await weather_service.get_weather_city(WeatherByCityQuery(city="Seoul"))
+
+    async def test_serve_stale_on_error_disabled(self, cache_repo, weather_provider):
+        """serve_stale_on_error가 꺼져 있으면 upstream 에러 그대로 전달"""
+        service = WeatherService(
+            cache_repo,
+            weather_provider,
+            settings=WeatherSettings(stale_while_revalidate=False, serve_stale_on_error=False),
+        )
+        await cache_repo.save_weather_city(_stale_weather("Seoul"), 600)
+        weather_provider.error = WeatherProviderUnavailableError("timeout")
+
+        with pytest.raises(WeatherProviderUnavailableError):
+            await service.get_weather_city(WeatherByCityQuery(city="Seoul"))
+
+
+@pytest.mark.unit
+class TestWeatherServiceNegativeCache:
+    async def test_not_found_cached(self, weather_service, weather_provider, cache_repo):
+        """존재하지 않는 도시는 캐시하여 다시 upstream을 호출하지 않음"""
+        weather_provider.not_found_cities = {"Atlantis"}
+        query = WeatherByCityQuery(city="Atlantis")
+
+        for _ in range(3):
+            with pytest.raises(WeatherNotFoundError):
+                await weather_service.get_weather_city(query)
+
+        assert weather_provider.call_count == 1
+        assert isinstance(cache_repo.cache["Atlantis"][0], WeatherNotFound)
+
+    async def test_not_found_ttl(self, cache_repo, weather_provider):
+        """negative cache는 별도의 ttl을 사용"""
+        service = WeatherService(cache_repo, weather_provider, settings=WeatherSettings(not_found_ttl=5))
+        weather_provider.not_found_cities = {"Atlantis"}
+
+        with pytest.raises(WeatherNotFoundError):
+            await service.get_weather_city(WeatherByCityQuery(city="Atlantis"))
+
+        _, expiry_time = cache_repo.cache["Atlantis"]
+        assert expiry_time - time.time() <= 5
+
+    async def test_batch_reports_not_found(self, weather_service, weather_provider):
+        """배치 조회에서 존재하지 않는 도시는 전체를 실패시키지 않고 따로 반환"""
+        weather_provider.not_found_cities = {"Atlantis"}
+
+        results = await weather_service.get_weather_cities(
+            WeatherListByCitiesQuery(cities=["Seoul", "Atlantis"])
+        )
+
+        assert [it.status for it in results] == [WeatherBatchItem.Status.SUCCESS, WeatherBatchItem.Status.NOT_FOUND]
+        assert results[1].city == "Atlantis"
+        assert results[1].weather is None
+
+    async def test_batch_uses_negative_cache(self, weather_service, weather_provider, cache_repo):
+        """배치 조회도 negative cache 항목은 upstream을 호출하지 않음"""
+        await cache_repo.save_weather_city_not_found("Atlantis", 60)
+
+        results = await weather_service.get_weather_cities(WeatherListByCitiesQuery(cities=["Atlantis"]))
+
+        assert [it.status for it in results] == [WeatherBatchItem.Status.NOT_FOUND]
+        assert weather_provider.call_count == 0
+
+
+@pytest.mark.unit
+class TestWeatherServiceBatch:
+    async def test_request_order_preserved(self, weather_service, weather_provider, cache_repo):
+        """캐시 여부와 관계없이 요청 순서대로 응답"""
+        await cache_repo.save_weather_city(
+            Weather(city="London", conditions=[Weather.Condition(condition="Clouds", description="clouds")]),
+            600,
+        )
+
+        results = await weather_service.get_weather_cities(
+            WeatherListByCitiesQuery(cities=["Seoul", "London", "Tokyo"])
+        )
+
+        assert [it.city for it in results] == ["Seoul", "London", "Tokyo"]
+        assert [it.weather.city for it in results] == ["Seoul", "London", "Tokyo"]
+
+    async def test_duplicated_cities_fetched_once(self, weather_service, weather_provider):
+        """대소문자, 공백만 다른 도시는 한 번만 조회하고 하나의 결과로 응답"""
+        results = await weather_service.get_weather_cities(
+            WeatherListByCitiesQuery(cities=["Seoul", " seoul", "SEOUL", "Tokyo"])
+        )
+
+        assert [it.city for it in results] == ["Seoul", "Tokyo"]
+        assert weather_provider.call_count == 2
+
+    async def test_concurrency_limit(self, cache_repo):
+        """동시에 실행되는 upstream 조회 수 제한"""
+        class ConcurrencyTrackingProvider(FakeWeatherProvider):
+            def __init__(self):
+                super().__init__()
+                self.running = 0
+                self.max_running = 0
+
+            async def get(self, query: WeatherByCityQuery) -> Weather:
+                self.running += 1
+                self.max_running = max(self.max_running, self.running)
+                try:
+                    await asyncio.sleep(0.01)
+                    return await super().get(query)
+                finally:
+                    self.running -= 1
+
+        provider = ConcurrencyTrackingProvider()
+        service = WeatherService(cache_repo, provider, settings=WeatherSettings(batch_concurrency=3))
+
+        results = await service.get_weather_cities(
+            WeatherListByCitiesQuery(cities=[f"City{i}" for i in range(10)])
+        )
+
+        assert len(results) == 10
+        assert provider.max_running == 3
+
+    async def test_per_city_errors(self, weather_service, weather_provider):
+        """도시별 실패는 전체 요청을 실패시키지 않음"""
+        weather_provider.not_found_cities = {"Atlantis"}
+
+        class FailingProvider(FakeWeatherProvider):
+            async def get(self, query: WeatherByCityQuery) -> Weather:
+                if query.city == "Tokyo":
+                    raise WeatherProviderUnavailableError("failed GET /data/2.5/weather")
+                return await weather_provider.get(query)
+
+        weather_service.weather_provider = FailingProvider()
+
+        results = await weather_service.get_weather_cities(
+            WeatherListByCitiesQuery(cities=["Seoul", "Tokyo", "Atlantis"])
+        )
+
+        assert [it.status for it in results] == [
+            WeatherBatchItem.Status.SUCCESS,
+            WeatherBatchItem.Status.UNAVAILABLE,
+            WeatherBatchItem.Status.NOT_FOUND,
+        ]
+        assert results[1].message
+
+    async def test_deadline_returns_partial_results(self, cache_repo):
+        """제한 시간이 지나면 조회된 결과만 응답하고, 진행중인 조회는 계속 진행되어 캐시에 저장"""
+        class SlowTokyoProvider(FakeWeatherProvider):
+            async def get(self, query: WeatherByCityQuery) -> Weather:
+                if query.city == "Tokyo":
+                    await asyncio.sleep(0.1)
+                return await super().get(query)
+
+        provider = SlowTokyoProvider()
+        service = WeatherService(cache_repo, provider, settings=WeatherSettings(batch_deadline=0.05))
+
+        results = await service.get_weather_cities(WeatherListByCitiesQuery(cities=["Seoul", "Tokyo"]))
+
+        assert [it.status for it in results] == [WeatherBatchItem.Status.SUCCESS, WeatherBatchItem.Status.TIMEOUT]
+
+        await asyncio.sleep(0.1)
+        assert "Tokyo" in cache_repo.cache
+
+    async def test_iter_yields_cached_first(self, weather_service, weather_provider, cache_repo):
+        """스트리밍 조회는 캐시된 도시를 먼저 반환하고 나머지는 조회가 끝나는 순서대로 반환"""
+        await cache_repo.save_weather_city(
+            Weather(city="London", conditions=[Weather.Condition(condition="Clouds", description="clouds")]),
+            600,
+        )
+        weather_provider.delay = 0.01
+
+        items = [
+            it async for it in weather_service.iter_weather_cities(
+                WeatherListByCitiesQuery(cities=["Seoul", "London", "Tokyo"])
+            )
+        ]
+
+        assert items[0].city == "London"
+        assert {it.city for it in items[1:]} == {"Seoul", "Tokyo"}
+        assert weather_provider.call_count == 2
+
+    async def test_fetched_weathers_saved_in_one_write(self, weather_service, cache_repo):
+        """배치 조회에서 upstream으로 조회한 도시는 한 번에 저장"""
+        await weather_service.get_weather_cities(WeatherListByCitiesQuery(cities=["Seoul", "Tokyo", "London"]))
+
+        assert cache_repo.save_weather_cities_count == 1
+        assert {"Seoul", "Tokyo", "London"} <= set(cache_repo.cache)
+
+    async def test_partial_batch_saved_on_deadline(self, cache_repo):
+        """제한 시간이 지나도 조회된 결과는 저장"""
+        class SlowTokyoProvider(FakeWeatherProvider):
+            async def get(self, query: WeatherByCityQuery) -> Weather:
+                if query.city == "Tokyo":
+                    await asyncio.sleep(0.1)
+                return await super().get(query)
+
+        service = WeatherService(cache_repo, SlowTokyoProvider(), settings=WeatherSettings(batch_deadline=0.05))
+
+        await service.get_weather_cities(WeatherListByCitiesQuery(cities=["Seoul", "Tokyo"]))
+
+        assert cache_repo.save_weather_cities_count == 1
+        assert "Seoul" in cache_repo.cache
+        assert "Tokyo" not in cache_repo.cache
+
+
+class FakeBatchWeatherProvider(FakeWeatherProvider):
+    supports_batch = True
+
+    def __init__(self):
+        super().__init__()
+        self.batches: list[list[str]] = []
+
+    async def get_many(self, queries: list[WeatherByCityQuery]) -> list[Weather | BaseException]:
+        self.batches.append([it.city for it in queries])
+        return await super().get_many(queries)
+
+
+@pytest.mark.unit
+class TestWeatherServiceUpstreamBatch:
+    @pytest.fixture
+    def weather_provider(self):
+        return FakeBatchWeatherProvider()
+
+    async def test_batch_misses_use_get_many(self, weather_service, weather_provider, cache_repo):
+        """배치 조회의 cache miss는 get_many 한 번으로 조회"""
+        await cache_repo.save_weather_city(
+            Weather(city="Seoul", conditions=[Weather.Condition(condition="Clear", description="clear sky")]),
+            600,
+        )
+
+        results = await weather_service.get_weather_cities(
+            WeatherListByCitiesQuery(cities=["Seoul", "Tokyo", "London", "Paris"])
+        )
+
+        assert all(it.status == WeatherBatchItem.Status.SUCCESS for it in results)
+        assert weather_provider.batches == [["Tokyo", "London", "Paris"]]
+
+    async def test_concurrent_single_misses_combined(self, cache_repo, weather_provider):
+        """동시에 들어온 단건 cache miss도 하나의 get_many로 조회 (batcher 공유)"""
+        settings = WeatherSettings(upstream_batch_window=0.01)
+        batcher = create_weather_batcher(weather_provider, settings)
+        single_flight = SingleFlight()
+
+        def service() -> WeatherService:
+            return WeatherService(cache_repo, weather_provider, single_flight, settings=settings, batcher=batcher)
+
+        await asyncio.gather(*(
+            service().get_weather_city(WeatherByCityQuery(city=city)) for city in ["Seoul", "Tokyo", "Seoul"]
+        ))
+
+        assert weather_provider.batches == [["Seoul", "Tokyo"]]
+
+    async def test_not_found_from_batch_cached(self, weather_service, weather_provider, cache_repo):
+        weather_provider.not_found_cities = {"Atlantis"}
+
+        results = await weather_service.get_weather_cities(WeatherListByCitiesQuery(cities=["Seoul", "Atlantis"]))
+
+        assert [it.status for it in results] == [WeatherBatchItem.Status.SUCCESS, WeatherBatchItem.Status.NOT_FOUND]
+        assert isinstance(cache_repo.cache["Atlantis"][0], WeatherNotFound)
+
+
+class FakeRenderedWeatherCacheRepository(FakeWeatherCacheRepository):
+    def __init__(self):
+        super().__init__()
+        self.rendered: dict[str, RenderedWeather] = {}
+
+    async def get_rendered_weather_city(self, query: WeatherByCityQuery) -> RenderedWeather | None:
+        return self.rendered.get(query.city)
+
+    async def get_rendered_weather_cities(self, query: WeatherListByCitiesQuery) -> list[RenderedWeather]:
+        return [self.rendered[city] for city in query.cities if city in self.rendered]
+
+
+@pytest.mark.unit
+class TestWeatherServiceRendered:
+    @pytest.fixture
+    def cache_repo(self):
+        return FakeRenderedWeatherCacheRepository()
+
+    async def test_fresh_rendered_returned(self, weather_service, weather_provider, cache_repo):
+        cache_repo.rendered["Seoul"] = RenderedWeather(city="Seoul", body=b"{}", stale_at=time.time() + 60)
+
+        rendered = await weather_service.get_rendered_weather_city(WeatherByCityQuery(city="Seoul"))
+
+        assert rendered.body == b"{}"
+        assert weather_provider.call_count == 0
+
+    async def test_stale_rendered_ignored(self, weather_service, cache_repo):
+        """soft ttl이 지난 응답 조각은 사용하지 않음 (일반 조회 경로에서 갱신)"""
+        cache_repo.rendered["Seoul"] = RenderedWeather(city="Seoul", body=b"{}", stale_at=time.time() - 1)
+
+        assert await weather_service.get_rendered_weather_city(WeatherByCityQuery(city="Seoul")) is None
+
+    async def test_batch_merges_rendered_and_fetched(self, weather_service, weather_provider, cache_repo):
+        """응답 조각이 없는 도시만 조회하고 요청 순서 유지"""
+        cache_repo.rendered["Tokyo"] = RenderedWeather(city="Tokyo", body=b"{}", stale_at=time.time() + 60)
+
+        results = await weather_service.get_rendered_weather_cities(
+            WeatherListByCitiesQuery(cities=["Seoul", "Tokyo", "seoul", "London"])
+        )
+
+        assert [type(it) for it in results] == [WeatherBatchItem, RenderedWeather, WeatherBatchItem]
+        assert [it.city for it in results] == ["Seoul", "Tokyo", "London"]
+        assert sorted(weather_provider.called_cities) == ["London", "Seoul"]
+
+
+class FakeCoordWeatherCacheRepository(FakeWeatherCacheRepository):
+    def __init__(self):
+        super().__init__()
+        self.coords: dict[str, Weather] = {}
+
+    async def get_weather_coord(self, query: WeatherByCoordQuery) -> Weather | None:
+        return self.coords.get(query.cell_key)
+
+    async def save_weather_coord(self, query: WeatherByCoordQuery, weather: Weather, ttl: int) -> None:
+        self.coords[query.cell_key] = weather
+
+
+@pytest.mark.unit
+class TestWeatherServiceCoord:
+    @pytest.fixture
+    def cache_repo(self):
+        return FakeCoordWeatherCacheRepository()
+
+    async def test_same_cell_shares_cache(self, weather_service, weather_provider, cache_repo):
+        """같은 격자 안의 좌표는 격자 중심 좌표로 한 번만 조회"""
+        first = await weather_service.get_weather_coord(WeatherByCoordQuery(lat=37.5665, lon=126.978))
+        second = await weather_service.get_weather_coord(WeatherByCoordQuery(lat=37.5512, lon=126.9882))
+
+        assert first == second
+        assert weather_provider.coords == [WeatherByCoordQuery(lat=37.575, lon=126.975)]
+        assert list(cache_repo.coords) == ["37.575,126.975"]
+
+    async def test_concurrent_misses_combined(self, weather_service, weather_provider):
+        weather_provider.delay = 0.05
+
+        await asyncio.gather(*(
+            weather_service.get_weather_coord(WeatherByCoordQuery(lat=37.56 + i * 0.001, lon=126.97))
+            for i in range(5)
+        ))
+
+        assert len(weather_provider.coords) == 1
+
+    async def test_stale_while_revalidate(self, weather_service, weather_provider, cache_repo):
+        stale = Weather(city="stale", conditions=[], stale_at=time.time() - 1)
+        cache_repo.coords["37.575,126.975"] = stale
+
+        result = await weather_service.get_weather_coord(WeatherByCoordQuery(lat=37.5665, lon=126.978))
+
+        assert result == stale
+        assert weather_service.refresher.stats.scheduled == 1
+        await asyncio.sleep(0.1)
+        assert cache_repo.coords["37.575,126.975"].city == "37.575,126.975"
+
+    async def test_serve_stale_on_error(self, cache_repo, weather_provider):
+        service = WeatherService(cache_repo, weather_provider, settings=WeatherSettings(stale_while_revalidate=False))
+        stale = Weather(city="stale", conditions=[], stale_at=time.time() - 1)
+        cache_repo.coords["37.575,126.975"] = stale
+        weather_provider.error = WeatherProviderUnavailableError("down")
+
+        assert await service.get_weather_coord(WeatherByCoordQuery(lat=37.5665, lon=126.978)) == stale
@@ -0,0 +1,141 @@
+import time
+
+import pytest
+
+from domain.shared.leader_lease import LeaderLease
+from domain.weather.data.model import Weather
+from domain.weather.popularity import WeatherPopularity, WeatherPopularityRepository
+from domain.weather.service import WeatherService
+from domain.weather.settings import WeatherWarmerSettings
+from domain.weather.warmer import WeatherCacheWarmer
+from tests.domain.weather.test_service import FakeWeatherCacheRepository, FakeWeatherProvider
+
+
+class FakePopularityRepository(WeatherPopularityRepository):
+    def __init__(self):
+        self.scores: dict[str, float] = {}
+
+    async def increment(self, counts: dict[str, int]) -> None:
+        for city, count in counts.items():
+            self.scores[city] = self.scores.get(city, 0) + count
+
+    async def top(self, n: int) -> list[str]:
+        return sorted(self.scores, key=lambda it: -self.scores[it])[:n]
+
+    async def decay(self, factor: float, max_size: int) -> None:
+        self.scores = {city: score * factor for city, score in self.scores.items()}
+
+
+class FakeLeaderLease(LeaderLease):
+    def __init__(self, leader: bool = True):
+        self.leader = leader
+
+    async def acquire(self) -> bool:
+        return self.leader
+
+    async def release(self) -> None:
+        pass
+
+
+def _weather(city: str, stale_in: float) -> Weather:
+    return Weather(
+        city=city,
+        conditions=[Weather.Condition(condition="Clear", description="clear sky")],
+        stale_at=time.time() + stale_in,
+    )
+
+
+@pytest.fixture
+def cache_repo():
+    return FakeWeatherCacheRepository()
+
+
+@pytest.fixture
+def weather_provider():
+    return FakeWeatherProvider()
+
+
+@pytest.fixture
+def popularity():
+    return WeatherPopularity(FakePopularityRepository())
+
+
+def _warmer(popularity, cache_repo, weather_provider, lease=None, **settings) -> WeatherCacheWarmer:
+    return WeatherCacheWarmer(
+        popularity=popularity,
+        lease=lease or FakeLeaderLease(),
+        cache=cache_repo,
+        service_factory=lambda: WeatherService(cache_repo, weather_provider),
+        settings=WeatherWarmerSettings(**{"top_n": 2, "refresh_ahead": 60, **settings}),
+    )
+
+
+@pytest.mark.unit
+class TestWeatherPopularity:
+    async def test_flush_merges_counts(self, popularity):
+        """대소문자, 공백만 다른 도시는 하나로 합산"""
+        popularity.record("Seoul", " seoul", "Tokyo")
+
+        await popularity.flush()
+
+        assert popularity.repository.scores == {"seoul": 2, "tokyo": 1}
+
+    async def test_max_pending(self):
+        popularity = WeatherPopularity(FakePopularityRepository(), max_pending=1)
+
+        popularity.record("Seoul", "Tokyo", "Seoul")
+        await popularity.flush()
+
+        assert popularity.repository.scores == {"seoul": 2}
+
+
+@pytest.mark.unit
+class TestWeatherCacheWarmer:
+    async def test_refresh_expiring_top_cities(self, popularity, cache_repo, weather_provider):
+        """상위 도시 중 soft ttl 만료가 가까운 도시, 캐시에 없는 도시만 갱신"""
+        await cache_repo.save_weather_city(_weather("seoul", stale_in=10), 3600)
+        await cache_repo.save_weather_city(_weather("tokyo", stale_in=500), 3600)
+        popularity.record(*["seoul"] * 3, *["tokyo"] * 2, "london")
+        warmer = _warmer(popularity, cache_repo, weather_provider, top_n=3)
+
+        assert await warmer.run_once() == 2
+
+        assert sorted(weather_provider.called_cities) == ["london", "seoul"]
+        assert cache_repo.cache["seoul"][0].stale_at > time.time() + 500
+        assert warmer.stats.refreshed == 2
+
+    async def test_only_top_n(self, popularity, cache_repo, weather_provider):
+        popularity.record(*["seoul"] * 3, *["tokyo"] * 2, "london")
+        warmer = _warmer(popularity, cache_repo, weather_provider, top_n=1)
+
+        await warmer.run_once()
+
+        assert weather_provider.called_cities == ["seoul"]
+
+    async def test_not_leader(self, popularity, cache_repo, weather_provider):
+        """leader가 아니면 요청 수만 합산하고 갱신하지 않음"""
+        popularity.record("seoul")
+        warmer = _warmer(popularity, cache_repo, weather_provider, lease=FakeLeaderLease(leader=False))
+
+        assert await warmer.run_once() == 0
+
+        assert popularity.repository.scores == {"seoul": 1}
+        assert weather_provider.call_count == 0
+
+    async def test_failure_counted(self, popularity, cache_repo, weather_provider):
+        weather_provider.error = RuntimeError("upstream")
+        popularity.record("seoul")
+        warmer = _warmer(popularity, cache_repo, weather_provider)
+
+        await warmer.run_once()
+
+        assert warmer.stats.failed == 1
+
+    async def test_decay(self, popularity, cache_repo, weather_provider):
+        await cache_repo.save_weather_city(_weather("seoul", stale_in=500), 3600)
+        popularity.record(*["seoul"] * 4)
+        warmer = _warmer(popularity, cache_repo, weather_provider, decay_interval=0, decay_factor=0.5)
+
+        await warmer.run_once()
+
+        assert popularity.repository.scores == {"seoul": 2}
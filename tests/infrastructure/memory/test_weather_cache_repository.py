@@ -0,0 +1,240 @@
+import asyncio
+import time
+from dataclasses import replace
+
+import pytest
+from fakeredis import FakeAsyncRedis, FakeServer
+
+from domain.weather.data.model import Weather, WeatherNotFound
+from domain.weather.data.query import WeatherByCityQuery, WeatherByCoordQuery, WeatherListByCitiesQuery
+from infrastructure.memory.ttl_lru_cache import TTLLRUCache, CacheStats
+from infrastructure.memory.weather_cache_repository import TieredWeatherCacheRepository
+from infrastructure.redis.weather_cache_invalidation import RedisWeatherCacheInvalidation
+from infrastructure.redis.weather_cache_repository import RedisWeatherCacheRepository
+
+
+def _weather(city: str, condition: str = "Clear", city_id: int | None = None) -> Weather:
+    return Weather(
+        city=city,
+        conditions=[Weather.Condition(condition=condition, description=condition.lower())],
+        city_id=city_id,
+    )
+
+
+@pytest.fixture
+async def redis():
+    client = FakeAsyncRedis(decode_responses=False)
+    yield client
+    await client.flushall()
+    await client.aclose()
+
+
+def _tiered(redis: FakeAsyncRedis, invalidation: RedisWeatherCacheInvalidation | None = None):
+    return TieredWeatherCacheRepository(
+        l1=TTLLRUCache(max_size=10, ttl=60),
+        aliases=TTLLRUCache(max_size=10, ttl=60),
+        l2=RedisWeatherCacheRepository(redis),
+        l2_stats=CacheStats(),
+        invalidation=invalidation,
+    )
+
+
+@pytest.mark.unit
+class TestTTLLRUCache:
+    def test_lru_eviction(self):
+        """max_size를 넘으면 가장 오래 사용하지 않은 항목 삭제"""
+        cache = TTLLRUCache(max_size=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert cache.stats.evictions == 1
+
+    def test_ttl_capped_by_expires_at(self):
+        """항목의 만료시각이 ttl보다 빠르면 만료시각을 따름"""
+        cache = TTLLRUCache(max_size=2, ttl=60)
+        cache.set("a", 1, expires_at=time.time() - 1)
+
+        assert cache.get("a") is None
+        assert cache.stats.expirations == 1
+        assert cache.stats.misses == 1
+
+
+@pytest.mark.unit
+class TestTieredWeatherCacheRepository:
+    async def test_l2_hit_fills_l1(self, redis):
+        """L2에서 조회한 값은 L1에 저장되어 다음 조회는 L2를 거치지 않음"""
+        await RedisWeatherCacheRepository(redis).save_weather_city(_weather("Seoul"), 600)
+        repository = _tiered(redis)
+        query = WeatherByCityQuery(city="Seoul")
+
+        first = await repository.get_weather_city(query)
+        await redis.flushall()
+        second = await repository.get_weather_city(query)
+
+        assert first.city == second.city == "Seoul"
+        assert second.expires_at is not None
+        assert repository.l2_stats.hits == 1
+        assert repository.l1.stats.hits == 1
+
+    async def test_coord_l2_hit_fills_l1(self, redis):
+        cell = WeatherByCoordQuery(lat=37.575, lon=126.975)
+        await RedisWeatherCacheRepository(redis).save_weather_coord(cell, _weather("Jung-gu"), 600)
+        repository = _tiered(redis)
+
+        first = await repository.get_weather_coord(cell)
+        await redis.flushall()
+        second = await repository.get_weather_coord(cell)
+
+        assert first.city == second.city == "Jung-gu"
+        assert repository.l2_stats.hits == 1
+
+    async def test_coord_ignores_city_negative_cache(self, redis):
+        """같은 L1 key의 도시 이름 negative cache는 좌표 조회에 사용하지 않음"""
+        repository = _tiered(redis)
+        await repository.save_weather_city_not_found("coord:37.575,126.975", 60)
+
+        assert await repository.get_weather_coord(WeatherByCoordQuery(lat=37.575, lon=126.975)) is None
+
+    async def test_get_weather_cities_only_queries_l1_misses(self, redis):
+        """배치 조회 시 L1에 없는 도시만 L2에서 조회"""
+        repository = _tiered(redis)
+        await repository.save_weather_city(_weather("Seoul"), 600)
+        await RedisWeatherCacheRepository(redis).save_weather_city(_weather("Tokyo"), 600)
+
+        results = await repository.get_weather_cities(WeatherListByCitiesQuery(cities=["Seoul", "Tokyo", "London"]))
+
+        assert [w and w.city for w in results] == ["Seoul", "Tokyo", None]
+        assert repository.l1.stats.hits == 1
+        assert repository.l2_stats.hits == 1
+        assert repository.l2_stats.misses == 1
+
+    async def test_alias_fills_l1_with_requested_name(self, redis):
+        """alias로 조회한 L2 값은 요청한 도시 이름으로 L1에 저장"""
+        await RedisWeatherCacheRepository(redis).save_weather_city(_weather("Seoul", city_id=1835848), 600, alias="Seoul,KR")
+        repository = _tiered(redis)
+
+        results = await repository.get_weather_cities(WeatherListByCitiesQuery(cities=[" seoul,kr "]))
+        await redis.flushall()
+
+        assert results[0].city == "Seoul"
+        assert (await repository.get_weather_city(WeatherByCityQuery(city="SEOUL,KR"))).city_id == 1835848
+        assert repository.l1.stats.hits == 1
+
+    async def test_repository_per_request_shares_aliases(self, redis):
+        """요청마다 repository를 생성해도 worker의 L1, aliases를 공유하므로 city_id 항목이 L1에서 조회됨"""
+        l1 = TTLLRUCache(max_size=10, ttl=60)
+        aliases = TTLLRUCache(max_size=10, ttl=60)
+        l2_stats = CacheStats()
+
+        def repository() -> TieredWeatherCacheRepository:
+            return TieredWeatherCacheRepository(
+                l1=l1, aliases=aliases, l2=RedisWeatherCacheRepository(redis), l2_stats=l2_stats,
+            )
+
+        await RedisWeatherCacheRepository(redis).save_weather_city(_weather("Seoul", city_id=1835848), 600)
+        await repository().get_weather_city(WeatherByCityQuery(city="Seoul"))
+        second = await repository().get_weather_city(WeatherByCityQuery(city="Seoul"))
+
+        assert second.city_id == 1835848
+        assert l1.stats.hits == 1
+        assert l2_stats.hits == 1
+
+    async def test_save_invalidates_other_workers(self):
+        """한 worker가 저장하면 다른 worker의 L1 항목이 삭제됨"""
+        server = FakeServer()
+        redis_a = FakeAsyncRedis(server=server, decode_responses=False)
+        redis_b = FakeAsyncRedis(server=server, decode_responses=False)
+        invalidation_a = RedisWeatherCacheInvalidation(redis_a)
+        invalidation_b = RedisWeatherCacheInvalidation(redis_b)
+        worker_a = _tiered(redis_a, invalidation_a)
+        worker_b = _tiered(redis_b, invalidation_b)
+        invalidation_b.start(on_invalidate=worker_b.l1.delete, on_reconnect=worker_b.l1.clear)
+        await asyncio.sleep(0.05)
+
+        await worker_a.save_weather_city(_weather("Seoul", "Clear"), 600)
+        assert (await worker_b.get_weather_city(WeatherByCityQuery(city="Seoul"))).conditions[0].condition == "Clear"
+
+        await worker_a.save_weather_city(_weather("Seoul", "Rain"), 600)
+        await asyncio.sleep(0.05)
+        weather = await worker_b.get_weather_city(WeatherByCityQuery(city="Seoul"))
+
+        assert weather.conditions[0].condition == "Rain"
+        assert worker_b.l1.stats.invalidations == 1
+        await invalidation_b.close()
+        await redis_a.aclose()
+        await redis_b.aclose()
+
+    async def test_refresh_invalidates_other_spellings(self):
+        """갱신은 city_id 기준으로 삭제 요청하므로, 다른 worker가 다른 표기로 저장한 L1 값도 갱신됨"""
+        server = FakeServer()
+        redis_a = FakeAsyncRedis(server=server, decode_responses=False)
+        redis_b = FakeAsyncRedis(server=server, decode_responses=False)
+        invalidation_a = RedisWeatherCacheInvalidation(redis_a)
+        invalidation_b = RedisWeatherCacheInvalidation(redis_b)
+        worker_a = _tiered(redis_a, invalidation_a)
+        worker_b = _tiered(redis_b, invalidation_b)
+        invalidation_b.start(on_invalidate=worker_b.l1.delete, on_reconnect=worker_b.l1.clear)
+        await asyncio.sleep(0.05)
+
+        seoul = _weather("Seoul", city_id=1835848)
+        await worker_a.save_weather_city(replace(seoul, dt=1), 600, alias="Seoul,KR")
+        assert (await worker_b.get_weather_city(WeatherByCityQuery(city="seoul,kr"))).dt == 1
+
+        await worker_a.save_weather_city(replace(seoul, dt=2), 600)
+        await asyncio.sleep(0.05)
+
+        assert (await worker_b.get_weather_city(WeatherByCityQuery(city="seoul,kr"))).dt == 2
+        assert (await worker_a.get_weather_city(WeatherByCityQuery(city="seoul,kr"))).dt == 2
+        await invalidation_b.close()
+        await redis_a.aclose()
+        await redis_b.aclose()
+
+    async def test_name_does_not_read_city_id_entry(self, redis):
+        """city_id 항목과 같은 key의 도시 이름(ex. "id:1835848")으로는 조회되지 않음"""
+        repository = _tiered(redis)
+        await repository.save_weather_city(_weather("Seoul", city_id=1835848), 600)
+        await repository.save_weather_city_not_found("id:1835848", 60)
+
+        assert (await repository.get_weather_city(WeatherByCityQuery(city="Seoul"))) is not None
+        assert isinstance(await repository.get_weather_city(WeatherByCityQuery(city="id:1835848")), WeatherNotFound)
+
+
+@pytest.mark.unit
+class TestTieredWeatherCacheRepositoryRendered:
+    @pytest.fixture
+    def repository(self, redis):
+        return TieredWeatherCacheRepository(
+            l1=TTLLRUCache(max_size=10, ttl=60),
+            aliases=TTLLRUCache(max_size=10, ttl=60),
+            l2=RedisWeatherCacheRepository(redis, renderer=lambda weather: weather.conditions[0].condition.encode()),
+            l2_stats=CacheStats(),
+            rendered=TTLLRUCache(max_size=10, ttl=60),
+        )
+
+    async def test_rendered_served_from_l1(self, repository, redis):
+        """L2에서 조회한 응답 조각은 L1에서 응답"""
+        await repository.save_weather_city(_weather("Seoul"), 600)
+        await repository.get_rendered_weather_city(WeatherByCityQuery(city="Seoul"))
+        await redis.flushall()
+
+        single = await repository.get_rendered_weather_city(WeatherByCityQuery(city="SEOUL"))
+        batch = await repository.get_rendered_weather_cities(WeatherListByCitiesQuery(cities=["seoul"]))
+
+        assert single.city == "SEOUL"
+        assert single.body == b"Clear"
+        assert [it.city for it in batch] == ["seoul"]
+
+    async def test_save_deletes_rendered(self, repository):
+        """날씨를 저장하면 L1의 이전 응답 조각 삭제"""
+        await repository.save_weather_city(_weather("Seoul"), 600)
+        await repository.get_rendered_weather_cities(WeatherListByCitiesQuery(cities=["Seoul"]))
+
+        await repository.save_weather_cities([_weather("Seoul", condition="Rain")], 600)
+
+        rendered = await repository.get_rendered_weather_city(WeatherByCityQuery(city="Seoul"))
+        assert rendered.body == b"Rain"
@@ -0,0 +1,90 @@
+import time
+
+import pytest
+
+from infrastructure.openweather.circuit_breaker import CircuitBreaker, CircuitState
+from infrastructure.openweather.settings import CircuitBreakerSettings
+
+
+def _breaker(**kwargs) -> CircuitBreaker:
+    settings = CircuitBreakerSettings(**{"minimum_calls": 4, "consecutive_timeouts": 3, "open_duration": 0.05, **kwargs})
+    return CircuitBreaker("test", settings)
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+    def test_open_on_failure_rate(self):
+        """window 안의 에러율이 기준 이상이면 open"""
+        breaker = _breaker()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow()
+        assert breaker.stats.rejected == 1
+
+    def test_minimum_calls(self):
+        """요청 수가 적으면 에러율로 판단하지 않음"""
+        breaker = _breaker(minimum_calls=10)
+        for _ in range(5):
+            breaker.record_failure()
+
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_open_on_consecutive_timeouts(self):
+        breaker = _breaker(minimum_calls=100)
+        breaker.record_failure(timeout=True)
+        breaker.record_failure(timeout=True)
+        breaker.record_success()
+        breaker.record_failure(timeout=True)
+        breaker.record_failure(timeout=True)
+        assert breaker.state == CircuitState.CLOSED
+
+        breaker.record_failure(timeout=True)
+
+        assert breaker.state == CircuitState.OPEN
+
+    def test_half_open_probe_success_closes(self):
+        """open_duration 이후 시험 요청 하나만 허용하고, 성공하면 closed"""
+        breaker = _breaker()
+        for _ in range(4):
+            breaker.record_failure()
+        time.sleep(0.06)
+
+        assert breaker.allow()
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert not breaker.allow()
+
+        breaker.record_success()
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.allow()
+        assert (breaker.stats.opened, breaker.stats.half_opened, breaker.stats.closed) == (1, 1, 1)
+
+    def test_half_open_probe_failure_reopens(self):
+        breaker = _breaker()
+        for _ in range(4):
+            breaker.record_failure()
+        time.sleep(0.06)
+        breaker.allow()
+
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow()
+
+    def test_half_open_release(self):
+        """결과를 알 수 없이 끝난 시험 요청은 다시 시험 요청 허용"""
+        breaker = _breaker()
+        for _ in range(4):
+            breaker.record_failure()
+        time.sleep(0.06)
+        breaker.allow()
+
+        breaker.release()
+
+        assert breaker.allow()
@@ -0,0 +1,119 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from domain.weather.data.query import WeatherByCityQuery
+from infrastructure.openweather.city_index import CityIndex, index_key, is_plausible_city_name
+from infrastructure.openweather.error import OpenWeatherNotFoundError
+from infrastructure.openweather.provider import OpenWeatherProvider
+
+CITIES = [
+    {"id": 1835848, "name": "Seoul", "state": "", "country": "KR"},
+    {"id": 2643743, "name": "London", "state": "", "country": "GB"},
+    {"id": 4298960, "name": "London", "state": "KY", "country": "US"},
+    {"id": 6058560, "name": "London", "state": "", "country": "CA"},
+    {"id": 3448439, "name": "São Paulo", "state": "", "country": "BR"},
+    {"id": 5391959, "name": "San Francisco", "state": "CA", "country": "US"},
+]
+
+
+@pytest.fixture
+def city_index(tmp_path):
+    path = tmp_path / "city_index.bin"
+    CityIndex.build(CITIES, path)
+    index = CityIndex(path)
+    yield index
+    index.close()
+
+
+@pytest.mark.unit
+class TestCityIndex:
+    def test_lookup(self, city_index):
+        assert city_index.lookup("Seoul") == 1835848
+        assert city_index.lookup("san francisco,ca,us") == 5391959
+
+    def test_lookup_normalized(self, city_index):
+        """대소문자, 악센트, 공백은 구분하지 않음"""
+        assert city_index.lookup("  SEOUL ") == 1835848
+        assert city_index.lookup("sao paulo") == 3448439
+        assert city_index.lookup("San   Francisco") == 5391959
+        assert city_index.lookup("London , GB") == 2643743
+
+    def test_lookup_ambiguous(self, city_index):
+        """여러 도시가 같은 이름이면 AMBIGUOUS, 국가를 붙이면 하나로 정해짐"""
+        assert city_index.lookup("London") == CityIndex.AMBIGUOUS
+        assert city_index.lookup("London,CA") == 6058560
+        assert city_index.lookup("London,KY,US") == 4298960
+
+    def test_lookup_unknown(self, city_index):
+        assert city_index.lookup("Atlantis") is None
+        assert city_index.lookup("") is None
+
+    def test_invalid_file(self, tmp_path):
+        path = tmp_path / "invalid.bin"
+        path.write_bytes(b"\x00" * 32)
+
+        with pytest.raises(ValueError):
+            CityIndex(path)
+
+    def test_index_key(self):
+        assert index_key(" Zürich ,  CH ") == "zurich,ch"
+
+
+@pytest.mark.unit
+class TestPlausibleCityName:
+    @pytest.mark.parametrize("name", ["Seoul", "São Paulo", "St. John's", "Winston-Salem", "서울", "London,GB",
+                                      "Saint-Louis-du-Ha! Ha!", "Westward Ho!"])
+    def test_plausible(self, name):
+        assert is_plausible_city_name(name)
+
+    @pytest.mark.parametrize("name", ["", "   ", "12345", "a" * 101, "<script>", "seoul;", "new\nyork"])
+    def test_implausible(self, name):
+        assert not is_plausible_city_name(name)
+
+
+@pytest.mark.unit
+class TestOpenWeatherProviderCityIndex:
+    @pytest.fixture(autouse=True)
+    def _parse_weather(self):
+        """응답 파싱은 이 테스트의 관심사가 아님"""
+        with patch("infrastructure.openweather.provider.parse_weather"):
+            yield
+
+    @staticmethod
+    def _provider(city_index: CityIndex | None, reject_unknown: bool = False) -> OpenWeatherProvider:
+        client = AsyncMock()
+        return OpenWeatherProvider(client, city_index=city_index, reject_unknown=reject_unknown)
+
+    async def test_query_by_id(self, city_index):
+        provider = self._provider(city_index)
+
+        await provider.get(WeatherByCityQuery(city="seoul"))
+
+        provider.client.get_raw.assert_awaited_once_with("/data/2.5/weather", params={"id": 1835848})
+
+    @pytest.mark.parametrize("city", ["London", "Atlantis"])
+    async def test_query_by_name(self, city_index, city):
+        """여러 도시이거나 색인에 없으면 도시 이름으로 조회"""
+        provider = self._provider(city_index)
+
+        await provider.get(WeatherByCityQuery(city=city))
+
+        provider.client.get_raw.assert_awaited_once_with("/data/2.5/weather", params={"q": city})
+
+    async def test_reject_unknown(self, city_index):
+        provider = self._provider(city_index, reject_unknown=True)
+
+        with pytest.raises(OpenWeatherNotFoundError):
+            await provider.get(WeatherByCityQuery(city="Atlantis"))
+
+        provider.client.get_raw.assert_not_awaited()
+
+    async def test_reject_implausible_without_index(self):
+        """색인이 없어도 도시 이름이 될 수 없는 입력은 upstream 조회 없이 not found"""
+        provider = self._provider(None)
+
+        with pytest.raises(OpenWeatherNotFoundError):
+            await provider.get(WeatherByCityQuery(city="<script>"))
+
+        provider.client.get_raw.assert_not_awaited()
@@ -1,10 +1,16 @@
+import asyncio
 import os
 import pytest
 import httpx
 from dotenv import load_dotenv
+from prometheus_client import REGISTRY
+from tenacity import wait_none
 from unittest.mock import AsyncMock, patch, MagicMock
+from domain.shared.deadline import deadline_scope
 from infrastructure.openweather.client import OpenWeatherClient
-from infrastructure.openweather.error import OpenWeatherClientError
+from infrastructure.openweather.error import OpenWeatherClientError, OpenWeatherCircuitOpenError, \
+    OpenWeatherDeadlineExceededError, OpenWeatherNotFoundError
+from infrastructure.openweather.settings import HttpClientSettings, CircuitBreakerSettings
 
 load_dotenv("client_api/.env.local")
 
@@ -85,3 +91,175 @@ class TestOpenWeatherClientRetry:
             assert mock_request.call_count == 1
 
         await client.close()
+
+
+@pytest.fixture
+async def local_server():
+    """keep-alive를 지원하는 최소한의 HTTP/1.1 서버"""
+    connections = []
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        connections.append(writer)
+        try:
+            while request := await reader.readuntil(b"\r\n\r\n"):
+                await asyncio.sleep(0.05)
+                body = b"" if request.startswith(b"HEAD") else b"{}"
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n" + body)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    host, port = server.sockets[0].getsockname()
+    yield f"http://{host}:{port}", connections
+    server.close()
+
+
+@pytest.mark.unit
+class TestOpenWeatherClientPool:
+    async def test_warm_up_connections_reused(self, local_server):
+        """미리 열어둔 connection을 재사용"""
+        host, connections = local_server
+        client = OpenWeatherClient(api_key="test_key", host=host, http=HttpClientSettings(max_keepalive_connections=3))
+
+        assert await client.warm_up(3) == 3
+        await asyncio.gather(*[client.get("/test") for _ in range(3)])
+
+        assert len(connections) == 3
+        assert client.pool_stats.requests == 3
+        assert client.pool_stats.reused_connections == 3
+        assert client.pool_stats.new_connections == 0
+        await client.close()
+
+    async def test_pool_wait(self, local_server):
+        """connection이 부족하면 pool에서 대기한 시간 기록"""
+        host, connections = local_server
+        client = OpenWeatherClient(api_key="test_key", host=host, http=HttpClientSettings(max_connections=1))
+
+        await asyncio.gather(*[client.get("/test") for _ in range(3)])
+
+        assert len(connections) == 1
+        assert client.pool_stats.new_connections == 1
+        assert client.pool_stats.reused_connections == 2
+        assert client.pool_stats.max_pool_wait_seconds >= 0.1
+        await client.close()
+
+
+def _timeout_transport(calls: list[httpx.Request]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        raise httpx.ReadTimeout("timeout", request=request)
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.unit
+class TestOpenWeatherClientCircuitBreaker:
+    async def test_fail_fast_when_open(self):
+        """연속 timeout으로 열린 후에는 upstream을 호출하지 않음"""
+        calls = []
+        client = OpenWeatherClient(
+            api_key="test_key",
+            host="https://api.openweathermap.org",
+            transport=_timeout_transport(calls),
+            circuit_breaker=CircuitBreakerSettings(consecutive_timeouts=2),
+        )
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            with pytest.raises(OpenWeatherClientError):
+                await client.get("/data/2.5/weather")
+            with pytest.raises(OpenWeatherCircuitOpenError):
+                await client.get("/data/2.5/weather")
+
+        assert len(calls) == 2
+        breaker, = client.circuit_breakers.breakers()
+        assert breaker.name == "https://api.openweathermap.org/data/2.5/weather"
+        assert breaker.stats.opened == 1
+        await client.close()
+
+
+@pytest.mark.unit
+class TestOpenWeatherClientDeadline:
+    async def test_retry_stops_before_deadline(self):
+        """남은 시간에 다음 시도가 들어가지 않으면 재시도 중단"""
+        calls = []
+        client = OpenWeatherClient(
+            api_key="test_key",
+            host="https://api.openweathermap.org",
+            transport=_timeout_transport(calls),
+            http=HttpClientSettings(min_attempt_time=0.5),
+        )
+
+        with deadline_scope(0.9):
+            with pytest.raises(OpenWeatherClientError) as exc_info:
+                await client.get("/test")
+
+        # 첫 재시도 대기(0.5초 이상) 후 남은 시간이 min_attempt_time보다 적음
+        assert len(calls) == 1
+        assert "retry:1" in str(exc_info.value)
+        await client.close()
+
+    async def test_deadline_exceeded(self):
+        calls = []
+        client = OpenWeatherClient(api_key="test_key", host="https://api.openweathermap.org", transport=_timeout_transport(calls))
+
+        with deadline_scope(0):
+            with pytest.raises(OpenWeatherDeadlineExceededError):
+                await client.get("/test")
+
+        assert calls == []
+        await client.close()
+
+    async def test_capped_timeout_not_counted(self):
+        """deadline으로 줄어든 timeout은 circuit breaker에 기록하지 않음"""
+        calls = []
+        client = OpenWeatherClient(
+            api_key="test_key",
+            host="https://api.openweathermap.org",
+            transport=_timeout_transport(calls),
+            circuit_breaker=CircuitBreakerSettings(consecutive_timeouts=1),
+        )
+
+        with deadline_scope(0.2):
+            with pytest.raises(OpenWeatherClientError):
+                await client.get("/test")
+
+        breaker, = client.circuit_breakers.breakers()
+        assert breaker.stats.opened == 0
+        await client.close()
+
+
+@pytest.mark.unit
+class TestOpenWeatherClientMetrics:
+    @staticmethod
+    def _count(name: str, labels: dict) -> float:
+        return REGISTRY.get_sample_value(name, labels) or 0
+
+    async def test_status_and_retries(self):
+        """응답 status code, 재시도 횟수 기록"""
+        statuses = iter([503, 200, 404])
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(next(statuses), json={})
+
+        client = OpenWeatherClient(
+            api_key="test_key",
+            host="https://api.openweathermap.org",
+            transport=httpx.MockTransport(handler),
+        )
+        labels = {"endpoint": "/metrics-test"}
+        before = {
+            status: self._count("openweather_responses_total", {**labels, "status": status})
+            for status in ["503", "200", "404"]
+        }
+        retries = self._count("openweather_retries_total", labels)
+
+        with patch.object(OpenWeatherClient._request.retry, "wait", wait_none()):
+            await client.get("/metrics-test")
+            with pytest.raises(OpenWeatherNotFoundError):
+                await client.get("/metrics-test")
+
+        for status in ["503", "200", "404"]:
+            assert self._count("openweather_responses_total", {**labels, "status": status}) == before[status] + 1
+        assert self._count("openweather_retries_total", labels) == retries + 1
+        await client.close()
@@ -0,0 +1,97 @@
+import asyncio
+
+import httpx
+import pytest
+
+from infrastructure.openweather.client import OpenWeatherClient
+from infrastructure.openweather.hedge import HedgePolicy
+from infrastructure.openweather.settings import HedgeSettings
+
+
+def _client(delays: list[float], calls: list[str], **settings) -> OpenWeatherClient:
+    """
+    delays: 요청 순서별 응답 지연
+    """
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        index = len(calls)
+        calls.append(request.url.path)
+        await asyncio.sleep(delays[index])
+        return httpx.Response(200, json={"index": index})
+
+    return OpenWeatherClient(
+        api_key="test_key",
+        host="https://api.openweathermap.org",
+        transport=httpx.MockTransport(handler),
+        hedge=HedgeSettings(**{"enabled": True, "max_delay": 0.05, "budget_ratio": 1, **settings}),
+    )
+
+
+@pytest.mark.unit
+class TestHedgePolicy:
+    def test_delay_from_percentile(self):
+        policy = HedgePolicy(HedgeSettings(percentile=90, min_samples=100, min_delay=0.01, max_delay=1))
+        assert policy.delay == 1
+
+        for i in range(100):
+            policy.record_latency(i / 1000)
+
+        assert policy.delay == 0.09
+
+    def test_budget(self):
+        """요청 대비 budget_ratio 이상 hedge 요청을 보내지 않음"""
+        policy = HedgePolicy(HedgeSettings(budget_ratio=0.25, max_burst=2))
+
+        acquired = 0
+        for _ in range(100):
+            policy.start()
+            acquired += policy.acquire()
+
+        assert acquired == 25
+        assert policy.stats.budget_exhausted == 75
+
+
+@pytest.mark.unit
+class TestOpenWeatherClientHedge:
+    async def test_hedge_wins(self):
+        """응답이 늦으면 한 번 더 요청하고 먼저 온 응답 사용"""
+        calls = []
+        client = _client([1, 0.01], calls)
+
+        result = await client.get("/data/2.5/weather")
+
+        assert result == {"index": 1}
+        assert len(calls) == 2
+        assert (client.hedge.stats.hedged, client.hedge.stats.won) == (1, 1)
+        await client.close()
+
+    async def test_primary_wins(self):
+        calls = []
+        client = _client([0.1, 1], calls)
+
+        result = await client.get("/data/2.5/weather")
+
+        assert result == {"index": 0}
+        assert (client.hedge.stats.hedged, client.hedge.stats.won) == (1, 0)
+        await client.close()
+
+    async def test_fast_response_not_hedged(self):
+        calls = []
+        client = _client([0], calls)
+
+        await client.get("/data/2.5/weather")
+
+        assert len(calls) == 1
+        assert client.hedge.stats.hedged == 0
+        await client.close()
+
+    async def test_budget_exhausted(self):
+        calls = []
+        client = _client([0.1], calls, budget_ratio=0.05)
+
+        result = await client.get("/data/2.5/weather")
+
+        assert result == {"index": 0}
+        assert len(calls) == 1
+        assert client.hedge.stats.budget_exhausted == 1
+        await client.close()
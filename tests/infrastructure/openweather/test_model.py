@@ -0,0 +1,63 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from infrastructure.openweather.model import (
+    WeatherResponse,
+    GroupWeatherResponse,
+    parse_weather,
+    parse_group_weather,
+)
+
+PAYLOAD = {
+    "coord": {"lon": 126.97, "lat": 37.56},
+    "weather": [
+        {"id": 500, "main": "Rain", "description": "light rain", "icon": "10d"},
+        {"id": 701, "main": "Mist", "description": "mist", "icon": "50d"},
+    ],
+    "base": "stations",
+    "main": {"temp": 280.0, "feels_like": 278.0, "pressure": 1020, "humidity": 50, "temp_min": 279.0, "temp_max": 281.0},
+    "visibility": 10000,
+    "wind": {"speed": 1.5, "deg": 180},
+    "clouds": {"all": 100},
+    "rain": {"1h": 0.4},
+    "dt": 1700000000,
+    "sys": {"country": "KR", "sunrise": 1699999000, "sunset": 1700030000},
+    "timezone": 32400,
+    "id": 1835848,
+    "name": "Seoul",
+    "cod": 200,
+}
+
+
+@pytest.mark.unit
+class TestParseWeather:
+    def test_same_as_full_validation(self):
+        assert parse_weather(json.dumps(PAYLOAD).encode()) == WeatherResponse.model_validate(PAYLOAD).to_domain()
+
+    def test_skip_unused_fields(self):
+        """도메인 모델에 쓰지 않는 필드는 없거나 형식이 달라도 파싱"""
+        payload = {"id": 1, "name": "Seoul", "dt": 1700000000, "weather": [], "main": "unknown"}
+
+        weather = parse_weather(json.dumps(payload).encode())
+
+        assert weather.city == "Seoul"
+        assert weather.conditions == []
+
+    def test_missing_used_field(self):
+        payload = {key: value for key, value in PAYLOAD.items() if key != "name"}
+
+        with pytest.raises(ValidationError):
+            parse_weather(json.dumps(payload).encode())
+
+    def test_group(self):
+        cities = [
+            {**PAYLOAD, "id": 1, "name": "City1"},
+            {**PAYLOAD, "id": 2, "name": "City2"},
+        ]
+        payload = {"cnt": 2, "list": cities}
+
+        assert parse_group_weather(json.dumps(payload).encode()) == {
+            it.id: it.to_domain() for it in GroupWeatherResponse.model_validate(payload).list
+        }
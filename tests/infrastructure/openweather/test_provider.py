@@ -0,0 +1,132 @@
+import asyncio
+
+import httpx
+import pytest
+
+from domain.weather.data.model import Weather
+from domain.weather.data.query import WeatherByCityQuery, WeatherByCoordQuery
+from infrastructure.openweather.city_index import CityIndex
+from infrastructure.openweather.client import OpenWeatherClient
+from infrastructure.openweather.error import OpenWeatherNotFoundError
+from infrastructure.openweather.provider import OpenWeatherProvider
+
+
+def _city(city_id: int, name: str) -> dict:
+    return {
+        "coord": {"lon": 126.97, "lat": 37.56},
+        "weather": [{"id": 800, "main": "Clear", "description": "clear sky", "icon": "01d"}],
+        "main": {"temp": 280.0, "feels_like": 278.0, "pressure": 1020, "humidity": 50, "temp_min": 279.0, "temp_max": 281.0},
+        "visibility": 10000,
+        "wind": {"speed": 1.5, "deg": 180},
+        "clouds": {"all": 0},
+        "dt": 1700000000,
+        "sys": {"country": "KR", "timezone": 32400, "sunrise": 1699999000, "sunset": 1700030000},
+        "id": city_id,
+        "name": name,
+    }
+
+
+@pytest.fixture
+def requests() -> list[httpx.Request]:
+    return []
+
+
+@pytest.fixture
+def strict() -> bool:
+    return False
+
+
+@pytest.fixture
+def provider(tmp_path, requests, strict):
+    path = tmp_path / "city_index.bin"
+    CityIndex.build([{"id": i, "name": f"City{i}", "country": "KR"} for i in range(1, 46)], path)
+    city_index = CityIndex(path)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path == "/data/2.5/group":
+            # 45번 도시는 응답에 없음
+            ids = [int(it) for it in request.url.params["id"].split(",") if it != "45"]
+            return httpx.Response(200, json={"cnt": len(ids), "list": [_city(i, f"City{i}") for i in ids]})
+        return httpx.Response(200, json={
+            **_city(0, request.url.params.get("q", "Jung-gu")), "base": "stations", "timezone": 0, "cod": 200,
+        })
+
+    client = OpenWeatherClient(api_key="test_key", host="https://api.openweathermap.org", transport=httpx.MockTransport(handler))
+    yield OpenWeatherProvider(client, city_index=city_index, strict=strict)
+    city_index.close()
+
+
+@pytest.mark.unit
+class TestOpenWeatherProviderGetMany:
+    async def test_group_chunks(self, provider, requests):
+        """도시 ID로 정해지는 도시는 GROUP_MAX_SIZE개씩 group으로 조회"""
+        queries = [WeatherByCityQuery(city=f"City{i}") for i in range(1, 45)]
+
+        results = await provider.get_many(queries)
+
+        assert [it.city for it in results] == [f"City{i}" for i in range(1, 45)]
+        assert [len(it.url.params["id"].split(",")) for it in requests] == [20, 20, 4]
+
+    async def test_mixed(self, provider, requests):
+        """색인에 없는 이름은 도시마다 조회, 같은 도시는 한 번만 조회, 도시별 실패는 해당 도시만"""
+        queries = [WeatherByCityQuery(city=it) for it in ["City1", "Atlantis", "city1,kr", "<script>", "City45"]]
+
+        results = await provider.get_many(queries)
+
+        assert [it.city for it in results if isinstance(it, Weather)] == ["City1", "Atlantis", "City1"]
+        assert isinstance(results[3], OpenWeatherNotFoundError)
+        assert isinstance(results[4], OpenWeatherNotFoundError)
+        assert sorted(it.url.path for it in requests) == ["/data/2.5/group", "/data/2.5/weather"]
+        assert requests[0].url.params["id"] in ("1,45", "45,1")
+
+    async def test_single_concurrency(self, provider):
+        """색인에 없는 이름을 도시마다 조회할 때 동시 조회 수 제한"""
+        running = peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return httpx.Response(200, json={**_city(0, request.url.params["q"]), "base": "stations", "timezone": 0, "cod": 200})
+
+        client = OpenWeatherClient(api_key="test_key", host="https://api.openweathermap.org", transport=httpx.MockTransport(handler))
+        provider = OpenWeatherProvider(client, city_index=provider.city_index, single_concurrency=5)
+
+        results = await provider.get_many([WeatherByCityQuery(city=f"Atlantis{i}") for i in range(30)])
+
+        assert all(isinstance(it, Weather) for it in results)
+        assert peak == 5
+
+    def test_supports_batch_only_with_city_index(self, provider):
+        """색인이 없으면 group으로 조회할 수 없으므로 batch 미지원"""
+        assert provider.supports_batch
+        assert not OpenWeatherProvider(provider.client).supports_batch
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("strict", [False, True])
+class TestOpenWeatherProviderParse:
+    async def test_get(self, provider):
+        """필요한 필드만 파싱해도 전체 검증과 같은 결과"""
+        weather = await provider.get(WeatherByCityQuery(city="Atlantis"))
+
+        assert weather == Weather(
+            city="Atlantis",
+            conditions=[Weather.Condition(condition="Clear", description="clear sky")],
+            dt=1700000000,
+            city_id=0,
+        )
+
+    async def test_get_many(self, provider):
+        results = await provider.get_many([WeatherByCityQuery(city="City1"), WeatherByCityQuery(city="City2")])
+
+        assert [it.city for it in results] == ["City1", "City2"]
+
+    async def test_get_by_coord(self, provider, requests):
+        weather = await provider.get_by_coord(WeatherByCoordQuery(lat=37.575, lon=126.975))
+
+        assert weather.city == "Jung-gu"
+        assert (requests[0].url.params["lat"], requests[0].url.params["lon"]) == ("37.575", "126.975")
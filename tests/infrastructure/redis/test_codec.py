@@ -0,0 +1,89 @@
+import json
+
+import pytest
+
+from domain.weather.data.model import Weather, WeatherNotFound
+from infrastructure.redis.codec import BinaryWeatherCodec, JsonWeatherCodec
+
+
+def _weather(**kwargs) -> Weather:
+    return Weather(
+        city="Seoul",
+        conditions=[
+            Weather.Condition(condition="Clear", description="clear sky"),
+            Weather.Condition(condition="Rain", description="light rain"),
+        ],
+        **kwargs,
+    )
+
+
+@pytest.mark.unit
+class TestWeatherCodec:
+    @pytest.mark.parametrize("codec", [JsonWeatherCodec(), BinaryWeatherCodec()])
+    @pytest.mark.parametrize("value", [
+        _weather(),
+        _weather(stale_at=1700000000.5, expires_at=1700003600.5),
+        _weather(dt=1699999800, stale_at=1700000000.5),
+        _weather(dt=1699999800, city_id=1835848),
+        WeatherNotFound(city="Atlantis", expires_at=1700000060.0),
+    ])
+    def test_round_trip(self, codec, value):
+        """인코딩한 값을 그대로 복원"""
+        assert codec.decode(codec.encode(value)) == value
+
+    def test_binary_reads_legacy_json(self):
+        """binary codec으로 변경 후에도 이전에 json으로 저장된 값 조회 가능"""
+        legacy = json.dumps({
+            "city": "Seoul",
+            "conditions": [{"condition": "Clear", "description": "clear sky"}],
+        }).encode()
+
+        weather = BinaryWeatherCodec().decode(legacy)
+
+        assert weather.city == "Seoul"
+        assert weather.stale_at is None
+
+    def test_json_reads_binary(self):
+        """json codec으로 되돌려도 binary로 저장된 값 조회 가능"""
+        value = _weather(stale_at=1.0)
+
+        assert JsonWeatherCodec().decode(BinaryWeatherCodec().encode(value)) == value
+
+    def test_binary_reads_v1(self):
+        """dt가 없는 v1 값 조회 가능"""
+        v1 = BinaryWeatherCodec._HEADER_V1.pack(1, 0, 1700000000.5, 1700003600.5) + b"\x05\x00Seoul\x01\x0d\x32"
+
+        weather = BinaryWeatherCodec().decode(v1)
+
+        assert weather == Weather(
+            city="Seoul",
+            conditions=[Weather.Condition(condition="Clear", description="clear sky")],
+            stale_at=1700000000.5,
+            expires_at=1700003600.5,
+        )
+
+    def test_binary_reads_v2(self):
+        """city_id가 없는 v2 값 조회 가능"""
+        v2 = BinaryWeatherCodec._HEADER_V2.pack(2, 0, 1700000000.5, 1700003600.5, 1699999800) \
+            + b"\x05\x00Seoul\x01\x0d\x32"
+
+        weather = BinaryWeatherCodec().decode(v2)
+
+        assert weather.dt == 1699999800
+        assert weather.city_id is None
+
+    def test_binary_uninterned_strings(self):
+        """table에 없는 문자열은 그대로 저장"""
+        value = Weather(city="서울", conditions=[Weather.Condition(condition="Unknown", description="맑음")])
+        codec = BinaryWeatherCodec()
+
+        assert codec.decode(codec.encode(value)) == value
+
+    def test_binary_smaller_than_json(self):
+        value = _weather(stale_at=1700000000.5, expires_at=1700003600.5)
+
+        assert len(BinaryWeatherCodec().encode(value)) < len(JsonWeatherCodec().encode(value)) / 2
+
+    def test_unknown_version(self):
+        with pytest.raises(ValueError):
+            BinaryWeatherCodec().decode(b"\x7f")
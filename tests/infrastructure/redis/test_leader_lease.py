@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from infrastructure.redis.leader_lease import RedisLeaderLease
+
+
+@pytest.fixture
+async def redis():
+    client = FakeAsyncRedis(decode_responses=False)
+    yield client
+    await client.flushall()
+    await client.aclose()
+
+
+@pytest.mark.unit
+class TestRedisLeaderLease:
+    async def test_single_leader(self, redis):
+        """하나의 worker만 leader, leader는 갱신 가능"""
+        first = RedisLeaderLease(redis, "leader", ttl=1)
+        second = RedisLeaderLease(redis, "leader", ttl=1)
+
+        assert await first.acquire()
+        assert not await second.acquire()
+        assert await first.acquire()
+
+    async def test_release(self, redis):
+        first = RedisLeaderLease(redis, "leader", ttl=1)
+        second = RedisLeaderLease(redis, "leader", ttl=1)
+        await first.acquire()
+
+        await second.release()  # 다른 worker의 lease는 삭제하지 않음
+        assert not await second.acquire()
+
+        await first.release()
+        assert await second.acquire()
+
+    async def test_expired(self, redis):
+        """leader가 갱신하지 않으면 ttl 이후 다른 worker가 획득"""
+        first = RedisLeaderLease(redis, "leader", ttl=0.05)
+        second = RedisLeaderLease(redis, "leader", ttl=0.05)
+        await first.acquire()
+
+        await asyncio.sleep(0.1)
+
+        assert await second.acquire()
+        assert not await first.acquire()
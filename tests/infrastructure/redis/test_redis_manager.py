@@ -0,0 +1,71 @@
+import pytest
+from redis.asyncio import BlockingConnectionPool
+from redis.asyncio.cluster import RedisCluster
+
+from infrastructure.redis.redis_manager import create_redis_client, SentinelBlockingConnectionPool, RedisManager
+from infrastructure.redis.settings import RedisSettings, RedisMode
+
+
+@pytest.mark.unit
+class TestCreateRedisClient:
+    async def test_standalone_blocking_pool(self):
+        """standalone은 max_connections, pool_timeout이 적용된 BlockingConnectionPool 사용"""
+        client = create_redis_client(RedisSettings(
+            host="localhost",
+            max_connections=8,
+            pool_timeout=0.2,
+            socket_timeout=0.3,
+            socket_connect_timeout=0.4,
+            health_check_interval=15,
+            retry_attempts=2,
+        ))
+        pool = client.connection_pool
+
+        assert type(pool) is BlockingConnectionPool
+        assert pool.max_connections == 8
+        assert pool.timeout == 0.2
+        assert pool.connection_kwargs["socket_timeout"] == 0.3
+        assert pool.connection_kwargs["socket_connect_timeout"] == 0.4
+        assert pool.connection_kwargs["health_check_interval"] == 15
+        assert pool.connection_kwargs["retry"].get_retries() == 2
+        assert pool.connection_kwargs["decode_responses"] is False
+        await client.aclose()
+
+    async def test_sentinel_blocking_pool(self):
+        client = create_redis_client(RedisSettings(
+            mode=RedisMode.SENTINEL,
+            nodes=["10.0.0.1:26379", "10.0.0.2:26379"],
+            sentinel_service_name="cache",
+            max_connections=8,
+            pool_timeout=0.2,
+        ))
+        pool = client.connection_pool
+
+        assert type(pool) is SentinelBlockingConnectionPool
+        assert pool.service_name == "cache"
+        assert [(it.connection_pool.connection_kwargs["host"], it.connection_pool.connection_kwargs["port"])
+                for it in pool.sentinel_manager.sentinels] == [("10.0.0.1", 26379), ("10.0.0.2", 26379)]
+        assert pool.max_connections == 8
+        assert pool.timeout == 0.2
+        await client.aclose()
+
+    async def test_cluster(self):
+        client = create_redis_client(RedisSettings(
+            mode=RedisMode.CLUSTER,
+            nodes=["10.0.0.1:6379"],
+            max_connections=8,
+            socket_timeout=0.3,
+        ))
+
+        assert isinstance(client, RedisCluster)
+        assert client.nodes_manager.connection_kwargs["max_connections"] == 8
+        assert client.nodes_manager.connection_kwargs["socket_timeout"] == 0.3
+        await client.aclose()
+
+    def test_addresses(self):
+        assert RedisSettings(host="redis", port=6380).addresses == [("redis", 6380)]
+        assert RedisSettings(nodes=["a:1", "b:2"]).addresses == [("a", 1), ("b", 2)]
+
+    def test_get_client_before_connect(self):
+        with pytest.raises(RuntimeError):
+            RedisManager().get_client()
@@ -0,0 +1,303 @@
+import asyncio
+import time
+from dataclasses import replace
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from domain.weather.data.model import Weather, WeatherNotFound
+from domain.weather.data.query import WeatherByCityQuery, WeatherByCoordQuery, WeatherListByCitiesQuery
+from domain.weather.service import WeatherService
+from infrastructure.redis.settings import FetchLeaseSettings
+from infrastructure.redis.weather_cache_repository import RedisWeatherCacheRepository
+from tests.domain.weather.test_service import FakeWeatherProvider
+
+
+def _weather(city: str, city_id: int | None = None) -> Weather:
+    return Weather(city=city, conditions=[Weather.Condition(condition="Clear", description="clear sky")], city_id=city_id)
+
+
+@pytest.fixture
+async def redis():
+    client = FakeAsyncRedis(decode_responses=False)
+    yield client
+    await client.flushall()
+    await client.aclose()
+
+
+@pytest.fixture
+def fetch_lease():
+    return FetchLeaseSettings(enabled=True, ttl=1, poll_interval=0.01, wait_timeout=1)
+
+
+@pytest.fixture
+def repository(redis, fetch_lease):
+    return RedisWeatherCacheRepository(redis, fetch_lease=fetch_lease)
+
+
+@pytest.mark.unit
+class TestRedisWeatherCacheRepository:
+    async def test_not_found_round_trip(self, repository, redis):
+        """negative cache 항목은 WeatherNotFound로 조회되고 별도 ttl로 만료"""
+        await repository.save_weather_city(_weather("Seoul"), 600)
+        await repository.save_weather_city_not_found("Atlantis", 30)
+
+        single = await repository.get_weather_city(WeatherByCityQuery(city="atlantis"))
+        batch = await repository.get_weather_cities(WeatherListByCitiesQuery(cities=["Seoul", "Atlantis"]))
+
+        assert isinstance(single, WeatherNotFound)
+        assert single.city == "Atlantis"
+        assert [type(it) for it in batch] == [Weather, WeatherNotFound]
+        assert 0 < await redis.ttl("weather:city:atlantis") <= 30
+
+    async def test_save_weather_cities(self, repository, redis):
+        """여러 도시를 한 번에 저장하고 key별로 ttl 설정"""
+        await repository.save_weather_cities([_weather("Seoul"), _weather("Tokyo")], 600)
+
+        results = await repository.get_weather_cities(WeatherListByCitiesQuery(cities=["seoul", "tokyo"]))
+
+        assert [it.city for it in results] == ["Seoul", "Tokyo"]
+        assert all(it.expires_at for it in results)
+        assert 0 < await redis.ttl("weather:city:tokyo") <= 600
+
+    async def test_get_weather_cities_keeps_request_order(self, repository):
+        """요청 순서대로 반환, 없는 도시는 None"""
+        await repository.save_weather_city(_weather("Tokyo"), 600)
+
+        results = await repository.get_weather_cities(WeatherListByCitiesQuery(cities=["Seoul", "Tokyo"]))
+
+        assert results[0] is None
+        assert results[1].city == "Tokyo"
+
+    async def test_alias_shares_city_id_entry(self, repository, redis):
+        """city_id가 있으면 weather:id:{city_id} 하나에 저장하고, 요청한 이름과 upstream 이름 모두 같은 값 조회"""
+        await repository.save_weather_city(_weather("Seoul", city_id=1835848), 600, alias="Seoul,KR")
+
+        results = await repository.get_weather_cities(WeatherListByCitiesQuery(cities=["seoul,kr", " SEOUL ", "Tokyo"]))
+
+        assert [it and it.city_id for it in results] == [1835848, 1835848, None]
+        assert await redis.get("weather:alias:seoul,kr") == await redis.get("weather:alias:seoul") == b"1835848"
+        assert 600 < await redis.ttl("weather:alias:seoul,kr") <= RedisWeatherCacheRepository.CITY_ALIAS_TTL
+        assert 0 < await redis.ttl("weather:id:1835848") <= 600
+        assert not await redis.exists("weather:city:seoul", "weather:city:seoul,kr")
+
+    async def test_alias_save_replaces_negative_cache(self, repository):
+        """이름별 negative cache는 같은 이름으로 날씨를 저장하면 삭제"""
+        await repository.save_weather_city_not_found("Seoul,KR", 30)
+        assert isinstance(await repository.get_weather_city(WeatherByCityQuery(city="Seoul,KR")), WeatherNotFound)
+
+        await repository.save_weather_city(_weather("Seoul", city_id=1835848), 600, alias="Seoul,KR")
+
+        assert (await repository.get_weather_city(WeatherByCityQuery(city="Seoul,KR"))).city_id == 1835848
+
+    async def test_hash_tags(self, redis):
+        """cluster용 hash tag key에 저장하고 조회"""
+        repository = RedisWeatherCacheRepository(redis, hash_tags=True)
+        await repository.save_weather_cities([_weather("Seoul", city_id=1835848), _weather("Tokyo")], 600, ["Seoul,KR", None])
+        await repository.save_weather_city_not_found("Atlantis", 30)
+
+        results = await repository.get_weather_cities(WeatherListByCitiesQuery(cities=["seoul,kr", "Tokyo", "Atlantis"]))
+
+        assert [type(it) for it in results] == [Weather, Weather, WeatherNotFound]
+        assert sorted(await redis.keys("weather:*")) == [
+            b"weather:alias:{seoul,kr}", b"weather:alias:{seoul}",
+            b"weather:city:{atlantis}", b"weather:city:{tokyo}", b"weather:id:{1835848}",
+        ]
+
+    async def test_coord_round_trip(self, repository, redis):
+        """좌표 항목은 격자 key(weather:coord:{lat},{lon})로 도시와 별도 저장"""
+        cell = WeatherByCoordQuery(lat=37.5665, lon=126.978).quantize(0.05)
+
+        await repository.save_weather_coord(cell, _weather("Jung-gu"), 600)
+
+        weather = await repository.get_weather_coord(cell)
+        assert weather.city == "Jung-gu"
+        assert weather.expires_at is not None
+        assert await redis.exists("weather:coord:37.575,126.975")
+        assert await repository.get_weather_coord(WeatherByCoordQuery(lat=37.625, lon=126.975)) is None
+
+@pytest.mark.unit
+class TestRedisWeatherCacheRepositoryFetchLease:
+    async def test_lease_acquired_once(self, repository):
+        """lease는 하나의 프로세스만 획득"""
+        query = WeatherByCityQuery(city="Seoul")
+
+        token = await repository.acquire_fetch_lease(query)
+        other = await repository.acquire_fetch_lease(WeatherByCityQuery(city=" seoul"))
+
+        assert token
+        assert other is None
+
+    async def test_release_only_own_lease(self, repository, redis):
+        """다른 token으로는 lease를 해제하지 않음"""
+        query = WeatherByCityQuery(city="Seoul")
+        token = await repository.acquire_fetch_lease(query)
+
+        await repository.release_fetch_lease(query, "other-token")
+        assert await repository.acquire_fetch_lease(query) is None
+
+        await repository.release_fetch_lease(query, token)
+        assert await repository.acquire_fetch_lease(query)
+
+    async def test_lease_expires(self, repository, fetch_lease):
+        """lease holder가 해제하지 못해도 ttl 이후 다시 획득 가능"""
+        query = WeatherByCityQuery(city="Seoul")
+        await repository.acquire_fetch_lease(query)
+
+        await asyncio.sleep(fetch_lease.ttl + 0.1)
+
+        assert await repository.acquire_fetch_lease(query)
+
+    async def test_wait_returns_saved_weather(self, repository):
+        """lease holder가 저장한 값을 대기중인 프로세스가 읽음"""
+        query = WeatherByCityQuery(city="Seoul")
+        await repository.acquire_fetch_lease(query)
+
+        async def save_later():
+            await asyncio.sleep(0.05)
+            await repository.save_weather_city(_weather("Seoul"), 600)
+
+        weather, _ = await asyncio.gather(repository.wait_weather_city(query), save_later())
+
+        assert weather is not None
+        assert weather.city == "Seoul"
+
+    async def test_wait_returns_none_when_lease_released_without_value(self, repository):
+        """lease holder가 저장하지 못하고 종료되면 None"""
+        query = WeatherByCityQuery(city="Seoul")
+        token = await repository.acquire_fetch_lease(query)
+
+        async def release_later():
+            await asyncio.sleep(0.05)
+            await repository.release_fetch_lease(query, token)
+
+        weather, _ = await asyncio.gather(repository.wait_weather_city(query), release_later())
+
+        assert weather is None
+
+    async def test_lease_disabled(self, redis):
+        """lease를 사용하지 않으면 항상 획득 성공"""
+        repository = RedisWeatherCacheRepository(redis)
+        query = WeatherByCityQuery(city="Seoul")
+
+        assert await repository.acquire_fetch_lease(query) is not None
+        assert await repository.acquire_fetch_lease(query) is not None
+        assert await redis.keys("weather:lease:*") == []
+
+
+@pytest.mark.unit
+class TestWeatherServiceWithFetchLease:
+    async def test_multiple_workers_single_upstream_call(self, redis, fetch_lease):
+        """worker마다 single flight가 분리되어 있어도 upstream은 한 번만 호출"""
+        provider = FakeWeatherProvider()
+        provider.delay = 0.1
+        # worker마다 별도의 service (single flight 미공유)
+        services = [
+            WeatherService(
+                cache=RedisWeatherCacheRepository(redis, fetch_lease=fetch_lease),
+                weather_provider=provider,
+            )
+            for _ in range(5)
+        ]
+
+        results = await asyncio.gather(*[
+            service.get_weather_city(WeatherByCityQuery(city="Seoul")) for service in services
+        ])
+
+        assert all(result.city == "Seoul" for result in results)
+        assert provider.call_count == 1
+        assert await redis.keys("weather:lease:*") == []
+
+    async def test_worker_fetches_when_lease_holder_fails(self, redis, fetch_lease):
+        """lease holder가 조회에 실패하면 대기하던 worker가 직접 조회"""
+        failing_provider = FakeWeatherProvider()
+        failing_provider.delay = 0.05
+        failing_provider.error = RuntimeError("upstream error")
+        provider = FakeWeatherProvider()
+
+        holder = WeatherService(RedisWeatherCacheRepository(redis, fetch_lease=fetch_lease), failing_provider)
+        waiter = WeatherService(RedisWeatherCacheRepository(redis, fetch_lease=fetch_lease), provider)
+
+        async def wait_then_get():
+            await asyncio.sleep(0.01)
+            return await waiter.get_weather_city(WeatherByCityQuery(city="Seoul"))
+
+        holder_result, waiter_result = await asyncio.gather(
+            holder.get_weather_city(WeatherByCityQuery(city="Seoul")),
+            wait_then_get(),
+            return_exceptions=True,
+        )
+
+        assert isinstance(holder_result, RuntimeError)
+        assert waiter_result.city == "Seoul"
+        assert provider.call_count == 1
+
+
+class _CanonicalWeatherProvider(FakeWeatherProvider):
+    """
+    OpenWeather처럼 요청한 이름과 관계없이 도시 이름, city_id를 반환
+    """
+
+    async def get(self, query: WeatherByCityQuery) -> Weather:
+        await super().get(query)
+        return _weather("Seoul", city_id=1835848)
+
+
+@pytest.mark.unit
+class TestWeatherServiceWithCityAlias:
+    async def test_spelling_variants_share_entry(self, redis, fetch_lease):
+        """upstream 조회 후에는 같은 도시의 다른 표기도 캐시에서 조회"""
+        provider = _CanonicalWeatherProvider()
+        service = WeatherService(RedisWeatherCacheRepository(redis, fetch_lease=fetch_lease), provider)
+
+        await service.get_weather_city(WeatherByCityQuery(city="Seoul,KR"))
+        results = await service.get_weather_cities(WeatherListByCitiesQuery(cities=["seoul,kr", "Seoul", " SEOUL "]))
+
+        assert [it.weather.city_id for it in results] == [1835848, 1835848]
+        assert provider.call_count == 1
+        assert await redis.keys("weather:city:*") == []
+
+
+@pytest.mark.unit
+class TestRedisWeatherCacheRepositoryRendered:
+    @pytest.fixture
+    def repository(self, redis):
+        return RedisWeatherCacheRepository(redis, renderer=lambda weather: f'{{"city":"{weather.city}"}}'.encode())
+
+    async def test_rendered_saved_until_stale(self, repository, redis):
+        """응답 조각은 날씨와 함께 저장되고 soft ttl이 지나면 삭제"""
+        stale_at = time.time() + 30
+        await repository.save_weather_city(replace(_weather("Seoul"), dt=1700000000, stale_at=stale_at), 600)
+
+        rendered = await repository.get_rendered_weather_city(WeatherByCityQuery(city=" seoul"))
+
+        assert rendered.city == " seoul"
+        assert rendered.body == b'{"city":"Seoul"}'
+        assert rendered.stale_at == stale_at
+        assert rendered.dt == 1700000000
+        assert 0 < await redis.ttl("weather:rendered:city:seoul") <= 30
+        assert 30 < await redis.ttl("weather:city:seoul") <= 600
+
+    async def test_rendered_batch(self, repository):
+        await repository.save_weather_cities([_weather("Seoul"), _weather("Tokyo")], 600)
+
+        results = await repository.get_rendered_weather_cities(
+            WeatherListByCitiesQuery(cities=["Seoul", "London", "Tokyo"])
+        )
+
+        assert [it.city for it in results] == ["Seoul", "Tokyo"]
+
+    async def test_not_found_deletes_rendered(self, repository):
+        await repository.save_weather_city(_weather("Seoul"), 600)
+        await repository.save_weather_city_not_found("Seoul", 30)
+
+        assert await repository.get_rendered_weather_city(WeatherByCityQuery(city="Seoul")) is None
+
+    async def test_disabled_without_renderer(self, redis):
+        """renderer가 없으면 응답 조각을 저장, 조회하지 않음"""
+        repository = RedisWeatherCacheRepository(redis)
+        await repository.save_weather_city(_weather("Seoul"), 600)
+
+        assert await redis.exists("weather:rendered:city:seoul") == 0
+        assert await repository.get_rendered_weather_city(WeatherByCityQuery(city="Seoul")) is None
+        assert await repository.get_rendered_weather_cities(WeatherListByCitiesQuery(cities=["Seoul"])) == []
@@ -0,0 +1,27 @@
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from infrastructure.redis.weather_popularity_repository import RedisWeatherPopularityRepository
+
+
+@pytest.fixture
+async def redis():
+    client = FakeAsyncRedis(decode_responses=False)
+    yield client
+    await client.flushall()
+    await client.aclose()
+
+
+@pytest.mark.unit
+class TestRedisWeatherPopularityRepository:
+    async def test_top_and_decay(self, redis):
+        repository = RedisWeatherPopularityRepository(redis)
+        await repository.increment({"seoul": 3, "tokyo": 1})
+        await repository.increment({"tokyo": 5, "london": 2})
+
+        assert await repository.top(2) == ["tokyo", "seoul"]
+
+        await repository.decay(0.5, max_size=2)
+
+        assert await repository.top(10) == ["tokyo", "seoul"]
+        assert await redis.zscore(repository.POPULARITY_KEY, "tokyo") == 3